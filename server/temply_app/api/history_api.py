@@ -0,0 +1,103 @@
+"""History API"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
+
+from temply_app.core.dependency import get_history_service, get_user
+from temply_app.core.exceptions import GitRevisionNotFoundError, TemplateNotFoundError
+from temply_app.core.temply.git_temply_env import GitTemplyEnv
+from temply_app.core.utils import etag_util
+from temply_app.models.common_model import User
+from temply_app.services.history_service import HistoryService
+
+router = APIRouter()
+
+COMMIT_HEADER = "X-Temply-Commit"
+
+
+async def _get_temply_env(
+    response: Response,
+    history_service: HistoryService,
+    commit: Optional[str],
+    at: Optional[datetime],
+) -> GitTemplyEnv:
+    """커밋의 Temply 환경 조회 (응답 헤더에 실제 사용한 커밋 SHA 기록)"""
+    try:
+        temply_env = await history_service.get_temply_env(commit, at)
+    except GitRevisionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    response.headers[COMMIT_HEADER] = temply_env.tree.commit
+    return temply_env
+
+
+@router.get("/templates/{template}/schema", response_model=dict[str, Any])
+async def get_template_schema(
+    template: str,
+    request: Request,
+    response: Response,
+    commit: Optional[str] = Query(None, description="커밋 SHA (전체 또는 앞부분)"),
+    at: Optional[datetime] = Query(
+        None, description="시각 (ISO 8601 또는 Unix 시간, 해당 시각 이전의 마지막 커밋)"
+    ),
+    history_service: HistoryService = Depends(get_history_service),
+    user: User = Depends(get_user),
+) -> dict[str, Any] | Response:
+    """과거 커밋의 템플릿 스키마를 조회합니다."""
+    temply_env = await _get_temply_env(response, history_service, commit, at)
+    # 커밋의 내용은 변경되지 않으므로 커밋 SHA로 ETag 생성
+    etag = etag_util.make_etag(temply_env.tree.commit, request.url.path)
+    if etag_util.is_not_modified(request, etag):
+        not_modified = etag_util.not_modified_response(etag)
+        not_modified.headers[COMMIT_HEADER] = temply_env.tree.commit
+        return not_modified
+    etag_util.set_etag(response, etag)
+    try:
+        return await history_service.get_template_schema(temply_env, template)
+    except TemplateNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.post("/templates/{template}/render", response_model=dict[str, str])
+async def render_template(
+    template: str,
+    data: dict[str, Any],
+    response: Response,
+    commit: Optional[str] = Query(None, description="커밋 SHA (전체 또는 앞부분)"),
+    at: Optional[datetime] = Query(
+        None, description="시각 (ISO 8601 또는 Unix 시간, 해당 시각 이전의 마지막 커밋)"
+    ),
+    history_service: HistoryService = Depends(get_history_service),
+    user: User = Depends(get_user),
+) -> dict[str, str]:
+    """과거 커밋의 템플릿 컴포넌트를 모두 렌더링합니다."""
+    temply_env = await _get_temply_env(response, history_service, commit, at)
+    try:
+        return await history_service.render_template(temply_env, template, data)
+    except TemplateNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@router.post("/templates/{template}/components/{component}/render", response_model=str)
+async def render_template_component(
+    template: str,
+    component: str,
+    data: dict[str, Any],
+    response: Response,
+    commit: Optional[str] = Query(None, description="커밋 SHA (전체 또는 앞부분)"),
+    at: Optional[datetime] = Query(
+        None, description="시각 (ISO 8601 또는 Unix 시간, 해당 시각 이전의 마지막 커밋)"
+    ),
+    history_service: HistoryService = Depends(get_history_service),
+    user: User = Depends(get_user),
+) -> str:
+    """과거 커밋의 템플릿 컴포넌트를 렌더링합니다."""
+    temply_env = await _get_temply_env(response, history_service, commit, at)
+    try:
+        return await history_service.render_component(temply_env, template, component, data)
+    except TemplateNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
@@ -1,12 +1,22 @@
 """Layout API"""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import Response
 
-from temply_app.core.dependency import get_layout_service, get_template_service, get_user
-from temply_app.core.exceptions import LayoutAlreadyExistsError, LayoutNotFoundError
+from temply_app.core.dependency import (
+    get_index_etag,
+    get_layout_service,
+    get_template_service,
+    get_user,
+)
+from temply_app.core.exceptions import (
+    InvalidPageRequestError,
+    LayoutAlreadyExistsError,
+    LayoutNotFoundError,
+)
+from temply_app.core.utils import etag_util, page_util
 from temply_app.models.common_model import User
 from temply_app.models.layout_model import Layout, LayoutCreate, LayoutUpdate, LayoutUpdateResponse
 from temply_app.models.template_model import TemplateComponent
@@ -18,11 +28,29 @@ router = APIRouter()
 
 @router.get("", response_model=List[Layout])
 async def list_layouts(
+    request: Request,
+    response: Response,
+    etag: str = Depends(get_index_etag),
+    fields: Optional[str] = Query(None, description="조회할 필드 (쉼표 구분, 예: name,meta)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서"),
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기"),
     layout_service: LayoutService = Depends(get_layout_service),
     user: User = Depends(get_user),
-) -> List[Layout]:
-    """레이아웃 목록 조회"""
-    return await layout_service.list()
+) -> List[Layout] | Response:
+    """레이아웃 목록 조회
+
+    fields, cursor, limit 중 하나라도 지정하면 파서 인덱스에서 바로 응답합니다.
+    """
+    if etag_util.is_not_modified(request, etag):
+        return etag_util.not_modified_response(etag)
+    etag_util.set_etag(response, etag)
+    if fields is None and cursor is None and limit is None:
+        return await layout_service.list()
+    try:
+        page = page_util.page_response(*await layout_service.list_page(fields, cursor, limit))
+        return etag_util.set_etag(page, etag)
+    except InvalidPageRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.post("", response_model=Layout)
@@ -41,11 +69,17 @@ async def create_layout(
 @router.get("/{layout_name}", response_model=Layout)
 async def get_layout(
     layout_name: str,
+    request: Request,
+    response: Response,
     layout_service: LayoutService = Depends(get_layout_service),
     user: User = Depends(get_user),
-) -> Layout:
+) -> Layout | Response:
     """레이아웃 조회"""
     try:
+        etag = await layout_service.get_etag(layout_name)
+        if etag_util.is_not_modified(request, etag):
+            return etag_util.not_modified_response(etag)
+        etag_util.set_etag(response, etag)
         return await layout_service.get(layout_name)
     except LayoutNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -54,18 +88,37 @@ async def get_layout(
 @router.get("/{layout_name}/templates", response_model=List[TemplateComponent])
 async def get_layout_templates(
     layout_name: str,
+    request: Request,
+    response: Response,
+    etag: str = Depends(get_index_etag),
+    fields: Optional[str] = Query(None, description="조회할 필드 (쉼표 구분, 예: name,meta)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서"),
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기"),
     layout_service: LayoutService = Depends(get_layout_service),
     template_service: TemplateService = Depends(get_template_service),
     user: User = Depends(get_user),
-) -> List[TemplateComponent]:
+) -> List[TemplateComponent] | Response:
     """레이아웃 조회"""
     try:
+        # 삭제된 레이아웃에 304를 반환하지 않도록 존재 여부를 먼저 확인
         layout = await layout_service.get(layout_name)
         if layout is None:
             raise LayoutNotFoundError(f"Layout {layout_name} not found")
-        return await template_service.get_components_by_layout(layout_name)
+        if etag_util.is_not_modified(request, etag):
+            return etag_util.not_modified_response(etag)
+        etag_util.set_etag(response, etag)
+        if fields is None and cursor is None and limit is None:
+            return await template_service.get_components_by_layout(layout_name)
+        page = page_util.page_response(
+            *await template_service.get_components_page_by_layout(
+                layout_name, fields, cursor, limit
+            )
+        )
+        return etag_util.set_etag(page, etag)
     except LayoutNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
+    except InvalidPageRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.put("/{layout_name}", response_model=LayoutUpdateResponse)
@@ -1,16 +1,18 @@
 """Partial API"""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
 
-from temply_app.core.dependency import get_partial_service, get_user
+from temply_app.core.dependency import get_index_etag, get_partial_service, get_user
 from temply_app.core.exceptions import (
+    InvalidPageRequestError,
     PartialAlreadyExistsError,
     PartialCircularDependencyError,
     PartialNotFoundError,
 )
+from temply_app.core.utils import etag_util, page_util
 from temply_app.models.common_model import User
 from temply_app.models.partial_model import Partial, PartialCreate, PartialUpdate
 from temply_app.services.partial_service import PartialService
@@ -20,28 +22,54 @@ router = APIRouter()
 
 @router.get("", response_model=List[Partial])
 async def list_partials(
+    request: Request,
+    response: Response,
     is_root: bool = False,
+    fields: Optional[str] = Query(None, description="조회할 필드 (쉼표 구분, 예: name,meta)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서"),
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기"),
     partial_service: PartialService = Depends(get_partial_service),
+    etag: str = Depends(get_index_etag),
     user: User = Depends(get_user),
-) -> List[Partial]:
+) -> List[Partial] | Response:
     """파셜 목록을 조회합니다.
 
     Args:
         is_root: 루트 파셜만 조회할지 여부
+        fields: 조회할 필드 (지정하면 파서 인덱스에서 바로 응답)
+        cursor: 다음 페이지 커서
+        limit: 페이지 크기
     """
+    if etag_util.is_not_modified(request, etag):
+        return etag_util.not_modified_response(etag)
+    etag_util.set_etag(response, etag)
+    if fields is not None or cursor is not None or limit is not None:
+        try:
+            page = page_util.page_response(
+                *await partial_service.list_page(fields, cursor, limit, is_root)
+            )
+            return etag_util.set_etag(page, etag)
+        except InvalidPageRequestError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
     if is_root:
         return await partial_service.get_root()
     return await partial_service.list()
 
 
-@router.get("/{partial}")
+@router.get("/{partial}", response_model=Partial)
 async def get_partial(
     partial: str,
+    request: Request,
+    response: Response,
     partial_service: PartialService = Depends(get_partial_service),
     user: User = Depends(get_user),
-) -> Partial:
+) -> Partial | Response:
     """파셜 정보를 조회합니다."""
     try:
+        etag = await partial_service.get_etag(partial)
+        if etag_util.is_not_modified(request, etag):
+            return etag_util.not_modified_response(etag)
+        etag_util.set_etag(response, etag)
         return await partial_service.get(partial)
     except PartialNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -95,10 +123,16 @@ async def delete_partial(
 @router.get("/{partial}/children", response_model=List[Partial])
 async def get_child_partials(
     partial: str,
+    request: Request,
+    response: Response,
+    etag: str = Depends(get_index_etag),
     partial_service: PartialService = Depends(get_partial_service),
     user: User = Depends(get_user),
-) -> List[Partial]:
+) -> List[Partial] | Response:
     """자식 파셜 목록을 조회합니다."""
+    if etag_util.is_not_modified(request, etag):
+        return etag_util.not_modified_response(etag)
+    etag_util.set_etag(response, etag)
     try:
         return await partial_service.get_children(partial)
     except PartialNotFoundError as e:
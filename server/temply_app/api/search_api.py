@@ -0,0 +1,42 @@
+"""Search API"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
+
+from temply_app.core.dependency import get_index_etag, get_search_service, get_user
+from temply_app.core.search_index import SearchKind
+from temply_app.core.utils import etag_util
+from temply_app.models.common_model import User
+from temply_app.models.search_model import SearchResult
+from temply_app.services.search_service import SearchService
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[SearchResult])
+async def search(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, description="검색어"),
+    kinds: Optional[str] = Query(
+        None, description="검색할 종류 (쉼표 구분, 예: layout,partial,component)"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="최대 결과 수"),
+    etag: str = Depends(get_index_etag),
+    search_service: SearchService = Depends(get_search_service),
+    user: User = Depends(get_user),
+) -> List[SearchResult] | Response:
+    """레이아웃/파셜/템플릿 컴포넌트의 이름, 설명, 내용을 검색합니다."""
+    if etag_util.is_not_modified(request, etag):
+        return etag_util.not_modified_response(etag)
+    etag_util.set_etag(response, etag)
+
+    search_kinds = None
+    if kinds:
+        try:
+            search_kinds = {SearchKind(kind.strip()) for kind in kinds.split(",") if kind.strip()}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid kinds: {kinds}") from e
+    return await search_service.search(q, search_kinds, limit)
@@ -1,12 +1,14 @@
 """System API"""
 
-from typing import List
+from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends
 
 from temply_app.core.config import Config
 from temply_app.core.dependency import get_config
 from temply_app.core.temply.temply_env import TemplateComponents
+from temply_app.core.utils.cache_util import get_cache_metrics
+from temply_app.core.version_refresher import get_version_refresher
 
 router = APIRouter()
 
@@ -23,3 +25,14 @@ async def get_git_status(
 async def list_template_item_types() -> List[str]:
     """템플릿 아이템 타입 목록을 조회합니다."""
     return [item_type.value for item_type in TemplateComponents]
+
+
+@router.get("/metrics", response_model=Dict[str, Any])
+async def get_metrics(
+    config: Config = Depends(get_config),
+) -> Dict[str, Any]:
+    """캐시별 통계 (항목 수, 비용, 적중/미스/제거/만료 횟수, 단일 로드 합류 횟수)와 버전 갱신 상태"""
+    return {
+        "caches": get_cache_metrics(config),
+        "version_refresher": get_version_refresher(config).get_status(),
+    }
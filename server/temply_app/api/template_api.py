@@ -1,12 +1,17 @@
 """Template API"""
 
-from typing import Any, List
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
 
-from temply_app.core.dependency import get_template_service, get_user
-from temply_app.core.exceptions import TemplateAlreadyExistsError, TemplateNotFoundError
+from temply_app.core.dependency import get_index_etag, get_template_service, get_user
+from temply_app.core.exceptions import (
+    InvalidPageRequestError,
+    TemplateAlreadyExistsError,
+    TemplateNotFoundError,
+)
+from temply_app.core.utils import etag_util, page_util
 from temply_app.models.common_model import User
 from temply_app.models.template_model import (
     TemplateComponent,
@@ -60,30 +65,62 @@ async def create_template(
 @router.get("/{template}/components", response_model=List[TemplateComponent])
 async def list_templates_by_category(
     template: str,
+    request: Request,
+    response: Response,
+    etag: str = Depends(get_index_etag),
+    fields: Optional[str] = Query(None, description="조회할 필드 (쉼표 구분, 예: name,meta)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서"),
+    limit: Optional[int] = Query(None, ge=1, description="페이지 크기"),
     template_service: TemplateService = Depends(get_template_service),
     user: User = Depends(get_user),
-) -> List[TemplateComponent]:
-    """특정 카테고리의 템플릿 목록을 조회합니다."""
-    return await template_service.get_components_by_template(template)
+) -> List[TemplateComponent] | Response:
+    """특정 카테고리의 템플릿 목록을 조회합니다.
+
+    fields, cursor, limit 중 하나라도 지정하면 파서 인덱스에서 바로 응답합니다.
+    """
+    if etag_util.is_not_modified(request, etag):
+        return etag_util.not_modified_response(etag)
+    etag_util.set_etag(response, etag)
+    if fields is None and cursor is None and limit is None:
+        return await template_service.get_components_by_template(template)
+    try:
+        page = page_util.page_response(
+            *await template_service.get_components_page_by_template(template, fields, cursor, limit)
+        )
+        return etag_util.set_etag(page, etag)
+    except InvalidPageRequestError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.get("/{template}/schema", response_model=dict[str, Any])
 async def get_template_schema(
     template: str,
+    request: Request,
+    response: Response,
+    etag: str = Depends(get_index_etag),
     template_service: TemplateService = Depends(get_template_service),
     user: User = Depends(get_user),
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     """특정 카테고리의 스키마를 조회합니다."""
+    if etag_util.is_not_modified(request, etag):
+        return etag_util.not_modified_response(etag)
+    etag_util.set_etag(response, etag)
     return await template_service.get_schema_by_template(template)
 
 
 @router.get("/{template}/variables", response_model=dict[str, Any])
 async def get_template_variables(
     template: str,
+    request: Request,
+    response: Response,
+    etag: str = Depends(get_index_etag),
     template_service: TemplateService = Depends(get_template_service),
     user: User = Depends(get_user),
-) -> dict[str, Any]:
+) -> dict[str, Any] | Response:
     """특정 카테고리의 변수를 조회합니다."""
+    if etag_util.is_not_modified(request, etag):
+        return etag_util.not_modified_response(etag)
+    etag_util.set_etag(response, etag)
     return await template_service.get_variables_by_template(template)
 
 
@@ -91,11 +128,17 @@ async def get_template_variables(
 async def get_template_component(
     template: str,
     component: str,
+    request: Request,
+    response: Response,
     template_service: TemplateService = Depends(get_template_service),
     user: User = Depends(get_user),
-) -> TemplateComponent:
+) -> TemplateComponent | Response:
     """특정 카테고리의 특정 타입 템플릿 목록을 조회합니다."""
     try:
+        etag = await template_service.get_component_etag(template, component)
+        if etag_util.is_not_modified(request, etag):
+            return etag_util.not_modified_response(etag)
+        etag_util.set_etag(response, etag)
         return await template_service.get_component(template, component)
     except TemplateNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -1,8 +1,9 @@
 """Template Name API"""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
-from temply_app.core.dependency import get_template_service, get_user
+from temply_app.core.dependency import get_index_etag, get_template_service, get_user
+from temply_app.core.utils import etag_util
 from temply_app.models.common_model import User
 from temply_app.services.template_service import TemplateService
 
@@ -11,8 +12,14 @@ router = APIRouter()
 
 @router.get("", response_model=dict[str, int])
 async def list_template_names(
+    request: Request,
+    response: Response,
+    etag: str = Depends(get_index_etag),
     template_service: TemplateService = Depends(get_template_service),
     user: User = Depends(get_user),
-) -> dict[str, int]:
+) -> dict[str, int] | Response:
     """Get template names with component counts"""
+    if etag_util.is_not_modified(request, etag):
+        return etag_util.not_modified_response(etag)
+    etag_util.set_etag(response, etag)
     return await template_service.get_template_component_counts()
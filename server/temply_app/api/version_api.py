@@ -2,46 +2,42 @@
 Version API
 """
 
+import asyncio
 import logging
 import os
-from shutil import copytree, rmtree
+from shutil import rmtree
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from temply_app.core.commit_queue import get_commit_queue
 from temply_app.core.config import Config
-from temply_app.core.dependency import get_config, get_version_info
+from temply_app.core.dependency import get_config, get_diff_service, get_version_info
+from temply_app.core.exceptions import GitCommandError
 from temply_app.core.git_env import GitEnv
+from temply_app.core.utils.file_util import SnapshotMode, snapshot_tree
 from temply_app.core.utils.git_util import GitUtil
-from temply_app.models.common_model import CreateVersionRequest, ReturnVersionInfo, VersionInfo
+from temply_app.core.version_gc import get_version_gc
+from temply_app.core.version_refresher import VersionRefresher, get_version_refresher
+from temply_app.models.common_model import (
+    CommitQueueStatus,
+    CreateVersionRequest,
+    ReturnVersionInfo,
+    VersionGCResult,
+    VersionInfo,
+)
+from temply_app.models.diff_model import RenderDiffReport, RenderDiffRequest, VersionDiff
+from temply_app.services.diff_service import DiffService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def _get_versions(git_env: GitEnv) -> List[ReturnVersionInfo]:
-    versions = []
-    for v in GitUtil.get_versions(git_env):
-        _git_env = GitEnv(git_env.config, v)
-        if not v.is_root and not os.path.exists(_git_env.version_path):
-            GitUtil.create_version(_git_env)
-        GitUtil.refresh_version(_git_env)
-        versions.append(ReturnVersionInfo(version=v.version, is_root=v.is_root))
-    if not versions:
-        raise HTTPException(status_code=404, detail="No versions found")
-    return versions
-
-
-def _get_versions_local(config: Config) -> List[ReturnVersionInfo]:
-    versions = []
-    for v in os.listdir(config.noti_temply_dir):
-        # Only include directories that don't start with a dot
-        item_path = os.path.join(config.noti_temply_dir, v)
-        if os.path.isdir(item_path) and not v.startswith("."):
-            versions.append(
-                ReturnVersionInfo(version=v, is_root=v == config.noti_temply_main_version_name)
-            )
-    return versions
+async def _get_cached_versions(version_refresher: VersionRefresher) -> List[ReturnVersionInfo]:
+    """캐시된 버전 목록 조회 (아직 한 번도 조회하지 않았으면 갱신)"""
+    if not version_refresher.is_loaded:
+        await version_refresher.refresh()
+    return version_refresher.get_versions()
 
 
 @router.get("", response_model=List[ReturnVersionInfo])
@@ -49,44 +45,56 @@ async def get_versions(config: Config = Depends(get_config)) -> List[ReturnVersi
     """
     Get all versions
     """
-    logger.info("Fetching all versions")
-    if config.is_git_used():
-        git_env: GitEnv = GitEnv(config, VersionInfo.root_version(config))
-        versions = _get_versions(git_env)
-    else:
-        versions = _get_versions_local(config)
-    logger.info("Found %d versions", len(versions))
+    versions = await _get_cached_versions(get_version_refresher(config))
+    if config.is_git_used() and not versions:
+        raise HTTPException(status_code=404, detail="No versions found")
+    logger.debug("Found %d versions", len(versions))
     return versions
 
 
+@router.post("/refresh", response_model=List[ReturnVersionInfo])
+async def refresh_versions(config: Config = Depends(get_config)) -> List[ReturnVersionInfo]:
+    """
+    Refresh versions (버전 목록 수동 갱신)
+    """
+    logger.info("Refreshing all versions")
+    try:
+        return await get_version_refresher(config).refresh()
+    except ValueError as e:
+        raise HTTPException(status_code=502, detail=str(e)) from e
+
+
+@router.post("/gc", response_model=VersionGCResult)
+async def collect_versions(config: Config = Depends(get_config)) -> VersionGCResult:
+    """
+    Evict idle version directories from disk (버전 디렉토리 디스크 정리)
+
+    정리된 버전은 다음 접근 시 원격 브랜치에서 다시 체크아웃합니다.
+    """
+    return VersionGCResult(**await get_version_gc(config).collect())
+
+
 @router.get("/{version}", response_model=ReturnVersionInfo)
 async def get_version_info_by_version(
     version_info: VersionInfo = Depends(get_version_info),
+    refresh: bool = Query(False, description="원격 브랜치(로컬: 디렉토리)를 다시 확인"),
     config: Config = Depends(get_config),
 ) -> ReturnVersionInfo:
     """
     Get version info
+
+    전체 버전 목록을 갱신하지 않고 해당 버전의 캐시, 디렉토리 또는 브랜치만 확인합니다.
     """
-    logger.info("Fetching info for version: %s", version_info.version)
-    if config.is_git_used():
-        try:
-            git_env: GitEnv = GitEnv(config, version_info)
-            return_version_info = next(
-                v for v in _get_versions(git_env) if v.version == version_info.version
-            )
-            logger.info("Found version info: %s", return_version_info)
-            return return_version_info
-        except StopIteration as exc:
-            logger.error("Version not found: %s", version_info.version)
-            raise HTTPException(
-                status_code=404, detail=f"Version {version_info.version} not found"
-            ) from exc
-    else:
-        return_version_info = next(
-            v for v in _get_versions_local(config) if v.version == version_info.version
+    try:
+        return_version_info = await get_version_refresher(config).lookup(
+            version_info.version, refresh=refresh
         )
-        logger.info("Found version info: %s", return_version_info)
-        return return_version_info
+    except GitCommandError as e:
+        raise HTTPException(status_code=502, detail=str(e)) from e
+    if return_version_info is None:
+        logger.error("Version not found: %s", version_info.version)
+        raise HTTPException(status_code=404, detail=f"Version {version_info.version} not found")
+    return return_version_info
 
 
 @router.post("", response_model=ReturnVersionInfo)
@@ -99,13 +107,15 @@ async def create_version(
     """
     # make version info
     version_info = VersionInfo(config=config, version=request.version)
+    head_sha = None
     if config.is_git_used():
         git_env: GitEnv = GitEnv(config, version_info)
         if version_info.is_root:
             raise HTTPException(status_code=400, detail="Cannot create main version")
 
         logger.info("Creating new version: %s", request.version)
-        GitUtil.create_version(git_env)
+        await GitUtil.create_version(git_env)
+        head_sha = await GitUtil.get_head_sha(git_env)
     else:
         if request.version == config.noti_temply_main_version_name:
             raise HTTPException(status_code=400, detail="Cannot create main version")
@@ -114,12 +124,20 @@ async def create_version(
         if os.path.exists(new_version_path):
             raise HTTPException(status_code=400, detail="Version already exists")
 
-        copytree(
+        # 파일은 메인 버전과 공유하고, 수정 시 파서가 새 파일로 교체
+        stats = await asyncio.to_thread(
+            snapshot_tree,
             os.path.join(config.noti_temply_dir, config.noti_temply_main_version_name),
             new_version_path,
+            SnapshotMode(config.version_snapshot_mode),
         )
+        logger.info("Created version %s from snapshot: %s", request.version, stats)
 
-    return ReturnVersionInfo(version=version_info.version, is_root=version_info.is_root)
+    return_version_info = ReturnVersionInfo(
+        version=version_info.version, is_root=version_info.is_root, head_sha=head_sha
+    )
+    get_version_refresher(config).set_version(return_version_info)
+    return return_version_info
 
 
 @router.delete("/{version}")
@@ -133,7 +151,8 @@ async def delete_version(
     logger.info("Attempting to delete version: %s", version_info.version)
     if config.is_git_used():
         git_env: GitEnv = GitEnv(config, version_info)
-        GitUtil.delete_version(git_env)
+        await get_commit_queue(config).discard(version_info.version)
+        await GitUtil.delete_version(git_env)
     else:
         if version_info.is_root:
             raise HTTPException(status_code=400, detail="Cannot delete main version")
@@ -141,3 +160,54 @@ async def delete_version(
         if not os.path.exists(version_path):
             raise HTTPException(status_code=400, detail="Version not found")
         rmtree(version_path)
+    get_version_refresher(config).remove_version(version_info.version)
+
+
+@router.get("/{version}/commits", response_model=CommitQueueStatus)
+async def get_commit_status(
+    version_info: VersionInfo = Depends(get_version_info),
+    config: Config = Depends(get_config),
+) -> CommitQueueStatus:
+    """
+    Get commit queue status of a version
+    """
+    return CommitQueueStatus(**get_commit_queue(config).get_status(version_info.version))
+
+
+@router.post("/{version}/commits/flush", response_model=CommitQueueStatus)
+async def flush_commits(
+    version_info: VersionInfo = Depends(get_version_info),
+    config: Config = Depends(get_config),
+) -> CommitQueueStatus:
+    """
+    Commit and push pending changes of a version immediately
+    """
+    status = CommitQueueStatus(**await get_commit_queue(config).flush(version_info.version))
+    if status.state == "conflict":
+        raise HTTPException(status_code=409, detail=status.last_error)
+    return status
+
+
+@router.get("/{version}/diff", response_model=VersionDiff)
+async def diff_version(
+    diff_service: DiffService = Depends(get_diff_service),
+) -> VersionDiff:
+    """
+    Compare a version with a base version (default: main)
+
+    변경/추가/삭제된 레이아웃, 파셜, 컴포넌트와 의존성으로 영향을 받는 컴포넌트를 조회합니다.
+    """
+    return await diff_service.diff()
+
+
+@router.post("/{version}/render-diff", response_model=RenderDiffReport)
+async def render_diff_version(
+    request: RenderDiffRequest,
+    diff_service: DiffService = Depends(get_diff_service),
+) -> RenderDiffReport:
+    """
+    Compare rendered output of all components with a base version (default: main)
+
+    두 버전의 모든 컴포넌트를 같은 데이터로 렌더링하여 결과가 달라진 컴포넌트를 조회합니다.
+    """
+    return await diff_service.render_diff(request.payloads)
@@ -0,0 +1,64 @@
+"""Webhook API"""
+
+import json
+import logging
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+
+from temply_app.core.config import Config
+from temply_app.core.dependency import get_config
+from temply_app.core.utils import webhook_util
+from temply_app.core.version_refresher import VersionRefresher, get_version_refresher
+from temply_app.models.common_model import WebhookResult
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+async def _refresh_version(version_refresher: VersionRefresher, version: str) -> None:
+    """push된 버전만 갱신 (응답 후 실행, 실패는 기록만 하고 다음 push나 주기적 갱신에서 다시 시도)"""
+    try:
+        await version_refresher.refresh_version(version)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error("Failed to refresh version %s from webhook: %s", version, e)
+
+
+@router.post("/github", response_model=WebhookResult)
+async def receive_github_webhook(
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    config: Config = Depends(get_config),
+) -> WebhookResult:
+    """
+    Receive GitHub push webhook (push된 브랜치의 버전만 갱신)
+
+    `X-Hub-Signature-256` 서명을 GITHUB_WEBHOOK_SECRET으로 검증합니다.
+    키가 없으면 git 사용 시에는 거부하고, 로컬 디렉토리 모드에서는 서명 없이 받습니다.
+    """
+    body = await request.body()
+    secret = config.github_webhook_secret
+    if secret:
+        signature = request.headers.get(webhook_util.SIGNATURE_HEADER)
+        if not webhook_util.verify_signature(secret, body, signature):
+            raise HTTPException(status_code=401, detail="Invalid webhook signature")
+    elif config.is_git_used():
+        raise HTTPException(status_code=403, detail="Webhook secret is not configured")
+
+    event = request.headers.get(webhook_util.EVENT_HEADER, "")
+    if event == "ping":
+        return WebhookResult(event=event, action="pong", version=None)
+    if event != "push":
+        return WebhookResult(event=event, action="ignored", version=None)
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid webhook payload") from e
+    version = webhook_util.get_push_branch(payload) if isinstance(payload, dict) else None
+    if version is None:
+        return WebhookResult(event=event, action="ignored", version=None)
+
+    logger.info("Push webhook for version %s", version)
+    background_tasks.add_task(_refresh_version, get_version_refresher(config), version)
+    response.status_code = 202
+    return WebhookResult(event=event, action="queued", version=version)
@@ -1,12 +1,17 @@
 """Apps"""
 
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from temply_app.core.commit_queue import get_commit_queue
 from temply_app.core.config import Config
+from temply_app.core.render_regression import shutdown_render_pool
+from temply_app.core.version_refresher import get_version_refresher
 from temply_app.router import set_router
 
 logger = logging.getLogger(__name__)
@@ -15,10 +20,28 @@ logging.basicConfig(level=logging.INFO)
 
 def create_app(config: Config) -> FastAPI:
     """Create App"""
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        # 버전 목록 백그라운드 갱신
+        version_refresher = get_version_refresher(config)
+        version_refresher.start()
+        # 커밋되지 않은 변경 복구와 실패한 커밋 큐 재시도
+        commit_queue = get_commit_queue(config)
+        commit_queue.start()
+        try:
+            yield
+        finally:
+            await version_refresher.stop()
+            # 대기 중인 커밋 push
+            await commit_queue.stop()
+            shutdown_render_pool()
+
     app = FastAPI(
         title="Noti Temply Admin",
         description="템플릿 관리 시스템",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     # CORS 설정
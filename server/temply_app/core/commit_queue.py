@@ -0,0 +1,334 @@
+"""
+버전별 커밋 큐
+
+레이아웃/파셜/템플릿 변경은 파일 저장 후 바로 응답하고, 변경 경로만 버전별 큐에 쌓습니다.
+백그라운드 작업이 일정 시간(debounce) 동안 모인 변경을 사용자별 커밋으로 묶어 한 번에 push하며,
+push 실패는 재시도하고 원격과의 병합 충돌은 상태로 보고합니다.
+큐는 메모리에만 있으므로, 주기적으로(시작 시 포함) worktree에서 커밋/push되지 않은 변경을 찾아
+다시 등록하고, 재시도 후에도 실패한 큐를 다시 시도합니다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from temply_app.core.config import Config
+from temply_app.core.exceptions import GitCommandError, GitConflictError
+from temply_app.core.git_env import GitEnv
+from temply_app.core.temply.parser.meta_model import JST
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.models.common_model import User, VersionInfo
+
+logger = logging.getLogger(__name__)
+
+# worktree에서 찾은 미커밋 변경의 작성자 (원래 작성자는 알 수 없음)
+RECOVERY_USER = User(name="system")
+RECOVERY_MESSAGE = "Recover uncommitted changes"
+
+
+class CommitQueueState(str, Enum):
+    """커밋 큐 상태"""
+
+    IDLE = "idle"
+    PENDING = "pending"  # 커밋 대기 중인 변경이 있음
+    PUSHING = "pushing"
+    CONFLICT = "conflict"  # 원격 변경과 충돌 (로컬 커밋은 유지, 수동 해결 필요)
+    FAILED = "failed"  # 재시도 후에도 실패 (다음 변경, flush 또는 복구 주기에 다시 시도)
+
+
+@dataclass(slots=True)
+class PendingChange:
+    """커밋 대기 중인 변경"""
+
+    user: User
+    message: str
+    paths: List[str]
+
+
+@dataclass
+class _VersionQueue:
+    """버전별 큐 상태"""
+
+    git_env: GitEnv
+    pending: List[PendingChange] = field(default_factory=list)
+    state: CommitQueueState = CommitQueueState.IDLE
+    unpushed: bool = False
+    first_enqueued_at: float = 0.0
+    last_enqueued_at: float = 0.0
+    commits: int = 0
+    pushes: int = 0
+    last_pushed_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    task: Optional[asyncio.Task] = None
+    flush_event: Optional[asyncio.Event] = None
+
+
+def _group_by_user(changes: List[PendingChange]) -> List[PendingChange]:
+    """연속된 같은 사용자의 변경을 하나의 커밋으로 묶음"""
+    groups: List[List[PendingChange]] = []
+    for change in changes:
+        if groups and groups[-1][0].user.name == change.user.name:
+            groups[-1].append(change)
+        else:
+            groups.append([change])
+
+    result = []
+    for group in groups:
+        paths = list(dict.fromkeys(path for change in group for path in change.paths))
+        if len(group) == 1:
+            message = group[0].message
+        else:
+            details = "\n".join(f"- {change.message}" for change in group)
+            message = f"{group[0].message} (+{len(group) - 1} more)\n\n{details}"
+        result.append(PendingChange(user=group[0].user, message=message, paths=paths))
+    return result
+
+
+class CommitQueue:
+    """버전별 커밋/push 큐"""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.recover_interval = config.git_commit_recover_interval_seconds
+        self.debounce = config.git_commit_debounce_seconds
+        self.max_delay = config.git_commit_max_delay_seconds
+        self.max_retries = config.git_push_max_retries
+        self.retry_backoff = config.git_push_retry_backoff_seconds
+        self._queues: Dict[str, _VersionQueue] = {}
+        self._recover_task: Optional[asyncio.Task] = None
+
+    def enqueue(self, git_env: GitEnv, user: User, message: str, paths: List[str]) -> None:
+        """변경 등록 (커밋/push는 백그라운드에서 실행)"""
+        queue = self._get_queue(git_env)
+        now = time.monotonic()
+        if not queue.pending:
+            queue.first_enqueued_at = now
+        queue.last_enqueued_at = now
+        queue.pending.append(PendingChange(user=user, message=message, paths=list(paths)))
+        if queue.state != CommitQueueState.CONFLICT:
+            queue.state = CommitQueueState.PENDING
+        self._ensure_worker(queue)
+
+    async def flush(self, version: str) -> Dict[str, Any]:
+        """대기 중인 변경을 즉시 커밋/push하고 상태 반환"""
+        queue = self._queues.get(version)
+        if queue is None:
+            return self.get_status(version)
+        if queue.pending or queue.unpushed:
+            task = self._ensure_worker(queue)
+            assert queue.flush_event is not None
+            queue.flush_event.set()
+            await asyncio.shield(task)
+        return self.get_status(version)
+
+    async def discard(self, version: str) -> None:
+        """버전 큐 제거 (버전 삭제 시 호출, 대기 중인 변경은 버림)"""
+        queue = self._queues.pop(version, None)
+        if queue is None:
+            return
+        task = queue.task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def recover(self) -> List[str]:
+        """worktree의 미커밋 변경/미push 커밋을 큐에 다시 등록하고 실패한 큐를 다시 시도
+
+        작업 중이거나 충돌 상태인 큐는 건드리지 않습니다.
+
+        Returns:
+            다시 등록하거나 재시도한 버전 목록
+        """
+        recovered = []
+        root_env = GitEnv(self.config, VersionInfo.root_version(self.config))
+        for version in sorted(GitUtil.get_local_versions(root_env)):
+            version_info = VersionInfo(self.config, version)
+            if version_info.is_root:
+                continue
+            queue = self._queues.get(version)
+            if queue is not None and queue.state == CommitQueueState.FAILED:
+                self._ensure_worker(queue)
+                recovered.append(version)
+                continue
+            if queue is not None and queue.state != CommitQueueState.IDLE:
+                continue
+
+            git_env = GitEnv(self.config, version_info)
+            paths, ahead = await GitUtil.get_unsynced_changes(git_env)
+            queue = self._queues.get(version)
+            if queue is not None and (queue.pending or queue.state != CommitQueueState.IDLE):
+                # 확인하는 동안 변경이 등록됨
+                continue
+            if not paths and not ahead:
+                continue
+            logger.info(
+                "Recovering %s: %d uncommitted paths, %d unpushed commits",
+                version,
+                len(paths),
+                ahead,
+            )
+            queue = self._get_queue(git_env)
+            if ahead:
+                queue.unpushed = True
+            if paths:
+                self.enqueue(git_env, RECOVERY_USER, RECOVERY_MESSAGE, paths)
+            else:
+                queue.state = CommitQueueState.PENDING
+                self._ensure_worker(queue)
+            recovered.append(version)
+        return recovered
+
+    def start(self) -> None:
+        """백그라운드 복구 시작 (git을 사용하지 않거나 주기가 0 이하이면 시작하지 않음)"""
+        if not self.config.is_git_used() or self.recover_interval <= 0:
+            return
+        task = self._recover_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+        self._recover_task = asyncio.create_task(self._run_recover())
+
+    async def _run_recover(self) -> None:
+        while True:
+            try:
+                await self.recover()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Failed to recover commit queues: %s", e)
+            await asyncio.sleep(self.recover_interval)
+
+    async def stop(self) -> None:
+        """백그라운드 복구를 중지하고 종료 전 모든 버전의 대기 중인 변경 처리"""
+        task, self._recover_task = self._recover_task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for version in list(self._queues):
+            try:
+                await self.flush(version)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Failed to flush commit queue for %s: %s", version, e)
+
+    def _get_queue(self, git_env: GitEnv) -> _VersionQueue:
+        version = git_env.version_info.version
+        queue = self._queues.get(version)
+        if queue is None:
+            queue = self._queues[version] = _VersionQueue(git_env=git_env)
+        return queue
+
+    def _ensure_worker(self, queue: _VersionQueue) -> asyncio.Task:
+        task = queue.task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            queue.flush_event = asyncio.Event()
+            task = queue.task = asyncio.create_task(self._run(queue))
+        return task
+
+    async def _wait_debounce(self, queue: _VersionQueue) -> None:
+        """마지막 변경 후 debounce 시간 동안 대기 (최대 max_delay, flush 시 즉시 종료)"""
+        assert queue.flush_event is not None
+        while not queue.flush_event.is_set():
+            now = time.monotonic()
+            deadline = min(
+                queue.last_enqueued_at + self.debounce, queue.first_enqueued_at + self.max_delay
+            )
+            remaining = deadline - now
+            if remaining <= 0:
+                return
+            try:
+                await asyncio.wait_for(queue.flush_event.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run(self, queue: _VersionQueue) -> None:
+        while queue.pending or queue.unpushed:
+            if queue.pending:
+                await self._wait_debounce(queue)
+            if not await self._commit(queue):
+                return
+            if queue.unpushed and not await self._push(queue):
+                return
+        queue.state = CommitQueueState.IDLE
+
+    async def _commit(self, queue: _VersionQueue) -> bool:
+        """대기 중인 변경을 사용자별 커밋으로 기록"""
+        batch, queue.pending = queue.pending, []
+        for index, change in enumerate(_group_by_user(batch)):
+            try:
+                committed = await GitUtil.commit_paths(
+                    queue.git_env, change.user, change.message, change.paths
+                )
+            except GitCommandError as e:
+                # 실패한 변경은 다음 시도를 위해 다시 대기열 앞에 둠
+                queue.pending = _group_by_user(batch)[index:] + queue.pending
+                queue.state = CommitQueueState.FAILED
+                queue.last_error = str(e)
+                logger.error("Failed to commit %s: %s", queue.git_env.version_info.version, e)
+                return False
+            if committed:
+                queue.commits += 1
+                queue.unpushed = True
+        return True
+
+    async def _push(self, queue: _VersionQueue) -> bool:
+        """원격에 push (실패 시 지수 백오프로 재시도)"""
+        version = queue.git_env.version_info.version
+        queue.state = CommitQueueState.PUSHING
+        for attempt in range(self.max_retries + 1):
+            try:
+                await GitUtil.push_version(queue.git_env)
+            except GitConflictError as e:
+                queue.state = CommitQueueState.CONFLICT
+                queue.last_error = str(e)
+                logger.error("Conflict while pushing %s: %s", version, e)
+                return False
+            except GitCommandError as e:
+                queue.last_error = str(e)
+                logger.warning("Failed to push %s (attempt %d): %s", version, attempt + 1, e)
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff * 2**attempt)
+                continue
+            queue.unpushed = False
+            queue.pushes += 1
+            queue.last_pushed_at = datetime.now(JST)
+            queue.last_error = None
+            queue.state = CommitQueueState.PENDING if queue.pending else CommitQueueState.IDLE
+            return True
+        queue.state = CommitQueueState.FAILED
+        return False
+
+    def get_status(self, version: str) -> Dict[str, Any]:
+        """버전별 큐 상태 반환"""
+        queue = self._queues.get(version)
+        if queue is None:
+            return {"version": version, "state": CommitQueueState.IDLE}
+        return {
+            "version": version,
+            "state": queue.state,
+            "pending_changes": len(queue.pending),
+            "pending_paths": sorted({path for change in queue.pending for path in change.paths}),
+            "unpushed": queue.unpushed,
+            "commits": queue.commits,
+            "pushes": queue.pushes,
+            "last_pushed_at": queue.last_pushed_at,
+            "last_error": queue.last_error,
+        }
+
+
+_commit_queue: Optional[CommitQueue] = None
+
+
+def get_commit_queue(config: Config) -> CommitQueue:
+    """Get Commit Queue"""
+    global _commit_queue  # pylint: disable=global-statement
+    if _commit_queue is None:
+        _commit_queue = CommitQueue(config)
+    return _commit_queue
@@ -27,6 +27,50 @@ class Config(BaseSettings):
     # "git@github.com:jy-linne-ai/noti-temply.git"
     noti_temply_dir: str = "noti-temply"
     noti_temply_main_version_name: str = "main"
+    # 로컬 모드 버전 생성 시 파일 공유 방식 (hardlink, reflink, copy)
+    version_snapshot_mode: str = "hardlink"
+    # 캐시된 버전 환경의 리비전(HEAD SHA 또는 파일 트리 해시) 확인 간격 (초)
+    version_env_validate_interval_seconds: float = 1
+
+    # git 실행 설정
+    git_command_timeout_seconds: float = 120  # git 명령별 시간 제한 (초)
+    git_max_concurrency: int = 4  # 동시에 실행할 수 있는 git 명령 수
+    git_bare_dir_name: str = ".bare"  # 버전 worktree가 공유하는 bare 저장소 디렉토리 이름
+    git_lock_dir_name: str = ".locks"  # 버전별 git 작업 락 파일 디렉토리 이름
+    git_lock_timeout_seconds: float = 600  # 버전별 git 작업 락 대기 시간 제한 (초)
+
+    # 커밋 큐 설정
+    git_commit_debounce_seconds: float = 2  # 마지막 변경 후 커밋까지 대기 시간 (초)
+    git_commit_max_delay_seconds: float = 30  # 변경이 계속될 때 커밋을 미룰 수 있는 최대 시간 (초)
+    git_push_max_retries: int = 3  # push 실패 시 재시도 횟수
+    git_push_retry_backoff_seconds: float = 1  # 재시도 대기 시간 (초, 시도마다 2배)
+    git_commit_recover_interval_seconds: float = 60  # 미커밋 변경 복구/실패 재시도 주기 (초)
+
+    # 캐시 설정
+    content_cache_max_bytes: int = 32 * 1024 * 1024  # 본문 캐시 최대 크기 (bytes)
+    git_object_cache_max_bytes: int = 16 * 1024 * 1024  # git blob 본문 캐시 최대 크기 (bytes)
+    git_object_cache_size: int = 1024  # blob별 파싱/컴파일 결과 캐시 항목 수
+    git_tree_cache_size: int = 32  # git 트리(파일 목록) 캐시 항목 수
+    git_env_cache_size: int = 16  # 커밋 SHA별 읽기 전용 Temply 환경 캐시 항목 수
+    version_env_cache_size: int = 10  # 버전별 Temply 환경(파서, 인덱스 포함) 캐시 항목 수
+    version_env_cache_max_bytes: int = 0  # 버전 환경 캐시 예산 (원본 파일 크기 합, 0이면 제한 없음)
+    version_env_cache_ttl_seconds: float = 0  # 버전 환경 캐시 만료 시간 (초, 0이면 만료 없음)
+
+    # 버전 간 렌더링 비교 설정
+    render_regression_max_workers: int = 0  # 렌더링 프로세스 수 (0이면 CPU 수)
+    render_regression_chunk_size: int = 32  # 작업 프로세스에 한 번에 넘길 컴포넌트 수
+    render_regression_bytecode_cache_size: int = 1024  # 작업 프로세스별 바이트코드 캐시 항목 수
+
+    # 버전 목록 갱신 설정
+    version_refresh_interval_seconds: float = 60  # 백그라운드 갱신 주기 (0 이하이면 사용 안 함)
+    github_webhook_secret: str = ""  # push webhook 서명 검증 키 (없으면 git 사용 시 webhook 거부)
+
+    # 버전 디렉토리 디스크 정리 설정 (git 사용 시, 정리된 버전은 다음 접근 시 다시 체크아웃)
+    version_gc_ttl_seconds: float = 0  # 마지막 접근 후 디스크에서 정리하기까지 시간 (0이면 안 함)
+    version_gc_max_bytes: int = 0  # 메인 외 버전 디렉토리 디스크 예산 (bytes, 0이면 제한 없음)
+    version_gc_min_idle_seconds: float = 600  # 최근 접근한 버전은 예산을 넘어도 정리하지 않음 (초)
+    version_access_dir_name: str = ".access"  # 버전별 마지막 접근 기록 디렉토리 이름
+    version_access_touch_interval_seconds: float = 60  # 접근 기록 파일 갱신 간격 (초)
 
     # Redis 설정
     redis_host: str = "localhost"
@@ -45,6 +89,15 @@ class Config(BaseSettings):
         """git 사용 여부"""
         return self.noti_temply_repo_url != ""
 
+    def is_version_gc_enabled(self) -> bool:
+        """버전 디렉토리 디스크 정리 사용 여부
+
+        로컬 버전은 다시 받을 원격 브랜치가 없으므로 git 사용 시에만 정리합니다.
+        """
+        return self.is_git_used() and (
+            self.version_gc_ttl_seconds > 0 or self.version_gc_max_bytes > 0
+        )
+
     @property
     def cors_origins_list(self) -> List[str]:
         """CORS origins 리스트"""
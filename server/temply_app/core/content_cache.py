@@ -0,0 +1,112 @@
+"""
+본문(content) 캐시
+
+파서 인덱스(nodes)는 메타데이터와 본문 위치/해시만 보관하고,
+본문은 필요할 때 파일에서 읽어 바이트 크기 제한이 있는 이 캐시에 보관합니다.
+캐시 키는 본문 해시이므로 여러 버전에서 동일한 본문은 한 번만 메모리에 올라갑니다.
+"""
+
+import hashlib
+import logging
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from temply_app.core.config import Config
+from temply_app.core.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def compute_content_hash(content: str) -> str:
+    """본문 해시 계산"""
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def locate_content(source: str, content: str) -> tuple[int, int]:
+    """원본 소스에서 본문 위치(start, end) 조회
+
+    본문이 원본의 연속된 부분 문자열이 아니면 (-1, -1)을 반환합니다.
+    """
+    if not content:
+        return 0, 0
+    start = source.rfind(content)
+    if start < 0:
+        return -1, -1
+    return start, start + len(content)
+
+
+class ContentCache:
+    """바이트 크기 기준 LRU 본문 캐시"""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._cache: LRUCache[str] = LRUCache(0, max_cost=max_bytes)
+
+    def get(self, content_hash: str) -> Optional[str]:
+        """캐시 조회"""
+        return self._cache.get(content_hash)
+
+    def __contains__(self, content_hash: str) -> bool:
+        return content_hash in self._cache
+
+    def set(self, content_hash: str, content: str) -> None:
+        """캐시 저장 (캐시보다 큰 본문은 필요할 때 파일에서 다시 읽으므로 저장하지 않음)"""
+        size = sys.getsizeof(content)
+        if size > self.max_bytes:
+            return
+        self._cache.set(content_hash, content, size)
+
+    def load(
+        self,
+        content_hash: str,
+        start: int,
+        end: int,
+        read_source: Callable[[], str],
+        split_content: Callable[[str], str],
+    ) -> str:
+        """본문 조회 (캐시에 없으면 원본 파일에서 읽음)
+
+        Args:
+            content_hash: 인덱스에 기록된 본문 해시
+            start: 원본 소스에서의 본문 시작 위치 (-1이면 위치 정보 없음)
+            end: 원본 소스에서의 본문 끝 위치
+            read_source: 원본 소스를 읽는 함수
+            split_content: 원본 소스에서 본문을 분리하는 함수
+        """
+        content = self.get(content_hash)
+        if content is not None:
+            return content
+
+        source = read_source()
+        content = source[start:end] if start >= 0 else split_content(source)
+        if compute_content_hash(content) != content_hash:
+            # 인덱스 생성 이후 파일이 외부에서 변경된 경우
+            logger.warning("Content hash mismatch, re-splitting source: %s", content_hash)
+            content = split_content(source)
+            content_hash = compute_content_hash(content)
+        self.set(content_hash, content)
+        return content
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        stats = self._cache.get_stats()
+        return {**stats, "bytes": stats["cost"], "max_bytes": self.max_bytes}
+
+
+_content_cache: Optional[ContentCache] = None
+_content_cache_lock = threading.Lock()
+
+
+def get_content_cache(config: Config) -> ContentCache:
+    """Get Content Cache"""
+    global _content_cache  # pylint: disable=global-statement
+    if _content_cache is None:
+        with _content_cache_lock:
+            if _content_cache is None:
+                _content_cache = ContentCache(config.content_cache_max_bytes)
+    return _content_cache
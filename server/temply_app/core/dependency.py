@@ -1,18 +1,28 @@
+import os
 import threading
 from typing import Optional
 
-from fastapi import Depends, Path
+from fastapi import Depends, HTTPException, Path, Query, Request
 
 from temply_app.core.config import Config
 from temply_app.core.git_env import GitEnv
 from temply_app.core.temply.temply_env import TemplyEnv
-from temply_app.core.utils.cache_util import get_temply_version_env
+from temply_app.core.temply_version_env import TemplyVersionEnv
+from temply_app.core.utils import etag_util
+from temply_app.core.utils.cache_util import get_validated_temply_version_env
+from temply_app.core.utils.git_util import GitUtil
 from temply_app.models.common_model import User, VersionInfo
+from temply_app.repositories.diff_repository import DiffRepository
+from temply_app.repositories.history_repository import HistoryRepository
 from temply_app.repositories.layout_repository import LayoutRepository
 from temply_app.repositories.partial_repository import PartialRepository
+from temply_app.repositories.search_repository import SearchRepository
 from temply_app.repositories.template_repository import TemplateRepository
+from temply_app.services.diff_service import DiffService
+from temply_app.services.history_service import HistoryService
 from temply_app.services.layout_service import LayoutService
 from temply_app.services.partial_service import PartialService
+from temply_app.services.search_service import SearchService
 from temply_app.services.template_service import TemplateService
 
 
@@ -57,12 +67,29 @@ def get_git_env(
     return GitEnv(config, version_info)
 
 
-def get_temply_env(
+async def _get_version_env(config: Config, version_info: VersionInfo) -> TemplyVersionEnv:
+    """버전 환경 조회 (디스크에서 정리된 버전은 원격 브랜치에서 다시 체크아웃)"""
+    if config.is_git_used():
+        git_env = GitEnv(config, version_info)
+        if not os.path.exists(git_env.version_path) and not await GitUtil.restore_version(git_env):
+            raise HTTPException(status_code=404, detail=f"Version {version_info.version} not found")
+    return await get_validated_temply_version_env(config, version_info)
+
+
+async def get_temply_env(
     config: Config = Depends(get_config),
     version_info: VersionInfo = Depends(get_version_info),
 ) -> TemplyEnv:
-    """Get Temply Env"""
-    return get_temply_version_env(config, version_info).get_temply_env()
+    """Get Temply Env (캐시된 환경의 리비전을 확인하고 변경분 반영)"""
+    return (await _get_version_env(config, version_info)).get_temply_env()
+
+
+def get_index_etag(
+    request: Request,
+    temply_env: TemplyEnv = Depends(get_temply_env),
+) -> str:
+    """Get Index ETag (목록/스키마 응답용, 버전 파일 트리 해시 기반)"""
+    return etag_util.make_etag(temply_env.get_tree_hash(), request.url.path, request.url.query)
 
 
 def get_layout_service(
@@ -90,3 +117,33 @@ def get_template_service(
 ):
     """Get Template Service"""
     return TemplateService(TemplateRepository(version_info, temply_env, git_env))
+
+
+def get_search_service(
+    version_info: VersionInfo = Depends(get_version_info),
+    temply_env: TemplyEnv = Depends(get_temply_env),
+) -> SearchService:
+    """Get Search Service"""
+    return SearchService(SearchRepository(version_info, temply_env))
+
+
+def get_history_service(
+    config: Config = Depends(get_config),
+    version_info: VersionInfo = Depends(get_version_info),
+) -> HistoryService:
+    """Get History Service (버전 디렉토리 없이 git 객체에서 조회)"""
+    return HistoryService(HistoryRepository(config, version_info))
+
+
+async def get_diff_service(
+    base: Optional[str] = Query(None, description="기준 버전 (기본값: 메인 버전)"),
+    config: Config = Depends(get_config),
+    version_info: VersionInfo = Depends(get_version_info),
+    temply_env: TemplyEnv = Depends(get_temply_env),
+) -> DiffService:
+    """Get Diff Service"""
+    base_version_info = VersionInfo(config, base or config.noti_temply_main_version_name)
+    base_env = (await _get_version_env(config, base_version_info)).get_temply_env()
+    return DiffService(
+        DiffRepository(config, base_version_info, base_env, version_info, temply_env)
+    )
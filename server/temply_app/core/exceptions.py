@@ -1,5 +1,10 @@
 """예외 클래스 모듈"""
 
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from temply_app.core.utils.git_runner import GitResult
+
 
 class LayoutNotFoundError(Exception):
     """레이아웃 관련 예외 클래스"""
@@ -41,3 +46,47 @@ class TemplateAlreadyExistsError(Exception):
     """템플릿 관련 예외 클래스"""
 
     pass
+
+
+class InvalidPageRequestError(Exception):
+    """목록 조회 요청(필드 선택, 커서) 관련 예외 클래스"""
+
+    pass
+
+
+class GitCommandError(ValueError):
+    """git 명령 실행 실패 예외 클래스"""
+
+    def __init__(self, message: str, result: Optional["GitResult"] = None) -> None:
+        super().__init__(message)
+        self.result = result
+
+
+class GitTimeoutError(GitCommandError):
+    """git 명령 시간 초과 예외 클래스"""
+
+    pass
+
+
+class GitLockTimeoutError(GitTimeoutError):
+    """버전 git 작업 락 대기 시간 초과 예외 클래스"""
+
+    pass
+
+
+class GitConflictError(GitCommandError):
+    """원격 브랜치와 병합 충돌 예외 클래스"""
+
+    pass
+
+
+class GitRevisionNotFoundError(GitCommandError):
+    """존재하지 않는 브랜치/커밋 예외 클래스"""
+
+    pass
+
+
+class ReadOnlyEnvError(ValueError):
+    """읽기 전용 환경(git 커밋 등)에 쓰기 요청 예외 클래스"""
+
+    pass
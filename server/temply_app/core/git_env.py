@@ -17,3 +17,5 @@ class GitEnv:
         self.version_info: VersionInfo = version_info
         self.efs_root_path = os.path.abspath(self.config.noti_temply_dir)
         self.version_path = f"{self.efs_root_path}/{self.version_info.version}"
+        # 모든 버전 worktree가 객체 저장소를 공유하는 bare 저장소
+        self.bare_path = f"{self.efs_root_path}/{self.config.git_bare_dir_name}"
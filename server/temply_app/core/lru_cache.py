@@ -1,114 +1,219 @@
 """
 Least Recently Used (LRU) Cache implementation
+
+항목 수(max_size), 비용 합계(max_cost, 예: 근사 바이트 크기), 만료 시간(ttl)으로 크기를 제한합니다.
+모든 조회/저장은 스레드 락 안에서 O(1)로 처리하며, 적중/미스/제거/만료 횟수를 통계로 제공합니다.
 """
 
+import asyncio
 import logging
+import threading
 import time
 from collections import OrderedDict
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
-
 T = TypeVar("T")
 
 
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    cost: int
+    expires_at: float  # 0이면 만료 없음
+
+
 class LRUCache(Generic[T]):
-    """LRU 캐시 클래스 - 최대 10개 항목 관리"""
+    """LRU 캐시 클래스
+
+    Args:
+        max_size: 최대 항목 수 (0 이하이면 제한 없음)
+        ttl: 항목 만료 시간 (초, 0 이하이면 만료 없음)
+        max_cost: 항목 비용 합계 제한 (0 이하이면 제한 없음)
+    """
 
-    def __init__(self, max_size: int = 10) -> None:
+    def __init__(self, max_size: int = 10, ttl: float = 0, max_cost: int = 0) -> None:
         """LRU 캐시 초기화"""
         self.max_size = max_size
-        self.cache: OrderedDict[str, T] = OrderedDict()
-        self.access_times: Dict[str, float] = {}
+        self.ttl = ttl
+        self.max_cost = max_cost
+        self._entries: OrderedDict[str, _Entry[T]] = OrderedDict()
+        self._cost = 0
+        self._lock = threading.Lock()
+        # 키별 진행 중인 로드 (이벤트 루프, Future)
+        self._loading: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._loads = 0
+        self._coalesced = 0
+        self._oversized = 0
+
+    def _is_expired(self, entry: _Entry[T], now: float) -> bool:
+        return 0 < entry.expires_at <= now
+
+    def _remove(self, key: str) -> Optional[_Entry[T]]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._cost -= entry.cost
+        return entry
 
     def get(self, key: str) -> Optional[T]:
-        """캐시에서 값 조회"""
-        if key in self.cache:
-            # 접근 시간 업데이트
-            self.access_times[key] = time.time()
-            # OrderedDict에서 맨 뒤로 이동 (최근 사용)
-            self.cache.move_to_end(key)
-            logger.debug(f"캐시 히트: {key}")
-            return self.cache[key]
-
-        logger.debug(f"캐시 미스: {key}")
-        return None
-
-    def set(self, key: str, value: T) -> None:
-        """캐시에 값 저장"""
-        # 캐시가 가득 찬 경우 가장 오래된 항목 제거
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            self._evict_oldest()
-
-        # 새 항목 추가
-        self.cache[key] = value
-        self.access_times[key] = time.time()
-        logger.debug(f"캐시 저장: {key}")
+        """캐시에서 값 조회 (만료된 항목은 제거하고 None 반환)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry, time.monotonic()):
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def __contains__(self, key: str) -> bool:
+        """캐시에 있는지 여부 (사용 순서와 통계는 바꾸지 않음)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._is_expired(entry, time.monotonic())
+
+    def set(self, key: str, value: T, cost: int = 1) -> None:
+        """캐시에 값 저장
+
+        비용이 max_cost보다 큰 항목도 저장하고(다른 항목은 모두 제거), 경고를 남기고 통계에 기록합니다.
+        저장하지 않으면 같은 항목을 조회할 때마다 다시 만들게 되기 때문입니다.
+        """
+        with self._lock:
+            self._remove(key)
+            expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0.0
+            self._entries[key] = _Entry(value, cost, expires_at)
+            self._cost += cost
+            # 방금 저장한 항목은 제거하지 않음
+            while len(self._entries) > 1 and (
+                0 < self.max_size < len(self._entries) or 0 < self.max_cost < self._cost
+            ):
+                # 가장 오래 사용하지 않은 항목 (OrderedDict의 첫 번째 항목)
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+            oversized = 0 < self.max_cost < cost
+            if oversized:
+                self._oversized += 1
+        if oversized:
+            logger.warning(
+                "Cache entry %s exceeds cost budget (%d > %d), keeping it alone",
+                key,
+                cost,
+                self.max_cost,
+            )
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[T]], cost: Callable[[T], int] | None = None
+    ) -> T:
+        """캐시에서 값 조회 (없으면 loader로 생성하여 저장)
+
+        같은 이벤트 루프에서 같은 키를 동시에 로드하면 먼저 시작한 로드 하나의 결과를 함께 사용합니다.
+        로드가 실패하면 기다리던 호출에도 같은 예외가 전달되고, 취소되면 기다리던 호출이 다시 로드합니다.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+            with self._lock:
+                loading = self._loading.get(key)
+                if loading is None or loading[0] is not loop:
+                    future: asyncio.Future = loop.create_future()
+                    self._loading[key] = (loop, future)
+                    self._loads += 1
+                    break
+                self._coalesced += 1
+            try:
+                return await asyncio.shield(loading[1])
+            except asyncio.CancelledError:
+                if not loading[1].cancelled():
+                    raise
+
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 호출이 없어도 경고가 남지 않도록 예외를 조회한 것으로 표시
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                if self._loading.get(key, (None, None))[1] is future:
+                    del self._loading[key]
+        self.set(key, value, cost(value) if cost is not None else 1)
+        future.set_result(value)
+        return value
 
     def delete(self, key: str) -> bool:
         """캐시에서 항목 삭제"""
-        if key in self.cache:
-            del self.cache[key]
-            del self.access_times[key]
-            logger.debug(f"캐시 삭제: {key}")
-            return True
-        return False
+        with self._lock:
+            return self._remove(key) is not None
 
     def delete_pattern(self, pattern: str) -> int:
         """패턴에 맞는 키들 삭제"""
-        deleted_count = 0
-        keys_to_delete = []
-
-        for key in list(self.cache.keys()):
-            if pattern in key:
-                keys_to_delete.append(key)
-
-        for key in keys_to_delete:
-            if self.delete(key):
-                deleted_count += 1
-
-        logger.debug(f"패턴 삭제: {pattern}, 삭제된 키: {deleted_count}개")
-        return deleted_count
+        with self._lock:
+            keys_to_delete = [key for key in self._entries if pattern in key]
+            for key in keys_to_delete:
+                self._remove(key)
+        return len(keys_to_delete)
 
     def delete_multiple(self, keys: List[str]) -> int:
         """여러 키 삭제"""
-        deleted_count = 0
-        for key in keys:
-            if self.delete(key):
-                deleted_count += 1
-        return deleted_count
+        with self._lock:
+            return sum(1 for key in keys if self._remove(key) is not None)
 
     def clear(self) -> None:
         """캐시 전체 삭제"""
-        self.cache.clear()
-        self.access_times.clear()
-        logger.debug("캐시 전체 삭제")
+        with self._lock:
+            self._entries.clear()
+            self._cost = 0
 
     def size(self) -> int:
         """캐시 크기 반환"""
-        return len(self.cache)
+        return len(self._entries)
 
     def keys(self) -> List[str]:
-        """캐시 키 목록 반환"""
-        return list(self.cache.keys())
-
-    def _evict_oldest(self) -> None:
-        """가장 오래된 항목 제거"""
-        if not self.cache:
-            return
-
-        # 가장 오래된 항목 찾기 (OrderedDict의 첫 번째 항목)
-        oldest_key = next(iter(self.cache))
-        del self.cache[oldest_key]
-        del self.access_times[oldest_key]
-        logger.debug(f"LRU 제거: {oldest_key}")
+        """캐시 키 목록 반환 (오래 사용하지 않은 순)"""
+        with self._lock:
+            return list(self._entries)
+
+    def values(self) -> List[T]:
+        """캐시 값 목록 반환 (오래 사용하지 않은 순, 만료된 항목 제외)"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                entry.value for entry in self._entries.values() if not self._is_expired(entry, now)
+            ]
 
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 반환"""
-        return {
-            "size": len(self.cache),
-            "max_size": self.max_size,
-            "keys": list(self.cache.keys()),
-            "access_times": self.access_times.copy(),
-        }
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "cost": self._cost,
+                "max_cost": self.max_cost,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / requests if requests else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "loads": self._loads,
+                "coalesced": self._coalesced,
+                "oversized": self._oversized,
+            }
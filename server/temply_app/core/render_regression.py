@@ -0,0 +1,277 @@
+"""
+버전 간 렌더링 비교
+
+두 버전의 모든 템플릿 컴포넌트를 같은 데이터로 렌더링하고 결과를 비교합니다.
+렌더링은 프로세스 풀에 나누어 실행하며, 각 작업 프로세스는 소스 기준 바이트코드 캐시를
+두 버전의 Jinja 환경이 공유하므로 바이트 단위로 같은 템플릿은 한 번만 컴파일합니다.
+"""
+
+import asyncio
+import difflib
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from temply_app.core.config import Config
+from temply_app.core.lru_cache import LRUCache
+from temply_app.core.temply.bytecode_cache import SourceBytecodeCache
+from temply_app.core.temply.manifest import tree_hash
+from temply_app.core.temply.schema.utils import generate_object
+from temply_app.core.temply.temply_env import TemplyEnv
+
+logger = logging.getLogger(__name__)
+
+# 비교 결과에 포함할 unified diff 최대 줄 수
+MAX_DIFF_LINES = 200
+# 작업 프로세스별로 유지하는 버전 환경 수 (비교 한 번에 두 버전)
+WORKER_ENV_CACHE_SIZE = 4
+
+
+class RenderStatus(str, Enum):
+    """렌더링 비교 결과 상태"""
+
+    ERROR = "error"
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+    UNCHANGED = "unchanged"
+
+
+# 보고서 정렬 순서 (오류 > 추가/삭제 > 변경 > 동일)
+STATUS_RANK = {
+    RenderStatus.ERROR: 0,
+    RenderStatus.ADDED: 1,
+    RenderStatus.REMOVED: 1,
+    RenderStatus.CHANGED: 2,
+    RenderStatus.UNCHANGED: 3,
+}
+
+
+@dataclass(slots=True)
+class RenderTask:
+    """렌더링 비교 작업 (컴포넌트 하나)"""
+
+    template: str
+    component: str
+    data: Dict[str, Any]
+    in_base: bool
+    in_version: bool
+
+
+@dataclass(slots=True)
+class RenderOutcome:
+    """렌더링 비교 결과 (컴포넌트 하나)"""
+
+    template: str
+    component: str
+    status: RenderStatus
+    score: float = 0.0  # 변경 정도 (0: 동일, 1: 전부 변경)
+    diff: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class RenderTarget:
+    """렌더링할 버전 (작업 프로세스는 버전과 리비전이 같으면 만든 환경을 재사용)"""
+
+    version: str
+    revision: str = ""
+
+
+def render_target(version: str, temply_env: TemplyEnv) -> RenderTarget:
+    """버전 환경의 현재 파일 트리로 렌더링 대상 생성"""
+    return RenderTarget(version, tree_hash(temply_env.get_manifest()))
+
+
+# 작업 프로세스 전역 바이트코드 캐시와 버전 환경 캐시 (작업 사이에도 유지)
+_worker_bytecode_cache: Optional[SourceBytecodeCache] = None
+_worker_envs: LRUCache[TemplyEnv] = LRUCache(WORKER_ENV_CACHE_SIZE)
+
+
+def _get_worker_env(config: Config, target: RenderTarget) -> TemplyEnv:
+    global _worker_bytecode_cache  # pylint: disable=global-statement
+    if _worker_bytecode_cache is None:
+        _worker_bytecode_cache = SourceBytecodeCache(config.render_regression_bytecode_cache_size)
+    key = f"{target.version}\0{target.revision}"
+    temply_env = _worker_envs.get(key)
+    if temply_env is None:
+        temply_env = TemplyEnv(config, target.version)
+        temply_env.env.bytecode_cache = _worker_bytecode_cache
+        _worker_envs.set(key, temply_env)
+    return temply_env
+
+
+def _render(temply_env: TemplyEnv, task: RenderTask) -> str:
+    return temply_env.render_component(task.template, task.component, task.data)
+
+
+def _compare(task: RenderTask, base_output: str, version_output: str) -> RenderOutcome:
+    if base_output == version_output:
+        return RenderOutcome(task.template, task.component, RenderStatus.UNCHANGED)
+    base_lines = base_output.splitlines(keepends=True)
+    version_lines = version_output.splitlines(keepends=True)
+    ratio = difflib.SequenceMatcher(None, base_lines, version_lines, autojunk=False).ratio()
+    diff_lines = list(difflib.unified_diff(base_lines, version_lines, "base", "version", n=2))
+    diff_lines = diff_lines[:MAX_DIFF_LINES]
+    return RenderOutcome(
+        task.template,
+        task.component,
+        RenderStatus.CHANGED,
+        # 줄 단위로 같아도 출력이 다르면(공백 등) 최소 변경으로 표시
+        score=round(max(1.0 - ratio, 0.001), 4),
+        diff="".join(diff_lines),
+    )
+
+
+def render_chunk(
+    config: Config, base: RenderTarget, version: RenderTarget, tasks: List[RenderTask]
+) -> List[RenderOutcome]:
+    """작업 프로세스에서 컴포넌트 묶음을 두 버전으로 렌더링하고 비교"""
+    base_env = _get_worker_env(config, base)
+    version_env = _get_worker_env(config, version)
+    outcomes = []
+    for task in tasks:
+        try:
+            base_output = _render(base_env, task) if task.in_base else None
+            version_output = _render(version_env, task) if task.in_version else None
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            outcomes.append(
+                RenderOutcome(
+                    task.template, task.component, RenderStatus.ERROR, score=1.0, error=str(e)
+                )
+            )
+            continue
+        if base_output is None:
+            outcomes.append(
+                RenderOutcome(task.template, task.component, RenderStatus.ADDED, score=1.0)
+            )
+        elif version_output is None:
+            outcomes.append(
+                RenderOutcome(task.template, task.component, RenderStatus.REMOVED, score=1.0)
+            )
+        else:
+            outcomes.append(_compare(task, base_output, version_output))
+    return outcomes
+
+
+def rank_outcomes(outcomes: List[RenderOutcome]) -> List[RenderOutcome]:
+    """결과 정렬 (상태 순, 같은 상태에서는 변경 정도가 큰 순)"""
+    return sorted(
+        outcomes,
+        key=lambda outcome: (
+            STATUS_RANK[outcome.status],
+            -outcome.score,
+            outcome.template,
+            outcome.component,
+        ),
+    )
+
+
+def _chunks(tasks: List[RenderTask], size: int) -> List[List[RenderTask]]:
+    # 같은 템플릿의 컴포넌트는 레이아웃/파셜을 공유하므로 같은 묶음에 배치
+    ordered = sorted(tasks, key=lambda task: (task.template, task.component))
+    return [ordered[i : i + size] for i in range(0, len(ordered), size)]
+
+
+async def run_render_regression(
+    config: Config, base: RenderTarget, version: RenderTarget, tasks: List[RenderTask]
+) -> List[RenderOutcome]:
+    """두 버전의 렌더링 결과 비교 (프로세스 풀에서 병렬 실행)"""
+    if not tasks:
+        return []
+    loop = asyncio.get_running_loop()
+    pool = get_render_pool(config)
+    results: List[List[RenderOutcome]] = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, render_chunk, config, base, version, chunk)
+            for chunk in _chunks(tasks, config.render_regression_chunk_size)
+        )
+    )
+    return rank_outcomes([outcome for chunk in results for outcome in chunk])
+
+
+def summarize(outcomes: List[RenderOutcome]) -> Dict[RenderStatus, int]:
+    """상태별 결과 수"""
+    counts = {status: 0 for status in RenderStatus}
+    for outcome in outcomes:
+        counts[outcome.status] += 1
+    return counts
+
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool(config: Config) -> ProcessPoolExecutor:
+    """Get Render Pool"""
+    global _render_pool  # pylint: disable=global-statement
+    if _render_pool is None:
+        with _render_pool_lock:
+            if _render_pool is None:
+                max_workers = config.render_regression_max_workers or os.cpu_count() or 1
+                # 서버 프로세스의 스레드/이벤트 루프 상태를 복제하지 않도록 spawn으로 시작
+                _render_pool = ProcessPoolExecutor(
+                    max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """렌더링 프로세스 풀 종료"""
+    global _render_pool  # pylint: disable=global-statement
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def build_tasks(
+    base_env: TemplyEnv, version_env: TemplyEnv, payloads: Dict[str, Dict[str, Any]]
+) -> Tuple[List[RenderTask], Dict[str, Dict[str, Any]]]:
+    """두 버전의 전체 컴포넌트로 작업 목록 생성
+
+    요청에 템플릿 데이터가 없으면 비교 버전(없으면 기준 버전)의 스키마로 샘플 데이터를 생성합니다.
+
+    Returns:
+        (작업 목록, 템플릿별 사용한 데이터)
+    """
+    base_components = _list_components(base_env)
+    version_components = _list_components(version_env)
+    tasks = []
+    used: Dict[str, Dict[str, Any]] = {}
+    for template in sorted(base_components.keys() | version_components.keys()):
+        data = payloads.get(template)
+        if data is None:
+            source_env = version_env if template in version_components else base_env
+            data = _sample_data(source_env, template)
+        used[template] = data
+        base_names = base_components.get(template, set())
+        version_names = version_components.get(template, set())
+        for component in sorted(base_names | version_names):
+            tasks.append(
+                RenderTask(
+                    template, component, data, component in base_names, component in version_names
+                )
+            )
+    return tasks, used
+
+
+def _list_components(temply_env: TemplyEnv) -> Dict[str, set]:
+    manifest = temply_env.get_manifest()
+    return {template: set(components) for template, components in manifest.components.items()}
+
+
+def _sample_data(temply_env: TemplyEnv, template: str) -> Dict[str, Any]:
+    """스키마 파일(없으면 템플릿에서 추론한 스키마)로 샘플 데이터 생성"""
+    try:
+        schema = temply_env.load_schema_source(template) or temply_env.get_template_schema(template)
+        data = generate_object(schema)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.warning("Failed to generate sample data for %s: %s", template, e)
+        return {}
+    return data if isinstance(data, dict) else {}
@@ -0,0 +1,68 @@
+"""
+비동기 읽기/쓰기 락 (Readers-Writer Lock)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+class AsyncRWLock:
+    """asyncio 기반 읽기/쓰기 락
+
+    - 읽기는 동시에 여러 개 수행될 수 있습니다.
+    - 쓰기는 단독으로 수행되며, 진행 중인 읽기가 모두 끝날 때까지 기다립니다.
+    - 대기 중인 쓰기가 있으면 새로운 읽기는 대기합니다 (쓰기 기아 방지).
+    - 재진입을 지원하지 않으므로 락을 잡은 상태에서 같은 락을 다시 잡으면 안 됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._cond = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @property
+    def readers(self) -> int:
+        """현재 읽기 중인 수"""
+        return self._readers
+
+    @property
+    def writing(self) -> bool:
+        """쓰기 진행 여부"""
+        return self._writer
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[None]:
+        """읽기 락"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self._writer and self._waiting_writers == 0)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        """쓰기 락"""
+        async with self._cond:
+            self._waiting_writers += 1
+            try:
+                await self._cond.wait_for(lambda: not self._writer and self._readers == 0)
+            except BaseException:
+                # 취소된 경우 대기 중인 읽기를 깨워야 함
+                self._cond.notify_all()
+                raise
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._writer = False
+                self._cond.notify_all()
@@ -0,0 +1,226 @@
+"""
+전문 검색 인덱스
+
+버전별로 레이아웃/파셜/템플릿 컴포넌트의 이름, 설명, 본문을 토큰 단위 역색인으로 관리합니다.
+부분 문자열 검색은 어휘(토큰 목록)에 대한 3-gram 색인으로 후보 토큰을 찾습니다.
+본문은 보관하지 않으며, 스니펫은 검색 결과에 대해서만 본문 캐시에서 읽어 만듭니다.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+")
+NGRAM_SIZE = 3
+
+# 필드별 가중치
+FIELD_WEIGHTS: Dict[str, float] = {"name": 3.0, "description": 2.0, "content": 1.0}
+# 검색어와 토큰이 정확히 일치하는 경우 가중치
+EXACT_MATCH_BOOST = 2.0
+
+
+class SearchKind(str, Enum):
+    """검색 문서 종류"""
+
+    LAYOUT = "layout"
+    PARTIAL = "partial"
+    COMPONENT = "component"
+
+
+DocId = Tuple[SearchKind, str]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """텍스트를 소문자 토큰 목록으로 변환"""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _ngrams(token: str) -> Set[str]:
+    """토큰의 n-gram 집합"""
+    return {token[i : i + NGRAM_SIZE] for i in range(len(token) - NGRAM_SIZE + 1)}
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """검색 결과"""
+
+    kind: SearchKind
+    key: str
+    score: float
+
+
+class SearchIndex:
+    """토큰/n-gram 역색인
+
+    파서의 쓰기 경로에서 문서 단위로 갱신되며, 동시성은 TemplyEnv의 읽기/쓰기 락으로 보호합니다.
+    """
+
+    def __init__(self) -> None:
+        # 문서별 필드 토큰 빈도 (갱신/삭제 시 사용)
+        self._docs: Dict[DocId, Dict[str, Counter]] = {}
+        # 토큰 -> 문서 -> 가중 빈도
+        self._postings: Dict[str, Dict[DocId, float]] = {}
+        # n-gram -> 토큰 (부분 문자열 검색용)
+        self._grams: Dict[str, Set[str]] = {}
+
+    def add(self, kind: SearchKind, key: str, fields: Dict[str, Optional[str]]) -> None:
+        """문서 추가 (이미 있으면 교체)"""
+        doc_id = (kind, key)
+        self._unindex(doc_id)
+        self._index(doc_id, {name: Counter(tokenize(text)) for name, text in fields.items()})
+
+    def update_field(self, kind: SearchKind, key: str, field: str, text: Optional[str]) -> None:
+        """문서의 한 필드만 갱신 (예: 메타데이터만 변경된 경우 설명)"""
+        doc_id = (kind, key)
+        doc_fields = self._docs.get(doc_id)
+        if doc_fields is None:
+            return
+        self._unindex(doc_id)
+        self._index(doc_id, {**doc_fields, field: Counter(tokenize(text))})
+
+    def remove(self, kind: SearchKind, key: str) -> None:
+        """문서 삭제"""
+        self._unindex((kind, key))
+
+    def remove_kind(self, kind: SearchKind) -> None:
+        """종류별 문서 전체 삭제"""
+        for doc_id in [doc_id for doc_id in self._docs if doc_id[0] == kind]:
+            self._unindex(doc_id)
+
+    def _index(self, doc_id: DocId, doc_fields: Dict[str, Counter]) -> None:
+        weights: Dict[str, float] = {}
+        for name, counter in doc_fields.items():
+            weight = FIELD_WEIGHTS.get(name, 1.0)
+            for token, count in counter.items():
+                weights[token] = weights.get(token, 0.0) + count * weight
+
+        self._docs[doc_id] = doc_fields
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                for gram in _ngrams(token):
+                    self._grams.setdefault(gram, set()).add(token)
+            postings[doc_id] = weight
+
+    def _unindex(self, doc_id: DocId) -> None:
+        doc_fields = self._docs.pop(doc_id, None)
+        if doc_fields is None:
+            return
+        tokens: Set[str] = set()
+        for counter in doc_fields.values():
+            tokens.update(counter)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if postings:
+                continue
+            del self._postings[token]
+            for gram in _ngrams(token):
+                gram_tokens = self._grams.get(gram)
+                if gram_tokens is not None:
+                    gram_tokens.discard(token)
+                    if not gram_tokens:
+                        del self._grams[gram]
+
+    def _match_tokens(self, term: str) -> Iterable[str]:
+        """검색어를 포함하는 어휘 토큰 조회"""
+        if len(term) < NGRAM_SIZE:
+            candidates: Iterable[str] = self._postings.keys()
+        else:
+            gram_sets = [self._grams.get(gram, set()) for gram in _ngrams(term)]
+            candidates = set.intersection(*sorted(gram_sets, key=len))
+        return [token for token in candidates if term in token]
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Set[SearchKind]] = None,
+        limit: int = 20,
+    ) -> List[SearchHit]:
+        """검색 (모든 검색어를 포함하는 문서를 점수순으로 반환)"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        total = len(self._docs)
+        scores: Optional[Dict[DocId, float]] = None
+        for term in terms:
+            term_scores: Dict[DocId, float] = {}
+            for token in self._match_tokens(term):
+                postings = self._postings[token]
+                idf = math.log(1 + total / len(postings))
+                boost = EXACT_MATCH_BOOST if token == term else 1.0
+                for doc_id, weight in postings.items():
+                    if kinds and doc_id[0] not in kinds:
+                        continue
+                    term_scores[doc_id] = term_scores.get(doc_id, 0.0) + weight * idf * boost
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    doc_id: score + term_scores[doc_id]
+                    for doc_id, score in scores.items()
+                    if doc_id in term_scores
+                }
+            if not scores:
+                return []
+
+        assert scores is not None
+        ranked = heapq.nsmallest(
+            limit, scores.items(), key=lambda item: (-item[1], item[0][0].value, item[0][1])
+        )
+        return [SearchHit(kind=kind, key=key, score=score) for (kind, key), score in ranked]
+
+    def get_stats(self) -> Dict[str, int]:
+        """인덱스 통계 반환"""
+        return {
+            "documents": len(self._docs),
+            "tokens": len(self._postings),
+            "grams": len(self._grams),
+        }
+
+
+def make_snippet(
+    text: Optional[str], query: str, width: int = 120
+) -> Optional[Tuple[str, List[Tuple[int, int]]]]:
+    """검색어 주변 스니펫과 강조 위치(스니펫 기준 [start, end)) 생성
+
+    검색어가 텍스트에 없으면 None을 반환합니다.
+    """
+    if not text:
+        return None
+    terms = list(dict.fromkeys(tokenize(query)))
+    # 소문자 변환으로 길이가 바뀌는 문자(예: İ)가 있어도 위치가 어긋나지 않도록 원문에서 직접 검색
+    matches = [
+        (match.start(), match.end())
+        for term in terms
+        for match in re.finditer(re.escape(term), text, re.IGNORECASE)
+    ]
+    if not matches:
+        return None
+
+    start = max(0, min(match_start for match_start, _ in matches) - width // 3)
+    end = min(len(text), start + width)
+    snippet = text[start:end]
+    ranges = [
+        (match_start - start, match_end - start)
+        for match_start, match_end in matches
+        if start <= match_start and match_end <= end
+    ]
+
+    highlights: List[Tuple[int, int]] = []
+    for range_start, range_end in sorted(ranges):
+        if highlights and range_start <= highlights[-1][1]:
+            highlights[-1] = (highlights[-1][0], max(highlights[-1][1], range_end))
+        else:
+            highlights.append((range_start, range_end))
+    return snippet, highlights
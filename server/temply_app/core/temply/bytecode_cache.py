@@ -0,0 +1,61 @@
+"""
+메모리 Jinja 바이트코드 캐시
+
+여러 Jinja 환경이 하나의 캐시를 공유하여 같은 템플릿 소스를 한 번만 컴파일합니다.
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from jinja2 import BytecodeCache, Environment
+from jinja2.bccache import Bucket
+
+from temply_app.core.lru_cache import LRUCache
+
+
+class MemoryBytecodeCache(BytecodeCache):
+    """메모리 바이트코드 캐시 (캐시 키는 Jinja 기본값: 템플릿 이름 + 파일 이름)"""
+
+    def __init__(self, max_size: int, max_bytes: int = 0) -> None:
+        self._cache: LRUCache[bytes] = LRUCache(max_size, max_cost=max_bytes)
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        data = self._cache.get(bucket.key)
+        if data is not None:
+            bucket.bytecode_from_string(data)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        data = bucket.bytecode_to_string()
+        self._cache.set(bucket.key, data, len(data))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def size(self) -> int:
+        """캐시 항목 수"""
+        return self._cache.size()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환 (비용은 바이트코드 크기)"""
+        return self._cache.get_stats()
+
+
+class SourceBytecodeCache(MemoryBytecodeCache):
+    """소스 기준 바이트코드 캐시
+
+    템플릿 이름과 소스 체크섬을 캐시 키로 사용하므로, 파일 위치(버전 디렉토리)가 달라도
+    같은 이름의 바이트 단위로 동일한 소스는 컴파일 결과를 공유합니다.
+    """
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: Optional[str],
+        source: str,
+    ) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha1(f"{name}\0{checksum}".encode("utf-8")).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
@@ -0,0 +1,271 @@
+"""
+git 객체 저장소
+
+체크아웃 없이 bare 저장소의 객체(커밋, 트리, blob)를 직접 읽습니다.
+트리(파일 목록)는 트리 객체 ID, blob 본문과 파싱/컴파일 결과는 blob 객체 ID로 캐시하므로
+여러 커밋에서 동일한 파일은 한 번만 읽고 파싱/컴파일합니다.
+"""
+
+import asyncio
+import logging
+import subprocess
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+
+from temply_app.core.config import Config
+from temply_app.core.content_cache import ContentCache
+from temply_app.core.exceptions import GitCommandError, GitRevisionNotFoundError
+from temply_app.core.git_env import GitEnv
+from temply_app.core.lru_cache import LRUCache
+from temply_app.core.temply.bytecode_cache import MemoryBytecodeCache
+from temply_app.core.temply.manifest import Manifest, build_manifest
+from temply_app.core.utils.git_runner import GitRunner, get_git_runner
+from temply_app.models.common_model import VersionInfo
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class GitTree:
+    """커밋의 파일 트리"""
+
+    commit: str
+    tree: str
+    # 버전 루트 기준 경로 -> (blob 객체 ID, 크기)
+    blobs: Dict[str, Tuple[str, int]]
+    manifest: Manifest
+
+    def get_blob_id(self, path: str) -> Optional[str]:
+        """경로의 blob 객체 ID (없으면 None)"""
+        blob = self.blobs.get(path)
+        return blob[0] if blob else None
+
+
+class GitObjectStore:
+    """bare 저장소 객체 조회"""
+
+    def __init__(
+        self,
+        git_dir: str,
+        runner: GitRunner,
+        encoding: str = "utf-8",
+        blob_cache_max_bytes: int = 16 * 1024 * 1024,
+        object_cache_size: int = 1024,
+        tree_cache_size: int = 32,
+    ) -> None:
+        self.git_dir = git_dir
+        self.encoding = encoding
+        self._runner = runner
+        self._trees: LRUCache[GitTree] = LRUCache(tree_cache_size)
+        self._blobs = ContentCache(blob_cache_max_bytes)
+        self._parsed: LRUCache[Any] = LRUCache(object_cache_size)
+        # 로더가 blob 객체 ID를 파일 이름으로 넘기므로, 캐시 키(템플릿 이름 + 파일 이름)는
+        # 커밋이 달라도 같은 경로의 같은 내용이면 동일하여 컴파일 결과를 공유
+        self.bytecode_cache = MemoryBytecodeCache(object_cache_size)
+        # blob 조회용 `git cat-file --batch` 프로세스 (처음 필요할 때 시작)
+        self._batch: Optional["subprocess.Popen[bytes]"] = None
+        self._batch_lock = threading.Lock()
+
+    async def _git(self, *args: str) -> str:
+        result = await self._runner.run("--git-dir", self.git_dir, *args)
+        return result.stdout
+
+    async def resolve(self, rev: str) -> Tuple[str, str]:
+        """브랜치/태그/커밋을 (커밋 ID, 트리 ID)로 변환
+
+        Raises:
+            GitRevisionNotFoundError: 존재하지 않는 리비전인 경우
+        """
+        if rev.startswith("-"):
+            raise GitRevisionNotFoundError(f"Revision {rev} not found")
+        try:
+            output = await self._git(
+                "rev-parse", "--verify", "--end-of-options", f"{rev}^{{commit}}"
+            )
+            commit = output.strip()
+            tree = (await self._git("rev-parse", f"{commit}^{{tree}}")).strip()
+        except GitCommandError as e:
+            raise GitRevisionNotFoundError(f"Revision {rev} not found", e.result) from e
+        return commit, tree
+
+    async def resolve_before(self, ref: str, before: datetime) -> str:
+        """브랜치에서 지정 시각(커밋 시각 기준) 이전의 마지막 커밋 ID 조회
+
+        Raises:
+            GitRevisionNotFoundError: 브랜치가 없거나 해당 시각 이전 커밋이 없는 경우
+        """
+        try:
+            output = await self._git(
+                "rev-list", "-1", f"--before={before.isoformat()}", "--end-of-options", ref
+            )
+        except GitCommandError as e:
+            raise GitRevisionNotFoundError(f"Revision {ref} not found", e.result) from e
+        commit = output.strip()
+        if not commit:
+            raise GitRevisionNotFoundError(f"No commit in {ref} before {before.isoformat()}")
+        return commit
+
+    async def is_ancestor(self, commit: str, ref: str) -> bool:
+        """커밋이 브랜치(ref)에 포함되는지 여부 (`git merge-base --is-ancestor`)
+
+        Raises:
+            GitRevisionNotFoundError: 커밋 또는 브랜치가 없는 경우
+        """
+        result = await self._runner.run(
+            "--git-dir", self.git_dir, "merge-base", "--is-ancestor", commit, ref, check=False
+        )
+        if result.returncode > 1:
+            raise GitRevisionNotFoundError(f"Revision {commit} or {ref} not found", result)
+        return result.ok
+
+    async def read_tree(self, rev: str) -> GitTree:
+        """커밋의 파일 트리 조회 (트리 객체 ID로 캐시)"""
+        commit, tree = await self.resolve(rev)
+        cached = self._trees.get(tree)
+        if cached is not None:
+            if cached.commit == commit:
+                return cached
+            # 다른 커밋이 같은 트리를 가리키는 경우 파일 목록 공유
+            return GitTree(commit, tree, cached.blobs, cached.manifest)
+
+        output = await self._git("ls-tree", "-r", "-l", "-z", tree)
+        blobs: Dict[str, Tuple[str, int]] = {}
+        for record in output.split("\0"):
+            if not record:
+                continue
+            info, path = record.split("\t", 1)
+            _, object_type, object_id, size = info.split()
+            if object_type != "blob":
+                continue
+            blobs[path] = (object_id, int(size))
+        git_tree = GitTree(
+            commit,
+            tree,
+            blobs,
+            build_manifest({path: size for path, (_, size) in blobs.items()}),
+        )
+        self._trees.set(tree, git_tree)
+        return git_tree
+
+    def _start_batch(self) -> "subprocess.Popen[bytes]":
+        process = self._batch
+        if process is None or process.poll() is not None:
+            process = subprocess.Popen(  # pylint: disable=consider-using-with
+                ["git", "--git-dir", self.git_dir, "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self._batch = process
+        return process
+
+    def _read_blob_bytes(self, object_id: str) -> bytes:
+        with self._batch_lock:
+            process = self._start_batch()
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                process.stdin.write(f"{object_id}\n".encode())
+                process.stdin.flush()
+                header = process.stdout.readline().decode().split()
+                if len(header) != 3 or header[1] != "blob":
+                    raise FileNotFoundError(f"git object {object_id} not found")
+                data = process.stdout.read(int(header[2]))
+                process.stdout.read(1)  # 구분 개행
+            except (BrokenPipeError, ValueError) as e:
+                self._close_batch()
+                raise GitCommandError(f"Failed to read git object {object_id}: {e}") from e
+        return data
+
+    async def preload(self, tree: GitTree) -> int:
+        """트리의 blob 본문을 스레드에서 미리 읽어 캐시
+
+        Jinja 로더와 메타데이터 조회는 이벤트 루프에서 read_text를 동기로 호출하므로,
+        환경을 만들 때 본문을 미리 읽어 두어 파이프 I/O가 이벤트 루프를 막지 않게 합니다.
+        다른 커밋의 본문을 모두 밀어내지 않도록 blob 캐시 크기의 절반까지만 읽습니다.
+
+        Returns:
+            새로 읽은 blob 수
+        """
+        budget = self._blobs.max_bytes // 2
+        missing = []
+        for object_id, size in sorted(set(tree.blobs.values())):
+            if size > budget:
+                continue
+            budget -= size
+            if object_id not in self._blobs:
+                missing.append(object_id)
+        if missing:
+            await asyncio.to_thread(self._read_blobs, missing)
+        return len(missing)
+
+    def _read_blobs(self, object_ids: List[str]) -> None:
+        for object_id in object_ids:
+            self._blobs.set(object_id, self._read_blob_bytes(object_id).decode(self.encoding))
+
+    def read_text(self, object_id: str) -> str:
+        """blob 본문 조회 (blob 객체 ID로 캐시)
+
+        캐시에 없으면 `git cat-file --batch` 파이프에서 동기로 읽으므로 호출한 스레드를 막습니다
+        (preload로 미리 읽지 않은 본문을 이벤트 루프에서 처음 읽는 경우 포함).
+        """
+        content = self._blobs.get(object_id)
+        if content is None:
+            content = self._read_blob_bytes(object_id).decode(self.encoding)
+            self._blobs.set(object_id, content)
+        return content
+
+    def get_parsed(self, kind: str, object_id: str, parse: Callable[[str], T]) -> T:
+        """blob 파싱 결과 조회 (종류와 blob 객체 ID로 캐시, 여러 커밋이 공유)
+
+        같은 kind에는 항상 같은 타입을 반환하는 parse를 사용해야 합니다.
+        """
+        key = f"{kind}:{object_id}"
+        cached = self._parsed.get(key)
+        if cached is not None:
+            return cast(T, cached)
+        parsed = parse(self.read_text(object_id))
+        self._parsed.set(key, parsed)
+        return parsed
+
+    def _close_batch(self) -> None:
+        process, self._batch = self._batch, None
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+    def close(self) -> None:
+        """blob 조회 프로세스 종료"""
+        with self._batch_lock:
+            self._close_batch()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        return {
+            "trees": self._trees.get_stats(),
+            "blobs": self._blobs.get_stats(),
+            "parsed": self._parsed.get_stats(),
+            "bytecode": self.bytecode_cache.get_stats(),
+        }
+
+
+_git_object_store: Optional[GitObjectStore] = None
+
+
+def get_git_object_store(config: Config) -> GitObjectStore:
+    """Get Git Object Store"""
+    global _git_object_store  # pylint: disable=global-statement
+    if _git_object_store is None:
+        git_env = GitEnv(config, VersionInfo.root_version(config))
+        _git_object_store = GitObjectStore(
+            git_env.bare_path,
+            get_git_runner(config),
+            config.file_encoding,
+            config.git_object_cache_max_bytes,
+            config.git_object_cache_size,
+            config.git_tree_cache_size,
+        )
+    return _git_object_store
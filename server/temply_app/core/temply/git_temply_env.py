@@ -0,0 +1,118 @@
+"""
+git 커밋 Temply 환경
+
+EFS의 버전 디렉토리 대신 bare 저장소의 객체에서 템플릿을 읽는 읽기 전용 TemplyEnv입니다.
+임의의 브랜치/커밋(과거 커밋, PR head 등)을 체크아웃 없이 렌더링하거나 조회할 수 있습니다.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+from jinja2 import BaseLoader, Environment, TemplateNotFound, nodes
+
+from temply_app.core.config import Config
+from temply_app.core.temply.git_object_store import GitObjectStore, GitTree
+from temply_app.core.temply.manifest import Manifest
+from temply_app.core.temply.parser.meta_model import BaseMetaData
+from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.utils import parser_meta_util
+
+
+class GitTreeLoader(BaseLoader):
+    """git 트리 템플릿 로더 (템플릿 이름 = 저장소 루트 기준 경로)"""
+
+    def __init__(self, store: GitObjectStore, tree: GitTree) -> None:
+        self.store = store
+        self.tree = tree
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str | None, Callable[[], bool] | None]:
+        object_id = self.tree.get_blob_id(template)
+        if object_id is None:
+            raise TemplateNotFound(template)
+        # 파일 이름 대신 blob 객체 ID를 넘겨 같은 내용의 바이트코드를 커밋 간에 공유
+        # 커밋의 내용은 변경되지 않으므로 항상 최신
+        return self.store.read_text(object_id), object_id, lambda: True
+
+    def list_templates(self) -> list[str]:
+        return sorted(self.tree.blobs)
+
+
+class GitTemplyEnv(TemplyEnv):
+    """git 커밋 Temply 환경 (읽기 전용)"""
+
+    def __init__(
+        self,
+        config: Config,
+        store: GitObjectStore,
+        tree: GitTree,
+        version: str | None = None,
+    ):
+        self.store = store
+        self.tree = tree
+        super().__init__(config, version or tree.commit)
+        self.read_only = True
+
+    def _prepare_dirs(self) -> None:
+        """EFS를 사용하지 않으므로 저장소 루트 기준 상대 경로만 설정"""
+        self.templates_dir = Path(self.templates_dir_name)
+        self.layouts_dir = Path(self.layouts_dir_name)
+        self.partials_dir = Path(self.partials_dir_name)
+
+    def _create_loader(self) -> BaseLoader:
+        """git 트리 로더 생성"""
+        return GitTreeLoader(self.store, self.tree)
+
+    def _get_env(self) -> Environment:
+        """템플릿 환경 조회 (컴파일 결과는 객체 저장소의 바이트코드 캐시 공유)"""
+        _env = super()._get_env()
+        _env.bytecode_cache = self.store.bytecode_cache
+        _env.auto_reload = False
+        return _env
+
+    def get_manifest(self) -> Manifest:
+        """커밋 트리 매니페스트 조회"""
+        return self.tree.manifest
+
+    def invalidate_manifest(self) -> None:
+        """커밋 트리는 변경되지 않음"""
+
+    def _get_blob_id(self, path: str) -> str:
+        object_id = self.tree.get_blob_id(path)
+        if object_id is None:
+            raise FileNotFoundError(f"path {path} not found in {self.tree.commit}")
+        return object_id
+
+    def load_schema_source(self, template_name: str) -> dict[str, Any]:
+        """스키마 소스 조회"""
+        object_id = self.tree.get_blob_id(self.build_component_schema_path(template_name))
+        if object_id is None:
+            return {}
+        schema = json.loads(self.store.read_text(object_id))
+        if not isinstance(schema, dict):
+            raise ValueError(f"Schema of {template_name} must be a JSON object")
+        return schema
+
+    def _read_meta(self, path: str) -> BaseMetaData:
+        return self.store.get_parsed(
+            "meta", self._get_blob_id(path), lambda source: parser_meta_util.parse(source)[0]
+        )
+
+    def read_layout_meta(self, layout_name: str) -> BaseMetaData:
+        """레이아웃 메타데이터 조회"""
+        return self._read_meta(self.build_layout_path(layout_name))
+
+    def read_partial_meta(self, partial_name: str) -> BaseMetaData:
+        """파트 메타데이터 조회"""
+        return self._read_meta(self.build_partial_path(partial_name))
+
+    def read_component_meta(self, template_name: str, component_name: str) -> BaseMetaData:
+        """템플릿 컴포넌트 메타데이터 조회"""
+        return self._read_meta(self.build_component_path(template_name, component_name))
+
+    def _source_parse_component(self, template_name: str, component_name: str) -> nodes.Template:
+        """템플릿 컴포넌트 소스 파싱 (blob 객체 ID로 캐시)"""
+        object_id = self._get_blob_id(self.build_component_path(template_name, component_name))
+        return self.store.get_parsed("ast", object_id, self.parse)
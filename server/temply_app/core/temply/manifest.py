@@ -0,0 +1,224 @@
+"""
+버전 파일 매니페스트
+
+버전 디렉토리(templates/layouts/partials)를 os.scandir로 한 번만 순회하여
+파일 목록(경로, 크기, 수정 시간, 종류)을 만듭니다.
+TemplyEnv와 파서는 디렉토리를 다시 순회하지 않고 이 매니페스트를 사용합니다.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+
+class ManifestKind(str, Enum):
+    """매니페스트 항목 종류"""
+
+    LAYOUT = "layout"
+    PARTIAL = "partial"
+    COMPONENT = "component"
+    SCHEMA = "schema"
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    """매니페스트 항목"""
+
+    kind: ManifestKind
+    path: str  # 버전 루트 기준 상대 경로 (예: templates/welcome/HTML_EMAIL)
+    name: str
+    size: int
+    mtime_ns: int
+    template: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Manifest:
+    """버전 파일 매니페스트"""
+
+    layouts: Dict[str, ManifestEntry] = field(default_factory=dict)
+    partials: Dict[str, ManifestEntry] = field(default_factory=dict)
+    # 템플릿 -> 컴포넌트 -> 항목 (컴포넌트가 없는 템플릿 디렉토리도 포함)
+    components: Dict[str, Dict[str, ManifestEntry]] = field(default_factory=dict)
+    schemas: Dict[str, ManifestEntry] = field(default_factory=dict)
+
+    def entries(self) -> List[ManifestEntry]:
+        """전체 항목 목록"""
+        items: List[ManifestEntry] = [*self.layouts.values(), *self.partials.values()]
+        for components in self.components.values():
+            items.extend(components.values())
+        items.extend(self.schemas.values())
+        return items
+
+
+def _entry(
+    kind: ManifestKind, dir_name: str, dir_entry: os.DirEntry, template: Optional[str] = None
+) -> ManifestEntry:
+    stat = dir_entry.stat()
+    path = f"{dir_name}/{template}/{dir_entry.name}" if template else f"{dir_name}/{dir_entry.name}"
+    return ManifestEntry(
+        kind=kind,
+        path=path,
+        name=dir_entry.name,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        template=template,
+    )
+
+
+def _scan_files(directory: Path, dir_name: str, kind: ManifestKind) -> Dict[str, ManifestEntry]:
+    """디렉토리의 파일 항목 조회"""
+    if not directory.exists():
+        return {}
+    with os.scandir(directory) as it:
+        return {
+            dir_entry.name: _entry(kind, dir_name, dir_entry)
+            for dir_entry in it
+            # 숨김 파일(쓰기 중인 임시 파일 등) 제외
+            if dir_entry.is_file() and not dir_entry.name.startswith(".")
+        }
+
+
+def scan_manifest(
+    templates_dir: Path,
+    layouts_dir: Path,
+    partials_dir: Path,
+    templates_dir_name: str = "templates",
+    layouts_dir_name: str = "layouts",
+    partials_dir_name: str = "partials",
+    schema_filename: str = "schema.json",
+) -> Manifest:
+    """버전 디렉토리를 한 번 순회하여 매니페스트 생성"""
+    manifest = Manifest(
+        layouts=_scan_files(layouts_dir, layouts_dir_name, ManifestKind.LAYOUT),
+        partials=_scan_files(partials_dir, partials_dir_name, ManifestKind.PARTIAL),
+    )
+    if not templates_dir.exists():
+        return manifest
+
+    with os.scandir(templates_dir) as templates:
+        for template_entry in templates:
+            # .DS_Store 등 숨김 항목과 파일 제외
+            if template_entry.name.startswith(".") or template_entry.is_file():
+                continue
+            template = template_entry.name
+            components: Dict[str, ManifestEntry] = {}
+            with os.scandir(template_entry.path) as items:
+                for item in items:
+                    if item.name.startswith(".") or not item.is_file():
+                        continue
+                    if item.name == schema_filename:
+                        manifest.schemas[template] = _entry(
+                            ManifestKind.SCHEMA, templates_dir_name, item, template
+                        )
+                    if item.name.endswith(".json"):  # 스키마 파일 제외
+                        continue
+                    components[item.name] = _entry(
+                        ManifestKind.COMPONENT, templates_dir_name, item, template
+                    )
+            manifest.components[template] = components
+    return manifest
+
+
+def build_manifest(
+    files: Dict[str, int],
+    templates_dir_name: str = "templates",
+    layouts_dir_name: str = "layouts",
+    partials_dir_name: str = "partials",
+    schema_filename: str = "schema.json",
+) -> Manifest:
+    """버전 루트 기준 파일 경로와 크기 목록으로 매니페스트 생성 (git 트리 등)
+
+    scan_manifest와 같은 규칙을 적용하며, 수정 시간은 0으로 기록합니다.
+    """
+    manifest = Manifest()
+    for path, size in sorted(files.items()):
+        parts = path.split("/")
+        if any(part.startswith(".") for part in parts):
+            continue
+        if len(parts) == 2 and parts[0] in (layouts_dir_name, partials_dir_name):
+            kind = ManifestKind.LAYOUT if parts[0] == layouts_dir_name else ManifestKind.PARTIAL
+            target = manifest.layouts if kind == ManifestKind.LAYOUT else manifest.partials
+            target[parts[1]] = ManifestEntry(kind, path, parts[1], size, 0)
+        elif len(parts) == 3 and parts[0] == templates_dir_name:
+            template, name = parts[1], parts[2]
+            components = manifest.components.setdefault(template, {})
+            if name == schema_filename:
+                manifest.schemas[template] = ManifestEntry(
+                    ManifestKind.SCHEMA, path, name, size, 0, template
+                )
+            if name.endswith(".json"):  # 스키마 파일 제외
+                continue
+            components[name] = ManifestEntry(ManifestKind.COMPONENT, path, name, size, 0, template)
+    return manifest
+
+
+@dataclass(slots=True)
+class ManifestDiff:
+    """두 매니페스트 사이의 변경 (추가/수정된 항목과 삭제된 항목)
+
+    컴포넌트 키는 "템플릿/컴포넌트" 형식입니다.
+    """
+
+    layouts: Set[str] = field(default_factory=set)
+    removed_layouts: Set[str] = field(default_factory=set)
+    partials: Set[str] = field(default_factory=set)
+    removed_partials: Set[str] = field(default_factory=set)
+    components: Set[str] = field(default_factory=set)
+    removed_components: Set[str] = field(default_factory=set)
+    schemas: Set[str] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        """변경 여부"""
+        return not (
+            self.layouts
+            or self.removed_layouts
+            or self.partials
+            or self.removed_partials
+            or self.components
+            or self.removed_components
+            or self.schemas
+        )
+
+
+def _is_same(old: ManifestEntry, new: ManifestEntry) -> bool:
+    return old.size == new.size and old.mtime_ns == new.mtime_ns
+
+
+def _diff_entries(
+    old: Dict[str, ManifestEntry], new: Dict[str, ManifestEntry]
+) -> tuple[Set[str], Set[str]]:
+    changed = {key for key, entry in new.items() if key not in old or not _is_same(old[key], entry)}
+    return changed, old.keys() - new.keys()
+
+
+def _flatten_components(manifest: Manifest) -> Dict[str, ManifestEntry]:
+    return {
+        f"{template}/{name}": entry
+        for template, components in manifest.components.items()
+        for name, entry in components.items()
+    }
+
+
+def diff_manifest(old: Manifest, new: Manifest) -> ManifestDiff:
+    """매니페스트 비교 (크기와 수정 시간으로 변경 판단)"""
+    diff = ManifestDiff()
+    diff.layouts, diff.removed_layouts = _diff_entries(old.layouts, new.layouts)
+    diff.partials, diff.removed_partials = _diff_entries(old.partials, new.partials)
+    diff.components, diff.removed_components = _diff_entries(
+        _flatten_components(old), _flatten_components(new)
+    )
+    changed_schemas, removed_schemas = _diff_entries(old.schemas, new.schemas)
+    diff.schemas = changed_schemas | removed_schemas
+    return diff
+
+
+def tree_hash(manifest: Manifest) -> str:
+    """매니페스트 항목(경로, 크기, 수정 시간)의 해시 (로컬 모드 버전 리비전)"""
+    digest = hashlib.sha1()
+    for entry in sorted(manifest.entries(), key=lambda entry: entry.path):
+        digest.update(f"{entry.path}\0{entry.size}\0{entry.mtime_ns}\n".encode())
+    return digest.hexdigest()
@@ -7,10 +7,12 @@ import asyncio
 import os
 from typing import List, Optional, Set
 
+from temply_app.core.content_cache import compute_content_hash, locate_content
 from temply_app.core.exceptions import LayoutAlreadyExistsError, LayoutNotFoundError
-from temply_app.core.temply.parser.meta_model import BaseMetaData, LayoutMetaData
+from temply_app.core.search_index import SearchKind
+from temply_app.core.temply.parser.meta_model import BaseMetaData, ContentMetaData, LayoutMetaData
 from temply_app.core.temply.temply_env import TemplyEnv
-from temply_app.core.utils import parser_meta_util
+from temply_app.core.utils import file_util, parser_meta_util
 from temply_app.models.common_model import User
 
 
@@ -66,11 +68,20 @@ class LayoutParser:
             LayoutMetaData: Parsed layout metadata
         """
         try:
-            content, _, _ = self.env.load_layout_source(layout_name)
-            meta, block = parser_meta_util.parse(content)
+            source, _, _ = self.env.load_layout_source(layout_name)
+            meta, content = self._split_layout(source)
+            content_start, content_end = locate_content(source, content)
+            self.env.search_index.add(
+                SearchKind.LAYOUT,
+                layout_name,
+                {"name": layout_name, "description": meta.description, "content": content},
+            )
             return LayoutMetaData(
                 name=layout_name,
-                content=block.strip(),
+                content_hash=compute_content_hash(content),
+                content_start=content_start,
+                content_end=content_end,
+                _content_loader=self,
                 description=meta.description,
                 created_at=meta.created_at,
                 created_by=meta.created_by,
@@ -80,6 +91,22 @@ class LayoutParser:
         except FileNotFoundError as e:
             raise LayoutNotFoundError(f"Layout {layout_name} not found: {e}") from e
 
+    def _split_layout(self, source: str) -> tuple[BaseMetaData, str]:
+        """레이아웃 소스를 메타데이터와 본문으로 분리합니다."""
+        meta, block = parser_meta_util.parse(source)
+        return meta, block.strip()
+
+    def load_content(self, meta: ContentMetaData) -> str:
+        """레이아웃 본문 조회 (본문 캐시 또는 파일)"""
+        assert isinstance(meta, LayoutMetaData)
+        return self.env.content_cache.load(
+            meta.content_hash,
+            meta.content_start,
+            meta.content_end,
+            lambda: self.env.load_layout_source(meta.name)[0],
+            lambda source: self._split_layout(source)[1],
+        )
+
     async def _parse_layout_files(self) -> List[LayoutMetaData]:
         """Parse layout files and extract metadata.
 
@@ -142,7 +169,8 @@ class LayoutParser:
             List of all layouts
         """
         await self._ensure_initialized()
-        return list(self.nodes.values())
+        async with self.env.rw_lock.read():
+            return list(self.nodes.values())
 
     async def get_layout(self, layout_name: str) -> LayoutMetaData:
         """Get a layout by name.
@@ -151,11 +179,61 @@ class LayoutParser:
             name: Name of the layout
         """
         await self._ensure_initialized()
-        layout = self.nodes.get(layout_name)
+        async with self.env.rw_lock.read():
+            layout = self.nodes.get(layout_name)
         if layout is None:
             raise LayoutNotFoundError(f"Layout {layout_name} not found")
         return layout
 
+    async def refresh_metadata(self) -> int:
+        """메타데이터만 갱신 (본문은 읽지 않음)
+
+        Returns:
+            int: 메타데이터가 변경된 레이아웃 수
+        """
+        await self._ensure_initialized()
+        changed = 0
+        async with self.env.rw_lock.write():
+            for layout in self.nodes.values():
+                try:
+                    meta = self.env.read_layout_meta(layout.name)
+                except FileNotFoundError:
+                    continue
+                if layout.apply_meta(meta):
+                    self.env.search_index.update_field(
+                        SearchKind.LAYOUT, layout.name, "description", meta.description
+                    )
+                    changed += 1
+            if changed:
+                self.env.touch_index()
+        return changed
+
+    async def apply_changes(self, changed: Set[str], removed: Set[str]) -> int:
+        """외부에서 변경된 레이아웃만 다시 파싱
+
+        Args:
+            changed: 추가/수정된 레이아웃 이름
+            removed: 삭제된 레이아웃 이름
+
+        Returns:
+            int: 반영한 레이아웃 수
+        """
+        await self._ensure_initialized()
+        if not changed and not removed:
+            return 0
+        async with self.env.rw_lock.write():
+            for layout_name in removed | changed:
+                if self.nodes.pop(layout_name, None) is not None:
+                    self.env.search_index.remove(SearchKind.LAYOUT, layout_name)
+            for layout_name in changed:
+                try:
+                    self.nodes[layout_name] = await self._parse_layout(layout_name)
+                except (LayoutNotFoundError, OSError):
+                    # 확인 후 다시 삭제된 파일
+                    continue
+            self.env.touch_index()
+        return len(changed | removed)
+
     async def create(
         self, user: User, layout_name: str, content: str, description: Optional[str] = None
     ) -> LayoutMetaData:
@@ -167,8 +245,8 @@ class LayoutParser:
             meta: Metadata of the layout
         """
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             if not self.env.validate_file_name(layout_name):
                 raise ValueError(f"Invalid layout name: {layout_name}")
 
@@ -188,9 +266,8 @@ class LayoutParser:
             await self._write_layout(layout_name, content, meta)
 
             self.nodes[layout_name] = await self._parse_layout(layout_name)
+            self.env.touch_index()
             return self.nodes[layout_name]
-        finally:
-            self._initialized = True
 
     async def _write_layout(self, layout_name: str, content: str, meta: BaseMetaData) -> None:
         """Write a layout.
@@ -200,10 +277,12 @@ class LayoutParser:
             content: Content of the layout
             meta: Metadata of the layout
         """
-        with open(self.env.layouts_dir / layout_name, "w", encoding=self.env.file_encoding) as f:
-            f.write(self.env.format_meta_block(meta))
-            f.write("\n")
-            f.write(content)
+        file_util.write_text_atomic(
+            self.env.layouts_dir / layout_name,
+            self.env.format_meta_block(meta) + "\n" + content,
+            self.env.file_encoding,
+        )
+        self.env.invalidate_manifest()
 
     async def update(
         self, user: User, layout_name: str, content: str, description: Optional[str] = None
@@ -216,15 +295,15 @@ class LayoutParser:
             meta: Metadata of the layout
         """
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             if layout_name not in self.nodes:
                 raise LayoutNotFoundError(f"Layout {layout_name} not found")
 
             if not (self.env.layouts_dir / layout_name).exists():
                 raise LayoutNotFoundError(f"Layout {layout_name} not found")
 
-            _layout = await self.get_layout(layout_name)
+            _layout = self.nodes[layout_name]
 
             meta = BaseMetaData(
                 description=description,
@@ -237,9 +316,8 @@ class LayoutParser:
             await self._write_layout(layout_name, content, meta)
 
             self.nodes[layout_name] = await self._parse_layout(layout_name)
+            self.env.touch_index()
             return self.nodes[layout_name]
-        finally:
-            self._initialized = True
 
     async def delete(self, user: User, layout_name: str) -> None:
         """Delete a layout.
@@ -248,14 +326,15 @@ class LayoutParser:
             layout_name: Name of the layout
         """
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             if layout_name not in self.nodes:
                 raise LayoutNotFoundError(f"Layout {layout_name} not found")
             if not (self.env.layouts_dir / layout_name).exists():
                 raise LayoutNotFoundError(f"Layout {layout_name} not found")
 
             os.remove(self.env.layouts_dir / layout_name)
+            self.env.invalidate_manifest()
             del self.nodes[layout_name]
-        finally:
-            self._initialized = True
+            self.env.search_index.remove(SearchKind.LAYOUT, layout_name)
+            self.env.touch_index()
@@ -1,15 +1,44 @@
 """Meta model module."""
 
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Set, Tuple
 from zoneinfo import ZoneInfo
 
 # JST 타임존 상수
 JST = ZoneInfo("Asia/Tokyo")
 
 
-@dataclass
+def intern_name(value: Optional[str]) -> Optional[str]:
+    """반복되는 식별자 문자열(템플릿/레이아웃/파셜/사용자 이름)을 인터닝합니다."""
+    if value is None:
+        return None
+    return sys.intern(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> Optional[datetime]:
+    """날짜 문자열을 datetime 객체로 변환합니다."""
+    formats = [
+        "%Y-%m-%d %H:%M:%S",  # 2024-07-01 12:34:56
+        "%Y-%m-%d",  # 2024-07-01
+        "%Y/%m/%d %H:%M:%S",  # 2024/07/01 12:34:56
+        "%Y/%m/%d",  # 2024/07/01
+    ]
+
+    for fmt in formats:
+        try:
+            dt = datetime.strptime(value, fmt)
+            return dt.replace(tzinfo=JST)
+        except ValueError:
+            continue
+
+    return None
+
+
+@dataclass(slots=True)
 class BaseMetaData:
     """기본 메타데이터를 저장하는 클래스"""
 
@@ -19,6 +48,11 @@ class BaseMetaData:
     updated_at: Optional[datetime] = None
     updated_by: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        """초기화 후 처리"""
+        self.created_by = intern_name(self.created_by)
+        self.updated_by = intern_name(self.updated_by)
+
     #     """메타데이터를 딕셔너리로 변환합니다."""
     #     return {
     #         "description": self.description or "",
@@ -38,34 +72,32 @@ class BaseMetaData:
 
     @classmethod
     def parse_datetime(cls, value: Optional[str]) -> Optional[datetime]:
-        """날짜 문자열을 datetime 객체로 변환합니다."""
+        """날짜 문자열을 datetime 객체로 변환합니다.
+
+        같은 문자열은 같은 datetime 객체를 공유합니다 (datetime은 불변).
+        """
         if not value:
             return None
-
-        formats = [
-            "%Y-%m-%d %H:%M:%S",  # 2024-07-01 12:34:56
-            "%Y-%m-%d",  # 2024-07-01
-            "%Y/%m/%d %H:%M:%S",  # 2024/07/01 12:34:56
-            "%Y/%m/%d",  # 2024/07/01
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(value, fmt)
-                return dt.replace(tzinfo=JST)
-            except ValueError:
-                continue
-
-        return None
+        return _parse_datetime(value)
 
     @classmethod
     def get_current_datetime(cls) -> datetime:
         """현재 시간을 반환합니다."""
         return datetime.now(JST)
 
+    def apply_meta(self, meta: "BaseMetaData") -> bool:
+        """다른 메타데이터의 값으로 갱신하고 변경 여부를 반환합니다."""
+        changed = False
+        for name in ("description", "created_at", "created_by", "updated_at", "updated_by"):
+            value = getattr(meta, name)
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed = True
+        return changed
+
     def to_dict(self) -> dict:
         """Convert to dictionary"""
-        return asdict(self)
+        return {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
 
     @classmethod
     def from_dict(cls, data: dict) -> Any:
@@ -73,44 +105,120 @@ class BaseMetaData:
         return cls(**data)
 
 
-@dataclass
-class LayoutMetaData(BaseMetaData):
+class ContentLoader(Protocol):
+    """본문 로더 (파서가 구현)"""
+
+    def load_content(self, meta: "ContentMetaData") -> str:
+        """메타데이터에 해당하는 본문을 읽어 반환합니다."""
+
+
+@dataclass(slots=True)
+class ContentMetaData(BaseMetaData):
+    """본문을 가진 메타데이터
+
+    본문은 메모리에 보관하지 않고, 원본 파일에서의 위치와 해시만 보관합니다.
+    `content` 접근 시 로더를 통해 본문 캐시 또는 파일에서 읽습니다.
+    """
+
+    content_hash: str = ""
+    content_start: int = 0
+    content_end: int = 0
+    _content_loader: Optional[ContentLoader] = field(default=None, repr=False, compare=False)
+
+    @property
+    def content(self) -> str:
+        """본문"""
+        if self._content_loader is None:
+            return ""
+        return self._content_loader.load_content(self)
+
+
+@dataclass(slots=True)
+class LayoutMetaData(ContentMetaData):
     """레이아웃 메타데이터를 저장하는 클래스"""
 
     name: str = ""
-    content: str = ""
+
+    def __post_init__(self) -> None:
+        """초기화 후 처리"""
+        BaseMetaData.__post_init__(self)
+        self.name = sys.intern(self.name)
 
 
-@dataclass
-class PartialMetaData(BaseMetaData):
-    """Partial metadata"""
+@dataclass(slots=True)
+class PartialMetaData(ContentMetaData):
+    """Partial metadata
+
+    부모(의존하는 파셜)/자식(의존받는 파셜) 관계는 객체 리스트 대신
+    PartialGraph의 정수 ID로 보관합니다.
+    """
 
     name: str = ""
-    content: str = ""
     dependencies: Set[str] = None  # type: ignore
-    parents: List["PartialMetaData"] = None  # type: ignore
-    children: List["PartialMetaData"] = None  # type: ignore
+    parent_ids: Tuple[int, ...] = ()
+    child_ids: Tuple[int, ...] = ()
+    _graph: Optional["PartialGraph"] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """초기화 후 처리"""
+        BaseMetaData.__post_init__(self)
+        self.name = sys.intern(self.name)
+        self.dependencies = {sys.intern(dep) for dep in self.dependencies or ()}
+
+    @property
+    def parents(self) -> List["PartialMetaData"]:
+        """부모 파셜 목록 (이 파셜이 의존하는 파셜)"""
+        if self._graph is None:
+            return []
+        return self._graph.resolve(self.parent_ids)
+
+    @property
+    def children(self) -> List["PartialMetaData"]:
+        """자식 파셜 목록 (이 파셜에 의존하는 파셜)"""
+        if self._graph is None:
+            return []
+        return self._graph.resolve(self.child_ids)
+
+
+class PartialGraph:
+    """파셜 의존성 그래프 (정수 ID 인접 리스트)"""
+
+    __slots__ = ("ids", "nodes")
+
+    def __init__(self, partials: Dict[str, PartialMetaData]) -> None:
+        """그래프를 구축하고 각 노드의 parent_ids/child_ids를 갱신합니다."""
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(partials)}
+        self.nodes: List[PartialMetaData] = list(partials.values())
+
+        children: List[List[int]] = [[] for _ in self.nodes]
+        for node_id, node in enumerate(self.nodes):
+            parent_ids = sorted(self.ids[dep] for dep in node.dependencies if dep in self.ids)
+            node.parent_ids = tuple(parent_ids)
+            for parent_id in parent_ids:
+                children[parent_id].append(node_id)
+
+        for node_id, node in enumerate(self.nodes):
+            node.child_ids = tuple(children[node_id])
+            node._graph = self  # pylint: disable=protected-access
 
-    def __post_init__(self):
-        if self.dependencies is None:
-            self.dependencies = set()
-        if self.parents is None:
-            self.parents = []
-        if self.children is None:
-            self.children = []
+    def resolve(self, node_ids: Tuple[int, ...]) -> List[PartialMetaData]:
+        """ID 목록을 노드 목록으로 변환합니다."""
+        return [self.nodes[node_id] for node_id in node_ids]
 
 
-@dataclass
-class TemplateComponentMetaData(BaseMetaData):
+@dataclass(slots=True)
+class TemplateComponentMetaData(ContentMetaData):
     """템플릿 메타데이터를 저장하는 클래스"""
 
     template: str = ""
     component: str = ""
-    content: str = ""
     layout: Optional[str] = None
     partials: List[str] = None  # type: ignore
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         """초기화 후 처리"""
-        if self.partials is None:
-            self.partials = []
+        BaseMetaData.__post_init__(self)
+        self.template = sys.intern(self.template)
+        self.component = sys.intern(self.component)
+        self.layout = intern_name(self.layout)
+        self.partials = [sys.intern(partial) for partial in self.partials or ()]
@@ -9,14 +9,21 @@ from typing import List, Optional, Set
 
 from jinja2 import nodes
 
+from temply_app.core.content_cache import compute_content_hash, locate_content
 from temply_app.core.exceptions import (
     PartialAlreadyExistsError,
     PartialCircularDependencyError,
     PartialNotFoundError,
 )
-from temply_app.core.temply.parser.meta_model import BaseMetaData, PartialMetaData
+from temply_app.core.search_index import SearchKind
+from temply_app.core.temply.parser.meta_model import (
+    BaseMetaData,
+    ContentMetaData,
+    PartialGraph,
+    PartialMetaData,
+)
 from temply_app.core.temply.temply_env import TemplyEnv
-from temply_app.core.utils import parser_meta_util
+from temply_app.core.utils import file_util, parser_meta_util
 from temply_app.models.common_model import User
 
 
@@ -31,6 +38,7 @@ class PartialParser:
         """
         self.env = temply_env
         self.nodes: dict[str, PartialMetaData] = {}
+        self.graph: PartialGraph = PartialGraph(self.nodes)
         self._initialized = False
         self._init_task = None
 
@@ -106,13 +114,20 @@ class PartialParser:
             PartialMetaData: Parsed partial metadata
         """
         try:
-            content, _, _ = self.env.load_partial_source(partial_name)
-            meta, block = parser_meta_util.parse(content)
-            dependencies, block = await self._extract_dependencies(block)
-            block = await self._remove_macro_wrapper(block)
+            source, _, _ = self.env.load_partial_source(partial_name)
+            meta, dependencies, content = self._split_partial(source)
+            content_start, content_end = locate_content(source, content)
+            self.env.search_index.add(
+                SearchKind.PARTIAL,
+                partial_name,
+                {"name": partial_name, "description": meta.description, "content": content},
+            )
             return PartialMetaData(
                 name=partial_name,
-                content=block,
+                content_hash=compute_content_hash(content),
+                content_start=content_start,
+                content_end=content_end,
+                _content_loader=self,
                 dependencies=dependencies,
                 description=meta.description,
                 created_at=meta.created_at,
@@ -123,7 +138,24 @@ class PartialParser:
         except FileNotFoundError as e:
             raise PartialNotFoundError(f"Partial {partial_name} not found: {e}") from e
 
-    async def _remove_macro_wrapper(self, content: str) -> str:
+    def _split_partial(self, source: str) -> tuple[BaseMetaData, Set[str], str]:
+        """파셜 소스를 메타데이터, 의존성, 본문으로 분리합니다."""
+        meta, block = parser_meta_util.parse(source)
+        dependencies, block = self._extract_dependencies(block)
+        return meta, dependencies, self._remove_macro_wrapper(block)
+
+    def load_content(self, meta: ContentMetaData) -> str:
+        """파셜 본문 조회 (본문 캐시 또는 파일)"""
+        assert isinstance(meta, PartialMetaData)
+        return self.env.content_cache.load(
+            meta.content_hash,
+            meta.content_start,
+            meta.content_end,
+            lambda: self.env.load_partial_source(meta.name)[0],
+            lambda source: self._split_partial(source)[2],
+        )
+
+    def _remove_macro_wrapper(self, content: str) -> str:
         """매크로 래퍼를 제거합니다.
 
         Args:
@@ -139,7 +171,7 @@ class PartialParser:
                 return "\n".join(content.splitlines()[1:-1])
         return content
 
-    async def _extract_dependencies(self, content: str) -> tuple[Set[str], str]:
+    def _extract_dependencies(self, content: str) -> tuple[Set[str], str]:
         """Extract dependencies from partial content using AST.
 
         Args:
@@ -183,28 +215,72 @@ class PartialParser:
         for file_info in partials:
             self.nodes[file_info.name] = file_info
 
-        # Second pass: Build parent-child relationships
-        for node in self.nodes.values():
-            # 의존성 분석
-            for dep_name in node.dependencies:
-                if dep_name in self.nodes:
-                    dep_node = self.nodes[dep_name]
-                    # 의존하는 노드가 부모가 됨
-                    if dep_node not in node.parents:
-                        node.parents.append(dep_node)
-                    # 현재 노드가 의존하는 노드의 자식이 됨
-                    if node not in dep_node.children:
-                        dep_node.children.append(node)
+        # Second pass: Build parent-child relationships (정수 ID 인접 리스트)
+        # 의존하는 노드가 부모가 되고, 현재 노드는 의존하는 노드의 자식이 됨
+        self.graph = PartialGraph(self.nodes)
 
     async def refresh(self) -> None:
         """Refresh the dependency tree."""
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
             self.nodes = {}
-            await self._build_dependency_tree(await self._parse_partial_files())
-        finally:
-            self._initialized = True
+            self.env.search_index.remove_kind(SearchKind.PARTIAL)
+            try:
+                await self._build_dependency_tree(await self._parse_partial_files())
+            finally:
+                # 다시 읽다가 실패해도 인덱스를 비웠으므로 세대 증가
+                self.env.touch_index()
+
+    async def apply_changes(self, changed: Set[str], removed: Set[str]) -> int:
+        """외부에서 변경된 파셜만 다시 파싱하고 의존성 그래프 재구축
+
+        Args:
+            changed: 추가/수정된 파셜 이름
+            removed: 삭제된 파셜 이름
+
+        Returns:
+            int: 반영한 파셜 수
+        """
+        await self._ensure_initialized()
+        if not changed and not removed:
+            return 0
+        async with self.env.rw_lock.write():
+            for partial_name in removed | changed:
+                if self.nodes.pop(partial_name, None) is not None:
+                    self.env.search_index.remove(SearchKind.PARTIAL, partial_name)
+            partials = []
+            for partial_name in changed:
+                try:
+                    partials.append(await self._parse_partial(partial_name))
+                except (PartialNotFoundError, OSError):
+                    # 확인 후 다시 삭제된 파일
+                    continue
+            await self._build_dependency_tree(partials)
+            self.env.touch_index()
+        return len(changed | removed)
+
+    async def refresh_metadata(self) -> int:
+        """메타데이터만 갱신 (본문과 의존성은 읽지 않음)
+
+        Returns:
+            int: 메타데이터가 변경된 파트 수
+        """
+        await self._ensure_initialized()
+        changed = 0
+        async with self.env.rw_lock.write():
+            for partial in self.nodes.values():
+                try:
+                    meta = self.env.read_partial_meta(partial.name)
+                except FileNotFoundError:
+                    continue
+                if partial.apply_meta(meta):
+                    self.env.search_index.update_field(
+                        SearchKind.PARTIAL, partial.name, "description", meta.description
+                    )
+                    changed += 1
+            if changed:
+                self.env.touch_index()
+        return changed
 
     async def get_partials(self) -> List[PartialMetaData]:
         """List all partials.
@@ -213,7 +289,8 @@ class PartialParser:
             List of all partials
         """
         await self._ensure_initialized()
-        return list(self.nodes.values())
+        async with self.env.rw_lock.read():
+            return list(self.nodes.values())
 
     async def get_partial(self, name: str) -> PartialMetaData:
         """Get a partial by name.
@@ -222,7 +299,8 @@ class PartialParser:
             name: Name of the partial
         """
         await self._ensure_initialized()
-        partial = self.nodes.get(name)
+        async with self.env.rw_lock.read():
+            partial = self.nodes.get(name)
         if partial is None:
             raise PartialNotFoundError(f"Partial {name} not found")
         return partial
@@ -289,7 +367,8 @@ class PartialParser:
             List of root nodes
         """
         await self._ensure_initialized()
-        return [node for node in self.nodes.values() if not node.parents]
+        async with self.env.rw_lock.read():
+            return [node for node in self.nodes.values() if not node.parents]
 
     async def print_tree(self, node: Optional[PartialMetaData] = None, level: int = 0) -> None:
         """Print the dependency tree.
@@ -331,15 +410,16 @@ class PartialParser:
 
         await self._check_circular_dependency(partial_name, dependencies)
 
-        with open(self.env.partials_dir / partial_name, "w", encoding=self.env.file_encoding) as f:
-            f.write(self.env.format_meta_block(meta))
-            if dependencies:
-                for dep in self.env.format_partial_imports(dependencies):
-                    f.write("\n")
-                    f.write(dep)
-            f.write("\n")
-            f.write(self.env.format_partial_content(content))
-            f.write("\n")
+        lines = [self.env.format_meta_block(meta)]
+        if dependencies:
+            lines.extend(self.env.format_partial_imports(dependencies))
+        lines.append(self.env.format_partial_content(content))
+        file_util.write_text_atomic(
+            self.env.partials_dir / partial_name,
+            "\n".join(lines) + "\n",
+            self.env.file_encoding,
+        )
+        self.env.invalidate_manifest()
 
     async def create(
         self,
@@ -359,8 +439,8 @@ class PartialParser:
             dependencies: Dependencies of the partial
         """
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             if not self.env.validate_file_name(partial_name):
                 raise ValueError(f"Invalid partial name: {partial_name}")
 
@@ -380,12 +460,9 @@ class PartialParser:
             await self._write_partial(partial_name, content, meta, dependencies)
 
             # 새로운 파셜을 파싱하고 의존성 트리 재구축
-            new_partial = await self._parse_partial(partial_name)
-            self.nodes[partial_name] = new_partial
-            await self._build_dependency_tree(list(self.nodes.values()))
+            await self._build_dependency_tree([await self._parse_partial(partial_name)])
+            self.env.touch_index()
             return self.nodes[partial_name]
-        finally:
-            self._initialized = True
 
     async def update(
         self,
@@ -397,15 +474,15 @@ class PartialParser:
     ) -> PartialMetaData:
         """Update a partial."""
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             if partial_name not in self.nodes:
                 raise PartialNotFoundError(f"Partial {partial_name} not found")
 
             if not (self.env.partials_dir / partial_name).exists():
                 raise PartialNotFoundError(f"Partial {partial_name} not found")
 
-            partial = await self.get_partial(partial_name)
+            partial = self.nodes[partial_name]
             meta = BaseMetaData(
                 description=description,
                 created_at=partial.created_at,
@@ -416,21 +493,22 @@ class PartialParser:
 
             await self._write_partial(partial_name, content, meta, dependencies)
 
-            self.nodes[partial_name] = await self._parse_partial(partial_name)
+            await self._build_dependency_tree([await self._parse_partial(partial_name)])
+            self.env.touch_index()
             return self.nodes[partial_name]
-        finally:
-            self._initialized = True
 
     async def delete(self, user: User, partial_name: str) -> None:
         """Delete a partial."""
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             if partial_name not in self.nodes:
                 raise PartialNotFoundError(f"Partial {partial_name} not found")
             if not (self.env.partials_dir / partial_name).exists():
                 raise PartialNotFoundError(f"Partial {partial_name} not found")
             os.remove(self.env.partials_dir / partial_name)
+            self.env.invalidate_manifest()
             del self.nodes[partial_name]
-        finally:
-            self._initialized = True
+            self.env.search_index.remove(SearchKind.PARTIAL, partial_name)
+            await self._build_dependency_tree([])
+            self.env.touch_index()
@@ -11,15 +11,21 @@ from typing import Any, List, Optional, Set
 
 from jinja2 import nodes
 
+from temply_app.core.content_cache import compute_content_hash, locate_content
 from temply_app.core.exceptions import (
     LayoutNotFoundError,
     PartialNotFoundError,
     TemplateAlreadyExistsError,
     TemplateNotFoundError,
 )
-from temply_app.core.temply.parser.meta_model import BaseMetaData, TemplateComponentMetaData
+from temply_app.core.search_index import SearchKind
+from temply_app.core.temply.parser.meta_model import (
+    BaseMetaData,
+    ContentMetaData,
+    TemplateComponentMetaData,
+)
 from temply_app.core.temply.temply_env import TemplyEnv
-from temply_app.core.utils import parser_meta_util
+from temply_app.core.utils import file_util, parser_meta_util
 from temply_app.models.common_model import User
 
 
@@ -77,14 +83,25 @@ class TemplateParser:
             TemplateComponentMetaData: Parsed component metadata
         """
         try:
-            content, _, _ = self.env.load_component_source(template_name, component_name)
-            meta, block = parser_meta_util.parse(content)
-            layout, block = await self._extract_layout(block)
-            partials, block = await self._extract_partials(block)
+            source, _, _ = self.env.load_component_source(template_name, component_name)
+            meta, layout, partials, content = self._split_component(source)
+            content_start, content_end = locate_content(source, content)
+            self.env.search_index.add(
+                SearchKind.COMPONENT,
+                f"{template_name}/{component_name}",
+                {
+                    "name": f"{template_name} {component_name}",
+                    "description": meta.description,
+                    "content": content,
+                },
+            )
             return TemplateComponentMetaData(
                 template=template_name,
                 component=component_name,
-                content=block.strip(),
+                content_hash=compute_content_hash(content),
+                content_start=content_start,
+                content_end=content_end,
+                _content_loader=self,
                 layout=layout,
                 partials=partials,
                 description=meta.description,
@@ -98,6 +115,24 @@ class TemplateParser:
                 f"Template {template_name}/{component_name} not found: {e}"
             ) from e
 
+    def _split_component(self, source: str) -> tuple[BaseMetaData, str, List[str], str]:
+        """컴포넌트 소스를 메타데이터, 레이아웃, 파셜, 본문으로 분리합니다."""
+        meta, block = parser_meta_util.parse(source)
+        layout, block = self._extract_layout(block)
+        partials, block = self._extract_partials(block)
+        return meta, layout, partials, block.strip()
+
+    def load_content(self, meta: ContentMetaData) -> str:
+        """컴포넌트 본문 조회 (본문 캐시 또는 파일)"""
+        assert isinstance(meta, TemplateComponentMetaData)
+        return self.env.content_cache.load(
+            meta.content_hash,
+            meta.content_start,
+            meta.content_end,
+            lambda: self.env.load_component_source(meta.template, meta.component)[0],
+            lambda source: self._split_component(source)[3],
+        )
+
     async def _parse_component_files(self) -> List[TemplateComponentMetaData]:
         """Parse component files and extract metadata.
 
@@ -120,7 +155,7 @@ class TemplateParser:
         for component in components:
             self.nodes[component.template + "/" + component.component] = component
 
-    async def _extract_layout(self, content: str) -> tuple[str, str]:
+    def _extract_layout(self, content: str) -> tuple[str, str]:
         """Extract layout from component content using AST.
 
         Args:
@@ -140,7 +175,7 @@ class TemplateParser:
 
         return "", content
 
-    async def _extract_partials(self, content: str) -> tuple[List[str], str]:
+    def _extract_partials(self, content: str) -> tuple[List[str], str]:
         """Extract partials from component content using AST.
 
         Args:
@@ -162,15 +197,72 @@ class TemplateParser:
 
         return partials, "\n".join(content.splitlines()[last_import_line:])
 
+    async def refresh_metadata(self) -> int:
+        """메타데이터만 갱신 (본문, 레이아웃, 파트는 읽지 않음)
+
+        Returns:
+            int: 메타데이터가 변경된 컴포넌트 수
+        """
+        await self._ensure_initialized()
+        changed = 0
+        async with self.env.rw_lock.write():
+            for component in self.nodes.values():
+                try:
+                    meta = self.env.read_component_meta(component.template, component.component)
+                except FileNotFoundError:
+                    continue
+                if component.apply_meta(meta):
+                    self.env.search_index.update_field(
+                        SearchKind.COMPONENT,
+                        f"{component.template}/{component.component}",
+                        "description",
+                        meta.description,
+                    )
+                    changed += 1
+            if changed:
+                self.env.touch_index()
+        return changed
+
+    async def apply_changes(self, changed: Set[str], removed: Set[str]) -> int:
+        """외부에서 변경된 컴포넌트만 다시 파싱
+
+        Args:
+            changed: 추가/수정된 컴포넌트 경로 (템플릿/컴포넌트)
+            removed: 삭제된 컴포넌트 경로 (템플릿/컴포넌트)
+
+        Returns:
+            int: 반영한 컴포넌트 수
+        """
+        await self._ensure_initialized()
+        if not changed and not removed:
+            return 0
+        async with self.env.rw_lock.write():
+            for component_path in removed | changed:
+                if self.nodes.pop(component_path, None) is not None:
+                    self.env.search_index.remove(SearchKind.COMPONENT, component_path)
+            components = []
+            for component_path in changed:
+                template_name, _, component_name = component_path.partition("/")
+                try:
+                    components.append(await self._parse_component(template_name, component_name))
+                except (TemplateNotFoundError, OSError):
+                    # 확인 후 다시 삭제된 파일
+                    continue
+            await self._build_component_tree(components)
+            self.env.touch_index()
+        return len(changed | removed)
+
     async def get_templates(self) -> List[TemplateComponentMetaData]:
         """Get all templates."""
         await self._ensure_initialized()
-        return list(self.nodes.values())
+        async with self.env.rw_lock.read():
+            return list(self.nodes.values())
 
     async def get_template_names(self) -> List[str]:
         """Get all templates."""
         await self._ensure_initialized()
-        return list(set(template.template for template in self.nodes.values()))
+        async with self.env.rw_lock.read():
+            return list(set(template.template for template in self.nodes.values()))
 
     async def get_components(self) -> List[TemplateComponentMetaData]:
         """List all components.
@@ -179,47 +271,65 @@ class TemplateParser:
             List of all components
         """
         await self._ensure_initialized()
-        return list(self.nodes.values())
+        async with self.env.rw_lock.read():
+            return list(self.nodes.values())
 
     async def get_components_by_template(
         self, template_name: str
     ) -> List[TemplateComponentMetaData]:
         """Get all components in a template."""
         await self._ensure_initialized()
-        return [
-            component for component in self.nodes.values() if component.template == template_name
-        ]
+        async with self.env.rw_lock.read():
+            return [
+                component
+                for component in self.nodes.values()
+                if component.template == template_name
+            ]
 
     async def sync_schema(self, template_name: str) -> str | None:
         """Sync schema by template."""
         await self._ensure_initialized()
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
+            schema_path = await self._sync_schema(template_name)
+            if schema_path is not None:
+                self.env.touch_index()
+            return schema_path
+
+    async def _sync_schema(self, template_name: str) -> str | None:
+        """Sync schema by template (락 없이 호출)."""
         load_schema_source = self.env.load_schema_source(template_name)
         schema = self.env.get_template_schema(template_name)
         if schema == load_schema_source:
             return None
         schema_path = self.env.templates_dir / self.env.build_component_schema_path(template_name)
-        with open(schema_path, "w", encoding=self.env.file_encoding) as f:
-            json.dump(schema, f, indent=2, ensure_ascii=False)
+        file_util.write_text_atomic(
+            schema_path, json.dumps(schema, indent=2, ensure_ascii=False), self.env.file_encoding
+        )
+        self.env.invalidate_manifest()
         return f"{template_name}/{schema_path.name}"
 
     async def get_schema_by_template(self, template_name: str) -> dict[str, Any]:
         """Get schema by template."""
         await self._ensure_initialized()
-        return self.env.load_schema_source(template_name)
+        async with self.env.rw_lock.read():
+            return self.env.load_schema_source(template_name)
 
     async def get_variables_by_template(self, template_name: str) -> dict[str, Any]:
         """Get variables by template."""
         await self._ensure_initialized()
-        return self.env.get_template_schema_generator(template_name)
+        async with self.env.rw_lock.read():
+            return self.env.get_template_schema_generator(template_name)
 
     async def get_component_names_by_template(self, template_name: str) -> List[str]:
         """Get all component names in a template."""
         await self._ensure_initialized()
-        return [
-            component.component
-            for component in self.nodes.values()
-            if component.template == template_name
-        ]
+        async with self.env.rw_lock.read():
+            return [
+                component.component
+                for component in self.nodes.values()
+                if component.template == template_name
+            ]
 
     async def get_component(
         self, template_name: str, component_name: str
@@ -230,7 +340,8 @@ class TemplateParser:
             name: Name of the template
         """
         await self._ensure_initialized()
-        component = self.nodes.get(template_name + "/" + component_name)
+        async with self.env.rw_lock.read():
+            component = self.nodes.get(template_name + "/" + component_name)
         if not component:
             raise TemplateNotFoundError(f"Template {template_name}/{component_name} not found")
         return component
@@ -312,8 +423,8 @@ class TemplateParser:
 
         """
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             if not self.env.validate_file_name(template_name):
                 raise ValueError(f"Invalid template name: {template_name}")
 
@@ -351,9 +462,8 @@ class TemplateParser:
                 template_name, component_name, content, layout or "", partials or [], meta
             )
             self.nodes[component_path] = await self._parse_component(template_name, component_name)
+            self.env.touch_index()
             return self.nodes[component_path]
-        finally:
-            self._initialized = True
 
     async def _write_component(
         self,
@@ -369,22 +479,18 @@ class TemplateParser:
         template_dir = self.env.templates_dir / template_name
         template_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(
+        lines = [self.env.format_meta_block(meta)]
+        if layout:
+            lines.append(self.env.format_layout_block(layout))
+        if partials:
+            lines.extend(self.env.format_partial_imports(set(partials)))
+        lines.append(content)
+        file_util.write_text_atomic(
             template_dir / f"{component_name}",
-            "w",
-            encoding=self.env.file_encoding,
-        ) as f:
-            f.write(self.env.format_meta_block(meta))
-            if layout:
-                f.write("\n")
-                f.write(self.env.format_layout_block(layout))
-            if partials:
-                for partial in self.env.format_partial_imports(set(partials)):
-                    f.write("\n")
-                    f.write(partial)
-            f.write("\n")
-            f.write(content)
-            f.write("\n")
+            "\n".join(lines) + "\n",
+            self.env.file_encoding,
+        )
+        self.env.invalidate_manifest()
 
     async def update_component(
         self,
@@ -405,9 +511,8 @@ class TemplateParser:
             meta: Component metadata
         """
         await self._ensure_initialized()
-        self._initialized = False
-
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             if not self.env.validate_file_name(template_name):
                 raise ValueError(f"Invalid template name: {template_name}")
 
@@ -429,7 +534,7 @@ class TemplateParser:
             if not (self.env.templates_dir / component_path).exists():
                 raise TemplateNotFoundError(f"Template {component_path} not found")
 
-            _component = await self.get_component(template_name, component_name)
+            _component = self.nodes[component_path]
             meta = BaseMetaData(
                 description=description,
                 created_at=_component.created_at,
@@ -442,11 +547,9 @@ class TemplateParser:
                 template_name, component_name, content, layout or "", partials or [], meta
             )
             self.nodes[component_path] = await self._parse_component(template_name, component_name)
+            self.env.touch_index()
             return self.nodes[component_path]
 
-        finally:
-            self._initialized = True
-
     async def delete_component(self, user: User, template_name: str, component_name: str) -> None:
         """Delete a component.
 
@@ -455,11 +558,10 @@ class TemplateParser:
             component_name: Component name
         """
         await self._ensure_initialized()
-        self._initialized = False
-        try:
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
             await self._delete_component(user, template_name, component_name)
-        finally:
-            self._initialized = True
+            self.env.touch_index()
 
     async def _delete_component(self, user: User, template_name: str, component_name: str) -> None:
         """Delete a component.
@@ -474,28 +576,41 @@ class TemplateParser:
         if not (self.env.templates_dir / component_path).exists():
             raise TemplateNotFoundError(f"Template {component_path} not found")
         os.remove(self.env.templates_dir / component_path)
+        self.env.invalidate_manifest()
         del self.nodes[component_path]
+        self.env.search_index.remove(SearchKind.COMPONENT, component_path)
 
     async def delete_components_by_template(self, user: User, template_name: str) -> None:
         """Delete components by template."""
         await self._ensure_initialized()
-        self._initialized = False
-        try:
-            for component_name in self.env.get_component_names(template_name):
-                await self._delete_component(user, template_name, component_name)
-            shutil.rmtree(self.env.templates_dir / template_name)
-        finally:
-            self._initialized = True
+        async with self.env.rw_lock.write():
+            self.env.ensure_writable()
+            changed = False
+            try:
+                for component_name in self.env.get_component_names(template_name):
+                    await self._delete_component(user, template_name, component_name)
+                    changed = True
+                shutil.rmtree(self.env.templates_dir / template_name)
+                self.env.invalidate_manifest()
+                changed = True
+            finally:
+                # 도중에 실패해도 이미 삭제한 컴포넌트가 있으면 인덱스가 바뀐 것으로 표시
+                if changed:
+                    self.env.touch_index()
 
     async def render_component(
         self, template_name: str, component_name: str, data: dict[str, Any]
     ) -> str:
         """Render Component"""
-        return self.env.render_component(template_name, component_name, data)
+        async with self.env.rw_lock.read():
+            return self.env.render_component(template_name, component_name, data)
 
     async def get_components_using_layout(
         self, layout_name: str
     ) -> List[TemplateComponentMetaData]:
         """Get components using layout."""
         await self._ensure_initialized()
-        return [component for component in self.nodes.values() if component.layout == layout_name]
+        async with self.env.rw_lock.read():
+            return [
+                component for component in self.nodes.values() if component.layout == layout_name
+            ]
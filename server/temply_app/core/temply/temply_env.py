@@ -2,19 +2,34 @@
 
 import json
 import re
+import threading
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, Set
-
-from jinja2 import Environment, FileSystemLoader, PrefixLoader, StrictUndefined, Template, nodes
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemLoader,
+    PrefixLoader,
+    StrictUndefined,
+    Template,
+    nodes,
+)
 from jinja2schema.model import Dictionary  # type: ignore
 from markupsafe import escape
 
 from temply_app.core.config import Config
+from temply_app.core.content_cache import ContentCache, get_content_cache
+from temply_app.core.exceptions import ReadOnlyEnvError
+from temply_app.core.rw_lock import AsyncRWLock
+from temply_app.core.search_index import SearchIndex
+from temply_app.core.temply.manifest import Manifest, scan_manifest, tree_hash
 from temply_app.core.temply.parser.meta_model import JST, BaseMetaData
 from temply_app.core.temply.schema.generator import infer_from_ast, to_json_schema
 from temply_app.core.temply.schema.mergers import merge
 from temply_app.core.temply.schema.utils import generate_object
+from temply_app.core.utils import parser_meta_util
 
 
 class TemplateComponents(str, Enum):
@@ -57,7 +72,31 @@ class TemplyEnv:
 
         self.schema_filename: str = "schema.json"
         self.file_encoding: str = config.file_encoding
+        # 읽기 전용 환경(git 커밋 등)은 파서의 생성/수정/삭제를 허용하지 않음
+        self.read_only: bool = False
+
+        self._prepare_dirs()
 
+        self.env = self._get_env()
+
+        # 파서(템플릿/파셜/레이아웃)가 공유하는 버전 단위 읽기/쓰기 락
+        self.rw_lock: AsyncRWLock = AsyncRWLock()
+        # 파서 인덱스는 본문을 보관하지 않고 이 캐시를 통해 필요할 때 읽음
+        self.content_cache: ContentCache = get_content_cache(config)
+        # 파서 인덱스 변경 세대 (해시 트리 등 파생 인덱스의 재사용 여부 판단에 사용)
+        self.index_generation: int = 0
+        # 파서 쓰기 경로에서 갱신되는 전문 검색 인덱스
+        self.search_index: SearchIndex = SearchIndex()
+        # 디렉토리 순회 결과 (처음 필요할 때 생성, 파일 변경 시 무효화)
+        self._manifest: Optional[Manifest] = None
+        # (매니페스트, 트리 해시) - 같은 매니페스트의 해시 재계산 방지
+        self._tree_hash: Optional[Tuple[Manifest, str]] = None
+        # 이 환경의 파일로 만든 파서/파생 인덱스 (cache_util에서 관리, 환경과 함께 폐기)
+        self.derived: Dict[str, Any] = {}
+        self.derived_lock = threading.Lock()
+
+    def _prepare_dirs(self) -> None:
+        """버전 디렉토리 경로 설정 및 확인 (로컬 환경에서는 없으면 생성)"""
         if not (Path(str(self._config.noti_temply_dir))).exists():
             raise FileNotFoundError(f"path {self._config.noti_temply_dir} not found")
 
@@ -84,23 +123,21 @@ class TemplyEnv:
             self.partials_dir = Path(str(self._config.noti_temply_dir)) / self.partials_dir_name
 
         if not self.templates_dir.exists():
-            if config.is_local():
+            if self._config.is_local():
                 self.templates_dir.mkdir(parents=True, exist_ok=True)
             else:
                 raise FileNotFoundError(f"path {self.templates_dir} not found")
         if not self.layouts_dir.exists():
-            if config.is_local():
+            if self._config.is_local():
                 self.layouts_dir.mkdir(parents=True, exist_ok=True)
             else:
                 raise FileNotFoundError(f"path {self.layouts_dir} not found")
         if not self.partials_dir.exists():
-            if config.is_local():
+            if self._config.is_local():
                 self.partials_dir.mkdir(parents=True, exist_ok=True)
             else:
                 raise FileNotFoundError(f"path {self.partials_dir} not found")
 
-        self.env = self._get_env()
-
     def _environment_options(self) -> tuple[dict[str, Any], dict[str, Any]]:
         """테스트 환경 설정"""
 
@@ -115,28 +152,78 @@ class TemplyEnv:
             "cache_size": 100,
         }
 
+    def _create_loader(self) -> BaseLoader:
+        """템플릿 로더 생성"""
+        return PrefixLoader(
+            {
+                "templates": FileSystemLoader(str(self.templates_dir)),
+                "layouts": FileSystemLoader(str(self.layouts_dir)),
+                "partials": FileSystemLoader(str(self.partials_dir)),
+            }
+        )
+
     def _get_env(self) -> Environment:
         """템플릿 환경 조회"""
         kwargs, filters = self._environment_options()
         _env = Environment(
-            loader=PrefixLoader(
-                {
-                    "templates": FileSystemLoader(str(self.templates_dir)),
-                    "layouts": FileSystemLoader(str(self.layouts_dir)),
-                    "partials": FileSystemLoader(str(self.partials_dir)),
-                }
-            ),
+            loader=self._create_loader(),
             **kwargs,
             auto_reload=self._config.is_dev(),
         )
         _env.filters.update(filters)
         return _env
 
+    def get_manifest(self) -> Manifest:
+        """버전 파일 매니페스트 조회"""
+        manifest = self._manifest
+        if manifest is None:
+            manifest = scan_manifest(
+                self.templates_dir,
+                self.layouts_dir,
+                self.partials_dir,
+                self.templates_dir_name,
+                self.layouts_dir_name,
+                self.partials_dir_name,
+                self.schema_filename,
+            )
+            self._manifest = manifest
+        return manifest
+
+    def get_tree_hash(self) -> str:
+        """버전 파일 트리 해시 (경로, 크기, 수정 시간 기반, 목록/스키마 응답의 ETag에 사용)"""
+        manifest = self.get_manifest()
+        cached = self._tree_hash
+        if cached is None or cached[0] is not manifest:
+            cached = self._tree_hash = (manifest, tree_hash(manifest))
+        return cached[1]
+
+    def invalidate_manifest(self) -> None:
+        """매니페스트 무효화 (파일 생성/수정/삭제 후 호출)"""
+        self._manifest = None
+
+    def clear_template_cache(self) -> None:
+        """컴파일된 템플릿 캐시 삭제 (외부에서 파일이 변경된 경우 호출)"""
+        if self.env.cache is not None:
+            self.env.cache.clear()
+
+    def ensure_writable(self) -> None:
+        """쓰기 가능 여부 확인
+
+        Raises:
+            ReadOnlyEnvError: 읽기 전용 환경인 경우
+        """
+        if self.read_only:
+            raise ReadOnlyEnvError(f"Version {self.applied_version} is read-only")
+
+    def touch_index(self) -> None:
+        """파서 인덱스 변경 세대 증가"""
+        self.index_generation += 1
+
     def load_schema_source(self, template_name: str) -> dict[str, Any]:
         """스키마 소스 조회"""
-        schema_path = self.templates_dir / template_name / self.schema_filename
-        if not schema_path.exists():
+        if template_name not in self.get_manifest().schemas:
             return {}
+        schema_path = self.templates_dir / template_name / self.schema_filename
         with open(
             schema_path,
             "r",
@@ -168,6 +255,20 @@ class TemplyEnv:
         """템플릿 소스 경로 조회"""
         return self.load_source(self.build_component_path(template_name, component_name))
 
+    def read_layout_meta(self, layout_name: str) -> BaseMetaData:
+        """레이아웃 메타데이터 조회 (헤더만 읽음)"""
+        return parser_meta_util.read_meta(self.layouts_dir / layout_name, self.file_encoding)
+
+    def read_partial_meta(self, partial_name: str) -> BaseMetaData:
+        """파트 메타데이터 조회 (헤더만 읽음)"""
+        return parser_meta_util.read_meta(self.partials_dir / partial_name, self.file_encoding)
+
+    def read_component_meta(self, template_name: str, component_name: str) -> BaseMetaData:
+        """템플릿 컴포넌트 메타데이터 조회 (헤더만 읽음)"""
+        return parser_meta_util.read_meta(
+            self.templates_dir / template_name / component_name, self.file_encoding
+        )
+
     # def get_layout_template(self, layout_name: str) -> Template:
     #     """레이아웃 조회"""
     #     return self.env.get_template(self._build_layout_path(layout_name))
@@ -206,29 +307,14 @@ class TemplyEnv:
 
     def get_template_names(self) -> list[str]:
         """템플릿 목록 조회"""
-        items: list[str] = []
-        for item in self.templates_dir.iterdir():
-            if item.is_file() or item.name.startswith("."):  # .DS_Store 파일 제외
-                continue
-            items.append(item.name)
-        return items
+        return list(self.get_manifest().components)
 
     def get_component_names(self, template_name: str) -> list[str]:
         """템플릿 컴포넌트 목록 조회"""
-        components: list[str] = []
-        template_dir = self.templates_dir / template_name
-        if not template_dir.exists():
+        components = self.get_manifest().components.get(template_name)
+        if components is None:
             raise ValueError(f"Template {template_name} not found")
-
-        for item in template_dir.iterdir():
-            if not item.is_file():
-                continue
-            if item.name.startswith("."):  # .DS_Store 파일 제외
-                continue
-            if item.suffix == ".json":  # 스키마 파일 제외
-                continue
-            components.append(item.name)
-        return components
+        return list(components)
 
     def get_template_schema(self, template_name: str) -> Dict[str, Any]:
         """템플릿 컴포넌트 스키마 조회"""
@@ -272,12 +358,7 @@ class TemplyEnv:
 
     def get_layout_names(self) -> list[str]:
         """레이아웃 목록 조회"""
-        items: list[str] = []
-        for item in self.layouts_dir.iterdir():
-            if not item.is_file():
-                continue
-            items.append(item.name)
-        return items
+        return list(self.get_manifest().layouts)
 
     def build_layout_path(self, layout_name: str) -> str:
         """레이아웃 경로 조회"""
@@ -285,12 +366,7 @@ class TemplyEnv:
 
     def get_partial_names(self) -> list[str]:
         """파트 목록 조회"""
-        items: list[str] = []
-        for item in self.partials_dir.iterdir():
-            if not item.is_file():
-                continue
-            items.append(item.name)
-        return items
+        return list(self.get_manifest().partials)
 
     def build_partial_path(self, partial_name: str) -> str:
         """파트 경로 조회"""
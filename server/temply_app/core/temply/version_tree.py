@@ -0,0 +1,180 @@
+"""
+버전 해시 트리
+
+파서 인덱스(레이아웃/파셜/템플릿 컴포넌트)로 Merkle 트리를 만들어 두 버전을 비교합니다.
+루트 -> 종류(layouts/partials/templates) -> (템플릿) -> 항목 순으로 해시를 합성하므로,
+해시가 같은 하위 트리는 내려가지 않고 건너뜁니다.
+트리는 버전 환경에 인덱스 변경 세대와 함께 보관합니다.
+"""
+
+import hashlib
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from temply_app.core.temply.parser.meta_model import (
+    LayoutMetaData,
+    PartialMetaData,
+    TemplateComponentMetaData,
+)
+from temply_app.core.temply.temply_env import TemplyEnv
+
+LAYOUTS = "layouts"
+PARTIALS = "partials"
+TEMPLATES = "templates"
+
+
+@dataclass(frozen=True, slots=True)
+class HashNode:
+    """해시 트리 노드 (잎 노드는 children이 비어 있음)"""
+
+    digest: str
+    children: Dict[str, "HashNode"] = field(default_factory=dict)
+
+
+def _digest(*parts: object) -> str:
+    text = "\0".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _branch(children: Dict[str, HashNode]) -> HashNode:
+    """하위 노드 해시를 이름 순으로 합성"""
+    return HashNode(
+        _digest(*(f"{name}:{node.digest}" for name, node in sorted(children.items()))), children
+    )
+
+
+def build_version_tree(
+    layouts: Mapping[str, LayoutMetaData],
+    partials: Mapping[str, PartialMetaData],
+    components: Mapping[str, TemplateComponentMetaData],
+) -> HashNode:
+    """파서 인덱스로 해시 트리 생성
+
+    작성자/수정 시간은 렌더링 결과에 영향이 없으므로 제외하고,
+    본문 해시, 설명, 의존성(레이아웃/파셜)만 해시에 포함합니다.
+    """
+    layout_nodes = {
+        name: HashNode(_digest(record.content_hash, record.description))
+        for name, record in layouts.items()
+    }
+    partial_nodes = {
+        name: HashNode(
+            _digest(record.content_hash, record.description, *sorted(record.dependencies))
+        )
+        for name, record in partials.items()
+    }
+    templates: Dict[str, Dict[str, HashNode]] = {}
+    for record in components.values():
+        templates.setdefault(record.template, {})[record.component] = HashNode(
+            _digest(record.content_hash, record.description, record.layout, *record.partials)
+        )
+    return _branch(
+        {
+            LAYOUTS: _branch(layout_nodes),
+            PARTIALS: _branch(partial_nodes),
+            TEMPLATES: _branch({name: _branch(nodes) for name, nodes in templates.items()}),
+        }
+    )
+
+
+@dataclass(slots=True)
+class ChangeSet:
+    """추가/삭제/변경 항목"""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+
+    def names(self) -> Set[str]:
+        """전체 항목 이름"""
+        return {*self.added, *self.removed, *self.changed}
+
+
+def _diff_children(
+    old: HashNode, new: HashNode, prefix: str, change_set: ChangeSet, depth: int
+) -> None:
+    """하위 노드 비교 (해시가 같은 노드는 건너뜀)"""
+    if old.digest == new.digest:
+        return
+    empty = HashNode("")
+    for name in sorted(old.children.keys() | new.children.keys()):
+        old_child, new_child = old.children.get(name), new.children.get(name)
+        path = f"{prefix}{name}"
+        if depth > 1:
+            _diff_children(
+                old_child or empty, new_child or empty, f"{path}/", change_set, depth - 1
+            )
+        elif old_child is None:
+            change_set.added.append(path)
+        elif new_child is None:
+            change_set.removed.append(path)
+        elif old_child.digest != new_child.digest:
+            change_set.changed.append(path)
+
+
+def diff_version_trees(old: HashNode, new: HashNode) -> Dict[str, ChangeSet]:
+    """두 해시 트리 비교 (종류별 변경 항목, 컴포넌트는 "템플릿/컴포넌트")"""
+    result = {LAYOUTS: ChangeSet(), PARTIALS: ChangeSet(), TEMPLATES: ChangeSet()}
+    if old.digest == new.digest:
+        return result
+    empty = HashNode("")
+    for kind, depth in ((LAYOUTS, 1), (PARTIALS, 1), (TEMPLATES, 2)):
+        _diff_children(
+            old.children.get(kind, empty), new.children.get(kind, empty), "", result[kind], depth
+        )
+    return result
+
+
+def find_dependent_partials(
+    partials: Mapping[str, PartialMetaData], names: Iterable[str]
+) -> Set[str]:
+    """주어진 파셜에 (간접적으로) 의존하는 파셜 목록 (주어진 파셜 제외)"""
+    dependents: Dict[str, Set[str]] = {}
+    for name, record in partials.items():
+        for dependency in record.dependencies:
+            dependents.setdefault(dependency, set()).add(name)
+
+    seeds = set(names)
+    found: Set[str] = set()
+    queue = deque(seeds)
+    while queue:
+        for dependent in dependents.get(queue.popleft(), ()):
+            if dependent not in found and dependent not in seeds:
+                found.add(dependent)
+                queue.append(dependent)
+    return found
+
+
+def find_impacted_components(
+    components: Mapping[str, TemplateComponentMetaData],
+    layouts: Set[str],
+    partials: Set[str],
+) -> Dict[str, Tuple[List[str], List[str]]]:
+    """레이아웃/파셜 변경의 영향을 받는 컴포넌트 (경로 -> (원인 레이아웃, 원인 파셜))"""
+    impacted: Dict[str, Tuple[List[str], List[str]]] = {}
+    for path, record in components.items():
+        via_layouts = [record.layout] if record.layout in layouts else []
+        via_partials = sorted(partial for partial in record.partials if partial in partials)
+        if via_layouts or via_partials:
+            impacted[path] = (via_layouts, via_partials)
+    return impacted
+
+
+# 버전 환경(TemplyEnv.derived)에 보관하는 해시 트리 키
+VERSION_TREE = "version_tree"
+
+
+def get_version_tree(
+    temply_env: TemplyEnv,
+    layouts: Mapping[str, LayoutMetaData],
+    partials: Mapping[str, PartialMetaData],
+    components: Mapping[str, TemplateComponentMetaData],
+) -> HashNode:
+    """버전 해시 트리 조회 (인덱스 변경 세대가 같으면 보관된 트리 재사용, 인덱스 읽기 락 안에서 호출)"""
+    cached: Optional[Tuple[int, HashNode]] = temply_env.derived.get(VERSION_TREE)
+    if cached is not None and cached[0] == temply_env.index_generation:
+        return cached[1]
+    tree = build_version_tree(layouts, partials, components)
+    temply_env.derived[VERSION_TREE] = (temply_env.index_generation, tree)
+    return tree
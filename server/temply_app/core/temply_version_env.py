@@ -1,8 +1,16 @@
 """Temply 버전별 환경 관리"""
 
+import asyncio
+import os
+import threading
+import time
+from typing import Optional
+
 from temply_app.core.config import Config
 from temply_app.core.git_env import GitEnv
+from temply_app.core.temply.manifest import Manifest, ManifestDiff, diff_manifest, tree_hash
 from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.utils.revision_util import read_head_sha
 from temply_app.models.common_model import VersionInfo
 
 
@@ -25,6 +33,59 @@ class TemplyVersionEnv:
         #     self.applied_version = self.version_info.revision_version
         self.temply_env: TemplyEnv = TemplyEnv(config, self.version_info.version)
 
+        # 캐시된 환경과 파서가 만들어진 리비전 (git: HEAD SHA, 로컬: 파일 트리 해시)
+        self.version_path = os.path.join(config.noti_temply_dir, self.version_info.version)
+        self.validate_interval = config.version_env_validate_interval_seconds
+        self._baseline: Manifest = self.temply_env.get_manifest()
+        self.revision: str = self._read_revision(self._baseline)
+        self._validated_at: float = time.monotonic()
+        # 이벤트 루프가 여러 개여도 매니페스트 비교/교체는 한 번에 하나만 실행
+        self._check_lock = threading.Lock()
+
+    def _read_revision(self, manifest: Manifest) -> str:
+        """리비전 조회 (git 저장소가 아니면 매니페스트 해시)"""
+        return read_head_sha(self.version_path) or tree_hash(manifest)
+
+    def _scan_manifest(self) -> Manifest:
+        self.temply_env.invalidate_manifest()
+        return self.temply_env.get_manifest()
+
+    def is_revision_check_due(self) -> bool:
+        """마지막 확인 후 validate_interval이 지났는지 여부"""
+        return time.monotonic() - self._validated_at >= self.validate_interval
+
+    async def check_revision(self, force: bool = False) -> Optional[ManifestDiff]:
+        """리비전이 바뀌었으면 마지막 확인 이후의 파일 변경 반환
+
+        확인은 validate_interval 간격으로만 수행합니다 (force=True이면 항상).
+        변경이 없거나 확인 간격이 지나지 않았으면 None을 반환합니다.
+        로컬 모드에서는 디렉토리 전체를 순회하므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        """
+        if not force and not self.is_revision_check_due():
+            return None
+        self._validated_at = time.monotonic()
+        return await asyncio.to_thread(self._check_revision)
+
+    def _check_revision(self) -> Optional[ManifestDiff]:
+        with self._check_lock:
+            manifest: Optional[Manifest] = None
+            revision = read_head_sha(self.version_path)
+            if revision is None:
+                manifest = self._scan_manifest()
+                revision = tree_hash(manifest)
+            if revision == self.revision:
+                return None
+            if manifest is None:
+                manifest = self._scan_manifest()
+            diff = diff_manifest(self._baseline, manifest)
+            self._baseline = manifest
+            self.revision = revision
+            return diff
+
+    def source_bytes(self) -> int:
+        """마지막으로 확인한 리비전의 원본 파일 크기 합 (캐시 비용 근사치)"""
+        return sum(entry.size for entry in self._baseline.entries())
+
     def get_temply_env(self) -> TemplyEnv:
         """Temply 환경 반환"""
         return self.temply_env
@@ -1,118 +1,85 @@
-from typing import Generic, Optional, TypeVar
+import asyncio
+import os
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 
 from temply_app.core.config import Config
+from temply_app.core.content_cache import get_content_cache
 from temply_app.core.lru_cache import LRUCache
+from temply_app.core.temply.git_object_store import get_git_object_store
+from temply_app.core.temply.git_temply_env import GitTemplyEnv
+from temply_app.core.temply.manifest import ManifestDiff
 from temply_app.core.temply.parser.layout_parser import LayoutParser
 from temply_app.core.temply.parser.partial_parser import PartialParser
 from temply_app.core.temply.parser.template_parser import TemplateParser
 from temply_app.core.temply.temply_env import TemplyEnv
 from temply_app.core.temply_version_env import TemplyVersionEnv
+from temply_app.core.utils.version_access import get_version_access_tracker
 from temply_app.models.common_model import VersionInfo
 
 T = TypeVar("T")
 
+# 버전 환경(TemplyEnv.derived)에 보관하는 파서 키
+LAYOUT_PARSER = "layout_parser"
+PARTIAL_PARSER = "partial_parser"
+TEMPLATE_PARSER = "template_parser"
 
-class CacheUtil(Generic[T]):
-    """Cache Util"""
 
-    def __init__(self, max_size: int = 10) -> None:
-        self._cache: LRUCache[T] = LRUCache(max_size)
-
-    def get(self, temply_env: TemplyEnv) -> Optional[T]:
-        """Get Cache"""
-        cache_key = str(temply_env)
-        return self._cache.get(cache_key)
-
-    def set(self, temply_env: TemplyEnv, value: T) -> None:
-        """Set Cache"""
-        cache_key = str(temply_env)
-        self._cache.set(cache_key, value)
-
-    def clear(self) -> None:
-        """Clear Cache"""
-        self._cache.clear()
-
-    def delete(self, temply_env: TemplyEnv) -> None:
-        """Delete Cache"""
-        self._cache.delete(str(temply_env))
+def _get_derived(temply_env: TemplyEnv, key: str, factory: Callable[[TemplyEnv], T]) -> T:
+    """환경에 보관된 파서 조회 (없으면 생성)
 
-
-_layout_cache_util: Optional[CacheUtil[LayoutParser]] = None
-
-
-def _get_layout_cache_util() -> CacheUtil[LayoutParser]:
-    """Get Layout Cache Util"""
-    global _layout_cache_util  # pylint: disable=global-statement
-    if _layout_cache_util is None:
-        _layout_cache_util = CacheUtil[LayoutParser]()
-    return _layout_cache_util
+    파서는 환경이 직접 보관하므로 버전 환경 캐시에서 환경이 제거되면 파서도 함께 제거되고,
+    다른 환경의 파서를 잘못 사용할 수 없습니다.
+    """
+    value = temply_env.derived.get(key)
+    if value is None:
+        # 여러 스레드에서 동시에 조회해도 파서(전체 파일 파싱)는 한 번만 생성
+        with temply_env.derived_lock:
+            value = temply_env.derived.get(key)
+            if value is None:
+                value = temply_env.derived[key] = factory(temply_env)
+    return value
 
 
 def get_layout_parser(temply_env: TemplyEnv) -> LayoutParser:
     """Get Layout Parser"""
-    layout_cache_util = _get_layout_cache_util()
-    layout_parser = layout_cache_util.get(temply_env)
-    if layout_parser is None:
-        layout_parser = LayoutParser(temply_env)
-        layout_cache_util.set(temply_env, layout_parser)
-    return layout_parser
-
-
-_partial_cache_util: Optional[CacheUtil[PartialParser]] = None
-
-
-def _get_partial_cache_util() -> CacheUtil[PartialParser]:
-    """Get Partial Cache Util"""
-    global _partial_cache_util  # pylint: disable=global-statement
-    if _partial_cache_util is None:
-        _partial_cache_util = CacheUtil[PartialParser]()
-    return _partial_cache_util
+    return _get_derived(temply_env, LAYOUT_PARSER, LayoutParser)
 
 
 def get_partial_parser(temply_env: TemplyEnv) -> PartialParser:
     """Get Partial Parser"""
-    partial_cache_util = _get_partial_cache_util()
-    partial_parser = partial_cache_util.get(temply_env)
-    if partial_parser is None:
-        partial_parser = PartialParser(temply_env)
-        partial_cache_util.set(temply_env, partial_parser)
-    return partial_parser
-
-
-_template_cache_util: Optional[CacheUtil[TemplateParser]] = None
-
-
-def _get_template_cache_util() -> CacheUtil[TemplateParser]:
-    """Get Template Cache Util"""
-    global _template_cache_util  # pylint: disable=global-statement
-    if _template_cache_util is None:
-        _template_cache_util = CacheUtil[TemplateParser]()
-    return _template_cache_util
+    return _get_derived(temply_env, PARTIAL_PARSER, PartialParser)
 
 
 def get_template_parser(temply_env: TemplyEnv) -> TemplateParser:
     """Get Template Parser"""
-    template_cache_util = _get_template_cache_util()
-    template_parser = template_cache_util.get(temply_env)
-    if template_parser is None:
-        template_parser = TemplateParser(temply_env)
-        template_cache_util.set(temply_env, template_parser)
-    return template_parser
+    return _get_derived(temply_env, TEMPLATE_PARSER, TemplateParser)
 
 
 class TemplyVersionEnvCacheUtil:
-    """Temply Version Env Cache Util"""
+    """Temply Version Env Cache Util
+
+    버전별로 하나의 항목이 환경, 파서, 컴파일된 템플릿, 파생 인덱스를 모두 소유하므로
+    항목 제거/교체가 버전 단위로 한 번에 적용됩니다.
+    """
 
-    def __init__(self, max_size: int = 10) -> None:
-        self._cache: LRUCache[TemplyVersionEnv] = LRUCache(max_size)
+    def __init__(self, max_size: int = 10, max_bytes: int = 0, ttl: float = 0) -> None:
+        self._cache: LRUCache[TemplyVersionEnv] = LRUCache(max_size, ttl=ttl, max_cost=max_bytes)
 
     def get(self, version_info: VersionInfo) -> Optional[TemplyVersionEnv]:
         """Get Cache"""
         return self._cache.get(version_info.get_cache_key())
 
-    def set(self, version_info: VersionInfo, value: TemplyVersionEnv) -> None:
-        """Set Cache"""
-        self._cache.set(version_info.get_cache_key(), value)
+    async def get_or_load(
+        self, version_info: VersionInfo, loader: Callable[[], Awaitable[TemplyVersionEnv]]
+    ) -> TemplyVersionEnv:
+        """Get Cache (없으면 loader로 생성, 같은 버전의 동시 생성은 하나로 합침)
+
+        비용은 버전 원본 파일 크기 합입니다.
+        """
+        return await self._cache.get_or_load(
+            version_info.get_cache_key(), loader, lambda env: env.source_bytes()
+        )
 
     def clear(self) -> None:
         """Clear Cache"""
@@ -122,29 +89,191 @@ class TemplyVersionEnvCacheUtil:
         """Delete Cache"""
         self._cache.delete(version_info.get_cache_key())
 
+    def values(self) -> List[TemplyVersionEnv]:
+        """캐시된 버전 환경 목록"""
+        return self._cache.values()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        return self._cache.get_stats()
+
 
 _temply_version_env_cache_util: Optional[TemplyVersionEnvCacheUtil] = None
 
 
-def _get_temply_version_env_cache_util() -> TemplyVersionEnvCacheUtil:
+def _get_temply_version_env_cache_util(config: Config) -> TemplyVersionEnvCacheUtil:
     """Get Temply Version Env Cache Util"""
     global _temply_version_env_cache_util  # pylint: disable=global-statement
     if _temply_version_env_cache_util is None:
-        _temply_version_env_cache_util = TemplyVersionEnvCacheUtil()
+        _temply_version_env_cache_util = TemplyVersionEnvCacheUtil(
+            config.version_env_cache_size,
+            config.version_env_cache_max_bytes,
+            config.version_env_cache_ttl_seconds,
+        )
     return _temply_version_env_cache_util
 
 
-def get_temply_version_env(config: Config, version_info: VersionInfo) -> TemplyVersionEnv:
-    """Get Temply Version Env"""
-    temply_version_env_cache_util = _get_temply_version_env_cache_util()
-    temply_version_env = temply_version_env_cache_util.get(version_info)
-    if temply_version_env is None:
-        temply_version_env = TemplyVersionEnv(config, version_info)
-        temply_version_env_cache_util.set(version_info, temply_version_env)
+async def load_temply_version_env(config: Config, version_info: VersionInfo) -> TemplyVersionEnv:
+    """Get Temply Version Env (캐시에 없으면 이벤트 루프를 막지 않도록 스레드에서 생성)
+
+    캐시되지 않은 버전에 요청이 몰려도 디렉토리 전체 순회는 한 번만 하고,
+    동시에 들어온 요청은 진행 중인 생성을 기다려 같은 환경(과 파서)을 사용합니다.
+    """
+    get_version_access_tracker(config).touch(
+        os.path.abspath(config.noti_temply_dir), version_info.version
+    )
+    return await _get_temply_version_env_cache_util(config).get_or_load(
+        version_info, lambda: asyncio.to_thread(TemplyVersionEnv, config, version_info)
+    )
+
+
+async def get_validated_temply_version_env(
+    config: Config, version_info: VersionInfo
+) -> TemplyVersionEnv:
+    """Get Temply Version Env (리비전이 바뀌었으면 변경된 파일만 파서에 반영)"""
+    temply_version_env = await load_temply_version_env(config, version_info)
+    await refresh_temply_version_env(temply_version_env)
     return temply_version_env
 
 
+# 버전 환경별 진행 중인 리비전 확인
+_revision_checks: "weakref.WeakKeyDictionary[TemplyVersionEnv, asyncio.Task[bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _check_and_sync(temply_version_env: TemplyVersionEnv, force: bool) -> bool:
+    diff = await temply_version_env.check_revision(force)
+    if diff is None:
+        return False
+    await sync_temply_version_env(temply_version_env, diff)
+    return True
+
+
+async def refresh_temply_version_env(
+    temply_version_env: TemplyVersionEnv, force: bool = False
+) -> bool:
+    """리비전을 확인하고 변경분을 파서에 반영
+
+    같은 환경을 동시에 확인하면 진행 중인 확인 하나를 함께 기다립니다.
+    force=True이면 진행 중인 확인이 끝난 뒤 확인 간격과 관계없이 다시 확인합니다
+    (확인이 시작된 후에 바뀐 파일도 반영되도록).
+
+    Returns:
+        변경분을 반영했는지 여부
+    """
+    loop = asyncio.get_running_loop()
+    task = _revision_checks.get(temply_version_env)
+    if task is not None and not task.done() and task.get_loop() is loop:
+        if not force:
+            return await asyncio.shield(task)
+        await asyncio.shield(task)
+    if not force and not temply_version_env.is_revision_check_due():
+        return False
+    task = loop.create_task(_check_and_sync(temply_version_env, force))
+    _revision_checks[temply_version_env] = task
+    return await asyncio.shield(task)
+
+
+async def sync_temply_version_env(temply_version_env: TemplyVersionEnv, diff: ManifestDiff) -> None:
+    """파일 변경을 캐시된 파서에 반영 (아직 만들어지지 않은 파서는 처음 사용할 때 파일에서 생성)"""
+    temply_env = temply_version_env.get_temply_env()
+    temply_env.clear_template_cache()
+    temply_env.invalidate_manifest()
+    temply_env.touch_index()
+
+    layout_parser: Optional[LayoutParser] = temply_env.derived.get(LAYOUT_PARSER)
+    if layout_parser is not None:
+        await layout_parser.apply_changes(diff.layouts, diff.removed_layouts)
+    partial_parser: Optional[PartialParser] = temply_env.derived.get(PARTIAL_PARSER)
+    if partial_parser is not None:
+        await partial_parser.apply_changes(diff.partials, diff.removed_partials)
+    template_parser: Optional[TemplateParser] = temply_env.derived.get(TEMPLATE_PARSER)
+    if template_parser is not None:
+        await template_parser.apply_changes(diff.components, diff.removed_components)
+
+
+async def sync_cached_temply_version_env(version_info: VersionInfo) -> bool:
+    """캐시된 버전 환경이 있으면 확인 간격과 관계없이 리비전을 확인하고 변경분 반영
+
+    Returns:
+        변경분을 반영했는지 여부 (캐시된 환경이 없거나 변경이 없으면 False)
+    """
+    if _temply_version_env_cache_util is None:
+        return False
+    temply_version_env = _temply_version_env_cache_util.get(version_info)
+    if temply_version_env is None:
+        return False
+    return await refresh_temply_version_env(temply_version_env, force=True)
+
+
 def temply_version_env_cache_clear(version_info: VersionInfo) -> None:
-    """Temply Version Env Cache Clear"""
-    temply_version_env_cache_util = _get_temply_version_env_cache_util()
-    temply_version_env_cache_util.delete(version_info)
+    """Temply Version Env Cache Clear (환경이 소유한 파서/인덱스도 함께 제거)"""
+    if _temply_version_env_cache_util is not None:
+        _temply_version_env_cache_util.delete(version_info)
+
+
+def get_temply_version_env_stats() -> List[Dict[str, Any]]:
+    """캐시된 버전 환경별 통계 (파서별 인덱스 항목 수)"""
+    if _temply_version_env_cache_util is None:
+        return []
+    stats = []
+    for temply_version_env in _temply_version_env_cache_util.values():
+        temply_env = temply_version_env.get_temply_env()
+        parsers = {
+            key: len(parser.nodes)
+            for key in (LAYOUT_PARSER, PARTIAL_PARSER, TEMPLATE_PARSER)
+            if (parser := temply_env.derived.get(key)) is not None
+        }
+        stats.append(
+            {
+                "version": temply_version_env.version_info.version,
+                "revision": temply_version_env.revision,
+                "index_generation": temply_env.index_generation,
+                "source_bytes": temply_version_env.source_bytes(),
+                "parsers": parsers,
+            }
+        )
+    return stats
+
+
+_git_temply_env_cache: Optional[LRUCache[GitTemplyEnv]] = None
+
+
+def _get_git_temply_env_cache(config: Config) -> LRUCache[GitTemplyEnv]:
+    """Get Git Temply Env Cache"""
+    global _git_temply_env_cache  # pylint: disable=global-statement
+    if _git_temply_env_cache is None:
+        _git_temply_env_cache = LRUCache(config.git_env_cache_size)
+    return _git_temply_env_cache
+
+
+async def get_git_temply_env(config: Config, commit: str) -> GitTemplyEnv:
+    """Get Git Temply Env (커밋 SHA로 캐시, 커밋 내용은 변경되지 않으므로 검증 없이 재사용)"""
+    git_temply_env_cache = _get_git_temply_env_cache(config)
+    git_temply_env = git_temply_env_cache.get(commit)
+    if git_temply_env is None:
+        store = get_git_object_store(config)
+        tree = await store.read_tree(commit)
+        await store.preload(tree)
+        git_temply_env = GitTemplyEnv(config, store, tree)
+        git_temply_env_cache.set(git_temply_env.tree.commit, git_temply_env)
+    return git_temply_env
+
+
+def git_temply_env_cache_clear() -> None:
+    """Git Temply Env Cache Clear"""
+    if _git_temply_env_cache is not None:
+        _git_temply_env_cache.clear()
+
+
+def get_cache_metrics(config: Config) -> Dict[str, Any]:
+    """캐시별 통계 (아직 만들어지지 않은 캐시는 제외)"""
+    metrics: Dict[str, Any] = {"content": get_content_cache(config).get_stats()}
+    if _temply_version_env_cache_util is not None:
+        metrics["version_env"] = _temply_version_env_cache_util.get_stats()
+    if _git_temply_env_cache is not None:
+        metrics["git_env"] = _git_temply_env_cache.get_stats()
+    if config.is_git_used():
+        metrics["git_object_store"] = get_git_object_store(config).get_stats()
+    return metrics
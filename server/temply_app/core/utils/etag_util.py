@@ -0,0 +1,60 @@
+"""ETag 유틸
+
+조회 API의 강한(strong) ETag 생성과 조건부 요청(`If-None-Match`) 처리를 담당합니다.
+- 단건(레이아웃/파셜/컴포넌트): 인덱스 레코드의 본문 해시와 메타데이터로 생성
+- 목록/스키마: 버전 파일 트리 해시(경로, 크기, 수정 시간)와 요청 URL로 생성
+"""
+
+import hashlib
+from dataclasses import fields
+from typing import Any
+
+from fastapi import Request, Response
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+
+
+def make_etag(*parts: Any) -> str:
+    """값 목록으로 강한 ETag 생성"""
+    digest = hashlib.sha1("\0".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def record_etag(record: Any) -> str:
+    """파서 인덱스 레코드(메타데이터 dataclass)로 ETag 생성
+
+    본문 대신 본문 해시를 사용하므로 본문을 읽지 않습니다.
+    """
+    parts: list[Any] = [type(record).__name__]
+    for field in fields(record):
+        if field.name.startswith("_"):
+            continue
+        value = getattr(record, field.name)
+        if isinstance(value, (set, frozenset)):
+            value = sorted(value)
+        parts.append(value)
+    return make_etag(*parts)
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """`If-None-Match` 헤더가 ETag와 일치하는지 확인"""
+    header = request.headers.get(IF_NONE_MATCH_HEADER)
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두어는 무시
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return etag in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    """304 Not Modified 응답 생성"""
+    return Response(status_code=304, headers={ETAG_HEADER: etag})
+
+
+def set_etag(response: Response, etag: str) -> Response:
+    """응답에 ETag 헤더 설정"""
+    response.headers[ETAG_HEADER] = etag
+    return response
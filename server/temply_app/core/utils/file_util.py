@@ -0,0 +1,142 @@
+"""
+파일 유틸리티
+
+로컬 모드의 버전은 메인 버전 파일을 하드링크(또는 reflink)로 공유하는 스냅샷으로 생성합니다.
+파서는 파일을 제자리에서 수정하지 않고 임시 파일에 쓴 뒤 os.replace로 교체하므로,
+수정된 파일만 새 inode를 갖게 되고(copy-up) 다른 버전이 공유하는 원본은 변경되지 않습니다.
+"""
+
+import errno
+import fcntl
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# linux/fs.h FICLONE
+FICLONE = 0x40049409
+
+
+def _read_umask() -> int:
+    # umask는 바꾸지 않고는 읽을 수 없으므로 다른 스레드가 파일을 만들기 전(모듈 로드 시)에 한 번만 읽음
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+class SnapshotMode(str, Enum):
+    """스냅샷 파일 공유 방식"""
+
+    HARDLINK = "hardlink"  # 같은 inode 공유 (추가 디스크 사용 없음)
+    REFLINK = "reflink"  # 블록 공유 (btrfs, xfs 등 지원 파일 시스템 필요)
+    COPY = "copy"  # 전체 복사
+
+
+@dataclass(slots=True)
+class SnapshotStats:
+    """스냅샷 결과"""
+
+    files: int = 0
+    linked: int = 0
+    reflinked: int = 0
+    copied: int = 0
+    directories: int = 0
+
+
+def write_text_atomic(path: str | Path, text: str, encoding: str) -> None:
+    """임시 파일에 쓴 뒤 교체 (쓰기 도중 읽는 쪽은 이전 또는 새 내용만 보게 됨)
+
+    mkstemp는 임시 파일을 0600으로 만들므로, 교체 전에 기존 파일의 권한
+    (새 파일이면 umask를 적용한 0666)을 적용하여 공유 EFS의 다른 사용자도 읽을 수 있게 합니다.
+    """
+    path = Path(path)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _reflink(src: str, dst: str) -> None:
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+    shutil.copystat(src, dst)
+
+
+def _share_file(src: str, dst: str, mode: SnapshotMode, stats: SnapshotStats) -> SnapshotMode:
+    """파일 공유 (지원하지 않으면 다음 방식으로 대체하고, 대체된 방식을 반환)"""
+    if mode == SnapshotMode.HARDLINK:
+        try:
+            os.link(src, dst, follow_symlinks=False)
+            stats.linked += 1
+            return mode
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                raise
+            logger.info("Hardlink is not available (%s), falling back to reflink", e)
+            mode = SnapshotMode.REFLINK
+    if mode == SnapshotMode.REFLINK:
+        try:
+            _reflink(src, dst)
+            stats.reflinked += 1
+            return mode
+        except OSError as e:
+            if os.path.exists(dst):
+                os.unlink(dst)
+            logger.info("Reflink is not available (%s), falling back to copy", e)
+            mode = SnapshotMode.COPY
+    shutil.copy2(src, dst, follow_symlinks=False)
+    stats.copied += 1
+    return mode
+
+
+def snapshot_tree(
+    src: str | Path, dst: str | Path, mode: SnapshotMode = SnapshotMode.HARDLINK
+) -> SnapshotStats:
+    """디렉토리 스냅샷 생성 (디렉토리는 새로 만들고 파일은 공유)
+
+    Raises:
+        FileExistsError: 대상 디렉토리가 이미 있는 경우
+    """
+    stats = SnapshotStats()
+    os.makedirs(dst)
+    stack = [(os.fspath(src), os.fspath(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        stats.directories += 1
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    os.mkdir(target)
+                    shutil.copystat(entry.path, target)
+                    stack.append((entry.path, target))
+                    continue
+                if entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), target)
+                    continue
+                # 쓰기 중인 임시 파일 제외
+                if entry.name.startswith(".") and entry.name.endswith(".tmp"):
+                    continue
+                mode = _share_file(entry.path, target, mode, stats)
+                stats.files += 1
+    return stats
@@ -0,0 +1,135 @@
+"""
+비동기 git 실행기
+
+셸을 거치지 않고 asyncio.create_subprocess_exec로 git을 실행합니다.
+명령별 시간 제한과 동시 실행 수 제한을 적용하고, 실행 결과를 GitResult로 반환합니다.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from temply_app.core.config import Config
+from temply_app.core.exceptions import GitCommandError, GitTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class GitResult:
+    """git 명령 실행 결과"""
+
+    args: Tuple[str, ...]
+    returncode: int
+    stdout: str
+    stderr: str
+    duration: float
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부"""
+        return self.returncode == 0
+
+
+class GitRunner:
+    """비동기 git 실행기"""
+
+    def __init__(self, timeout: float, max_concurrency: int) -> None:
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        # asyncio.Semaphore는 이벤트 루프에 묶이므로 루프별로 생성
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        self._env: Dict[str, str] = {"GIT_TERMINAL_PROMPT": "0"}
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def run(
+        self,
+        *args: str,
+        cwd: Optional[str] = None,
+        timeout: Optional[float] = None,
+        check: bool = True,
+    ) -> GitResult:
+        """git 명령 실행
+
+        Args:
+            args: git 인자 목록 (예: "fetch", "--prune", "origin")
+            cwd: 실행 디렉토리
+            timeout: 시간 제한 (초, 없으면 기본값)
+            check: 실패 시 GitCommandError 발생 여부
+
+        Raises:
+            GitTimeoutError: 시간 제한 초과
+            GitCommandError: check=True이고 종료 코드가 0이 아닌 경우
+        """
+        timeout = self.timeout if timeout is None else timeout
+        command = ("git", *args)
+        async with self._get_semaphore():
+            started = time.monotonic()
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                cwd=cwd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={**os.environ, **self._env},
+                # 시간 초과 시 ssh, 훅 등 하위 프로세스까지 함께 종료하기 위해 별도 세션으로 실행
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError as e:
+                await self._kill(process)
+                raise GitTimeoutError(
+                    f"git command timed out after {timeout}s: {' '.join(args)}"
+                ) from e
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+
+        result = GitResult(
+            args=tuple(args),
+            returncode=process.returncode if process.returncode is not None else -1,
+            stdout=stdout.decode(errors="replace"),
+            stderr=stderr.decode(errors="replace"),
+            duration=time.monotonic() - started,
+        )
+        logger.debug("git %s (%d, %.3fs)", " ".join(args), result.returncode, result.duration)
+        if check and not result.ok:
+            raise GitCommandError(
+                f"Failed to execute git {' '.join(args)}: {result.stderr.strip()}", result
+            )
+        return result
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+
+
+_git_runner: Optional[GitRunner] = None
+
+
+def get_git_runner(config: Config) -> GitRunner:
+    """Get Git Runner"""
+    global _git_runner  # pylint: disable=global-statement
+    if _git_runner is None:
+        _git_runner = GitRunner(config.git_command_timeout_seconds, config.git_max_concurrency)
+    return _git_runner
@@ -1,24 +1,50 @@
-"""Git 유틸리티"""
+"""Git 유틸리티
 
+각 버전은 EFS 루트의 bare 저장소(`{efs}/.bare`)를 공유하는 git worktree로 관리합니다.
+원격 저장소 fetch는 bare 저장소에서 한 번만 실행하고, 버전 생성은 worktree 체크아웃으로 처리합니다.
+작업 트리/브랜치를 바꾸는 명령(커밋, 병합, push, 생성, 삭제)은 버전별 락 안에서 실행하고,
+clone/fetch는 bare 저장소 락 안에서 실행합니다. 락 순서는 항상 버전 -> bare 저장소입니다.
+"""
+
+import asyncio
 import logging
 import os
-import subprocess
 from shutil import rmtree
-from typing import List
+from typing import AsyncContextManager, List, Optional, Tuple
 
+from temply_app.core.exceptions import GitCommandError, GitConflictError
 from temply_app.core.git_env import GitEnv
 from temply_app.core.utils.cache_util import temply_version_env_cache_clear
+from temply_app.core.utils.git_runner import GitResult, GitRunner, get_git_runner
+from temply_app.core.utils.revision_util import read_head_sha
+from temply_app.core.utils.version_lock import get_version_lock
 from temply_app.models.common_model import User, VersionInfo
 
 logger = logging.getLogger(__name__)
 
+REMOTE_REF_PREFIX = "refs/remotes/origin/"
+
+
+def _runner(git_env: GitEnv) -> GitRunner:
+    """git 실행기 조회"""
+    return get_git_runner(git_env.config)
+
+
+def _lock(git_env: GitEnv, name: Optional[str] = None) -> AsyncContextManager[None]:
+    """버전 git 작업 락 (name이 없으면 git_env의 버전)"""
+    return get_version_lock(git_env.config).hold(
+        git_env.efs_root_path, name or git_env.version_info.version
+    )
 
-def _run_command(command: str) -> None:
-    """명령어 실행"""
-    try:
-        subprocess.run(command, shell=True, check=True, capture_output=True)
-    except subprocess.CalledProcessError as e:
-        raise ValueError(f"Failed to execute command: {e.stderr.decode()}") from e
+
+def _bare_lock(git_env: GitEnv) -> AsyncContextManager[None]:
+    """bare 저장소 git 작업 락 (clone/fetch)"""
+    return _lock(git_env, git_env.config.git_bare_dir_name)
+
+
+def _is_worktree(path: str) -> bool:
+    """worktree 여부 (worktree의 .git은 디렉토리가 아닌 파일)"""
+    return os.path.isfile(os.path.join(path, ".git"))
 
 
 class GitUtil:
@@ -36,151 +62,441 @@ class GitUtil:
         return result
 
     @staticmethod
-    def create_version(git_env: GitEnv) -> None:
-        """Git 저장소 복제"""
+    async def _bare(git_env: GitEnv, *args: str, check: bool = True) -> GitResult:
+        """bare 저장소에서 git 명령 실행"""
+        return await _runner(git_env).run("--git-dir", git_env.bare_path, *args, check=check)
+
+    @staticmethod
+    async def ensure_repository(git_env: GitEnv) -> None:
+        """bare 저장소와 메인 버전 worktree 준비 (이미 있으면 아무것도 하지 않음)"""
+        main_name = git_env.config.noti_temply_main_version_name
+        main_path = os.path.join(git_env.efs_root_path, main_name)
+        if os.path.exists(git_env.bare_path) and os.path.exists(main_path):
+            return
+        async with _bare_lock(git_env):
+            await GitUtil._ensure_repository(git_env, main_name, main_path)
+
+    @staticmethod
+    async def _ensure_repository(git_env: GitEnv, main_name: str, main_path: str) -> None:
+        try:
+            if not os.path.exists(git_env.bare_path):
+                logger.info("Cloning bare repository into %s", git_env.bare_path)
+                await _runner(git_env).run(
+                    "clone", "--bare", git_env.config.noti_temply_repo_url, git_env.bare_path
+                )
+                # bare clone은 원격 추적 브랜치를 만들지 않으므로 fetch 대상을 지정
+                await GitUtil._bare(
+                    git_env, "config", "remote.origin.fetch", "+refs/heads/*:refs/remotes/origin/*"
+                )
+                await GitUtil._bare(git_env, "fetch", "--prune", "origin")
+
+            if not os.path.exists(main_path):
+                await GitUtil._bare(
+                    git_env,
+                    "worktree",
+                    "add",
+                    "-B",
+                    main_name,
+                    main_path,
+                    REMOTE_REF_PREFIX + main_name,
+                )
+        except GitCommandError as e:
+            raise GitCommandError(f"Failed to prepare repository: {e}", e.result) from e
+
+    @staticmethod
+    async def _remote_branch_exists(git_env: GitEnv, branch: str) -> bool:
+        result = await GitUtil._bare(
+            git_env, "rev-parse", "--verify", "--quiet", REMOTE_REF_PREFIX + branch, check=False
+        )
+        return result.ok
+
+    @staticmethod
+    async def _remove_version_dir(git_env: GitEnv, version_path: str) -> None:
+        """버전 디렉토리 삭제 (worktree이면 등록도 해제)"""
+        if _is_worktree(version_path):
+            await GitUtil._bare(git_env, "worktree", "remove", "--force", version_path)
+        else:
+            await asyncio.to_thread(rmtree, version_path)
+        await GitUtil._bare(git_env, "worktree", "prune", check=False)
+
+    @staticmethod
+    async def create_version(git_env: GitEnv) -> None:
+        """버전 worktree 생성
+
+        원격에 같은 이름의 브랜치가 있으면 해당 브랜치를 체크아웃하고,
+        없으면 메인 버전에서 새 브랜치를 만들어 원격에 push합니다.
+        """
         if git_env.version_info.is_root:
             raise ValueError("Root version cannot be cloned")
 
-        try:
-            command = (
-                f"git clone --branch {git_env.config.noti_temply_main_version_name} "
-                f"--single-branch {git_env.config.noti_temply_repo_url} {git_env.version_path} && "
-                f"cd {git_env.version_path} && "
-                f"git checkout -b {git_env.version_info.version} && "
-                f"git push origin {git_env.version_info.version}"
+        async with _lock(git_env):
+            # 락을 기다리는 동안 다른 요청/프로세스가 먼저 생성한 경우
+            if os.path.exists(git_env.version_path):
+                return
+            await GitUtil.ensure_repository(git_env)
+            version = git_env.version_info.version
+            try:
+                if await GitUtil._remote_branch_exists(git_env, version):
+                    await GitUtil._bare(
+                        git_env,
+                        "worktree",
+                        "add",
+                        "-B",
+                        version,
+                        git_env.version_path,
+                        REMOTE_REF_PREFIX + version,
+                    )
+                    return
+
+                main_ref = REMOTE_REF_PREFIX + git_env.config.noti_temply_main_version_name
+                await GitUtil._bare(
+                    git_env,
+                    "worktree",
+                    "add",
+                    "--no-track",
+                    "-B",
+                    version,
+                    git_env.version_path,
+                    main_ref,
+                )
+                await _runner(git_env).run(
+                    "-C", git_env.version_path, "push", "-u", "origin", version
+                )
+            except GitCommandError as e:
+                raise GitCommandError(f"Failed to create version: {e}", e.result) from e
+
+    @staticmethod
+    async def restore_version(git_env: GitEnv) -> bool:
+        """디스크에서 정리된 버전을 원격 브랜치에서 다시 체크아웃 (원격 브랜치가 없으면 False)"""
+        if git_env.version_info.is_root:
+            await GitUtil.ensure_repository(git_env)
+            return os.path.exists(git_env.version_path)
+
+        async with _lock(git_env):
+            if os.path.exists(git_env.version_path):
+                return True
+            await GitUtil.ensure_repository(git_env)
+            version = git_env.version_info.version
+            if not await GitUtil._remote_branch_exists(git_env, version):
+                return False
+            try:
+                await GitUtil._bare(
+                    git_env,
+                    "worktree",
+                    "add",
+                    "-B",
+                    version,
+                    git_env.version_path,
+                    REMOTE_REF_PREFIX + version,
+                )
+            except GitCommandError as e:
+                raise GitCommandError(f"Failed to restore version: {e}", e.result) from e
+            logger.info("Restored version %s from origin/%s", version, version)
+            return True
+
+    @staticmethod
+    async def evict_version(git_env: GitEnv) -> bool:
+        """버전 디렉토리를 디스크에서 정리 (브랜치는 유지)
+
+        커밋되지 않은 변경이나 push되지 않은 커밋이 있으면 정리하지 않고 False를 반환합니다.
+        """
+        if git_env.version_info.is_root:
+            raise ValueError("Root version cannot be evicted")
+
+        async with _lock(git_env):
+            version_path = git_env.version_path
+            # 이전 방식으로 복제된 디렉토리는 다시 체크아웃할 수 있는지 알 수 없으므로 유지
+            if not _is_worktree(version_path):
+                return False
+            runner = _runner(git_env)
+            status = await runner.run("-C", version_path, "status", "--porcelain", check=False)
+            ahead = await runner.run(
+                "-C",
+                version_path,
+                "rev-list",
+                "--count",
+                f"{REMOTE_REF_PREFIX}{git_env.version_info.version}..HEAD",
+                check=False,
             )
-            _run_command(command)
-        except Exception as e:
-            raise ValueError(f"Failed to clone repository: {e}") from e
+            clean = status.ok and not status.stdout.strip()
+            if not clean or not ahead.ok or ahead.stdout.strip() != "0":
+                logger.info("Skip evicting version %s with local changes", version_path)
+                return False
+            await GitUtil._remove_version_dir(git_env, version_path)
+            temply_version_env_cache_clear(git_env.version_info)
+        return True
 
     @staticmethod
-    def _refresh_main_version(git_env: GitEnv) -> None:
-        """메인 버전 새로고침"""
+    async def get_remote_sha(git_env: GitEnv) -> Optional[str]:
+        """원격 브랜치 커밋 SHA 조회 (버전 디렉토리 없이 bare 저장소에서 조회)"""
+        result = await GitUtil._bare(
+            git_env,
+            "rev-parse",
+            "--verify",
+            "--quiet",
+            REMOTE_REF_PREFIX + git_env.version_info.version,
+            check=False,
+        )
+        return result.stdout.strip() if result.ok else None
+
+    @staticmethod
+    async def _refresh_main_version(git_env: GitEnv) -> None:
+        """원격 저장소 fetch (모든 버전이 공유하는 bare 저장소에서 한 번 실행)"""
+        await GitUtil.ensure_repository(git_env)
         try:
-            # 원격 저장소에서 최신 정보 가져오기 (삭제된 브랜치 정보도 정리)
-            fetch_result = subprocess.run(
-                f"git -C {git_env.efs_root_path}/{git_env.config.noti_temply_main_version_name} fetch --prune origin",
-                shell=True,
-                check=False,
-                capture_output=True,
-                text=True,
+            # 삭제된 브랜치 정보도 정리
+            async with _bare_lock(git_env):
+                await GitUtil._bare(git_env, "fetch", "--prune", "origin")
+        except GitCommandError as e:
+            raise GitCommandError(f"Failed to fetch origin: {e}", e.result) from e
+
+    @staticmethod
+    async def fetch_version(git_env: GitEnv) -> bool:
+        """원격 저장소에서 버전 브랜치 하나만 fetch (원격에 브랜치가 없으면 False)"""
+        await GitUtil.ensure_repository(git_env)
+        version = git_env.version_info.version
+        remote_ref = REMOTE_REF_PREFIX + version
+        async with _bare_lock(git_env):
+            result = await GitUtil._bare(
+                git_env, "fetch", "origin", f"+refs/heads/{version}:{remote_ref}", check=False
             )
-            if fetch_result.returncode != 0:
-                raise ValueError(f"Failed to fetch origin: {fetch_result.stderr}")
-        except subprocess.CalledProcessError as e:
-            raise ValueError(f"Failed to refresh main version: {e.stderr}") from e
+            if result.ok:
+                return True
+            if "couldn't find remote ref" not in result.stderr:
+                raise GitCommandError(
+                    f"Failed to fetch version {version}: {result.stderr.strip()}", result
+                )
+            # 원격에서 삭제된 브랜치의 추적 브랜치 정리
+            await GitUtil._bare(git_env, "update-ref", "-d", remote_ref, check=False)
+        return False
 
     @staticmethod
-    def delete_version(git_env: GitEnv) -> None:
+    async def delete_version(git_env: GitEnv) -> None:
         """버전 삭제"""
         if git_env.version_info.is_root:
             raise ValueError("Root version cannot be deleted")
 
-        try:
-            command = (
-                f"cd {git_env.version_path} && "
-                f"git checkout {git_env.config.noti_temply_main_version_name} && "
-                f"git branch -D {git_env.version_info.version} && "
-                f"git push origin --delete {git_env.version_info.version} && "
-                f"rm -rf {git_env.version_path}"
-            )
-            _run_command(command)
-            GitUtil.refresh_version(git_env)
-        except Exception as e:
-            raise ValueError(f"Failed to delete repository: {e}") from e
+        async with _lock(git_env):
+            version = git_env.version_info.version
+            try:
+                await GitUtil._bare(git_env, "push", "origin", "--delete", version)
+                if os.path.exists(git_env.version_path):
+                    await GitUtil._remove_version_dir(git_env, git_env.version_path)
+                await GitUtil._bare(git_env, "branch", "-D", version, check=False)
+                temply_version_env_cache_clear(git_env.version_info)
+            except GitCommandError as e:
+                raise GitCommandError(f"Failed to delete repository: {e}", e.result) from e
 
     @staticmethod
-    def get_versions(git_env: GitEnv) -> List[VersionInfo]:
+    async def get_versions(git_env: GitEnv) -> List[VersionInfo]:
         """Git 저장소 목록 조회"""
+        await GitUtil._refresh_main_version(git_env)
+
+        # 원격 브랜치 목록 조회
         try:
-            GitUtil._refresh_main_version(git_env)
-
-            # 브랜치 목록 조회
-            result = subprocess.run(
-                f"git -C {git_env.efs_root_path}/{git_env.config.noti_temply_main_version_name} branch -r",
-                shell=True,
-                check=True,
-                capture_output=True,
-                text=True,
+            result = await GitUtil._bare(
+                git_env, "for-each-ref", "--format=%(refname)", REMOTE_REF_PREFIX.rstrip("/")
             )
+        except GitCommandError as e:
+            raise GitCommandError(f"Failed to get versions: {e}", e.result) from e
 
-            git_branch_list = [
-                branch.strip().replace("origin/", "").split(" -> ")[-1]
-                for branch in result.stdout.strip().split("\n")
-                if branch.strip() and not branch.strip().startswith("origin/HEAD")
-            ]
+        git_branch_list = [
+            ref[len(REMOTE_REF_PREFIX) :]
+            for ref in result.stdout.split()
+            if ref.startswith(REMOTE_REF_PREFIX) and ref != REMOTE_REF_PREFIX + "HEAD"
+        ]
 
-            # local에만 있는 브렌치가 있다면, 삭제해야 함.
-            local_branch_list = GitUtil._get_local_branch_list(git_env)
+        # local에만 있는 브렌치가 있다면, 삭제해야 함.
+        local_branch_list = GitUtil._get_local_branch_list(git_env)
 
-            for local_branch in local_branch_list:
-                if local_branch == git_env.config.noti_temply_main_version_name:
-                    continue
-                if local_branch not in git_branch_list:
-                    rmtree(os.path.join(git_env.efs_root_path, local_branch))
+        for local_branch in local_branch_list:
+            if local_branch == git_env.config.noti_temply_main_version_name:
+                continue
+            if local_branch not in git_branch_list:
+                async with _lock(git_env, local_branch):
+                    await GitUtil._remove_version_dir(
+                        git_env, os.path.join(git_env.efs_root_path, local_branch)
+                    )
+
+        return [VersionInfo(git_env.config, branch) for branch in git_branch_list]
 
-            return [VersionInfo(git_env.config, branch) for branch in git_branch_list]
+    @staticmethod
+    async def refresh_version(git_env: GitEnv) -> None:
+        """버전 새로고침
 
-        except subprocess.CalledProcessError as e:
-            raise ValueError(f"Failed to get versions: {e.stderr}") from e
+        worktree는 bare 저장소에서 이미 fetch한 원격 브랜치로 fast-forward만 하고,
+        이전 방식으로 복제된 디렉토리는 pull합니다.
+        캐시된 버전 환경은 HEAD SHA 변경을 감지해 변경된 파일만 다시 읽습니다.
+        """
+        version = git_env.version_info.version
+        runner = _runner(git_env)
+        async with _lock(git_env):
+            before = read_head_sha(git_env.version_path)
+            try:
+                if _is_worktree(git_env.version_path):
+                    await runner.run(
+                        "-C",
+                        git_env.version_path,
+                        "merge",
+                        "--ff-only",
+                        REMOTE_REF_PREFIX + version,
+                    )
+                else:
+                    await runner.run("-C", git_env.version_path, "pull")
+            except GitCommandError as e:
+                raise GitCommandError(f"Failed to refresh version {version}: {e}", e.result) from e
+            after = read_head_sha(git_env.version_path)
+        if before == after:
+            logger.info("Already up to date for version %s", version)
+        else:
+            logger.info("Version %s moved from %s to %s", version, before, after)
 
     @staticmethod
-    def refresh_version(git_env: GitEnv) -> None:
-        """버전 새로고침"""
-        try:
-            fetch_result = subprocess.run(
-                f"git -C {git_env.efs_root_path}/{git_env.version_info.version} pull",
-                shell=True,
+    async def get_head_sha(git_env: GitEnv) -> Optional[str]:
+        """HEAD 커밋 SHA 조회 (.git 파일을 읽지 못하면 git rev-parse 실행)"""
+        head_sha = read_head_sha(git_env.version_path)
+        if head_sha is not None:
+            return head_sha
+        result = await _runner(git_env).run(
+            "-C", git_env.version_path, "rev-parse", "HEAD", check=False
+        )
+        if not result.ok:
+            logger.warning("Failed to read HEAD for version %s", git_env.version_info.version)
+            return None
+        return result.stdout.strip()
+
+    @staticmethod
+    def get_local_versions(git_env: GitEnv) -> List[str]:
+        """EFS에 체크아웃된 버전 목록"""
+        return GitUtil._get_local_branch_list(git_env)
+
+    @staticmethod
+    async def get_unsynced_changes(git_env: GitEnv) -> Tuple[List[str], int]:
+        """커밋되지 않은 변경 경로와 원격보다 앞선 커밋 수 조회 (worktree가 아니면 빈 결과)
+
+        커밋 큐는 메모리에만 있으므로, 재시작 전에 저장만 되고 커밋/push되지 않은 변경을
+        찾는 데 사용합니다.
+        """
+        version_path = git_env.version_path
+        if not _is_worktree(version_path):
+            return [], 0
+        runner = _runner(git_env)
+        async with _lock(git_env):
+            status = await runner.run(
+                "-C", version_path, "status", "--porcelain", "-z", "--untracked-files=all"
+            )
+            ahead = await runner.run(
+                "-C",
+                version_path,
+                "rev-list",
+                "--count",
+                f"{REMOTE_REF_PREFIX}{git_env.version_info.version}..HEAD",
                 check=False,
-                capture_output=True,
-                text=True,
             )
-            if fetch_result.returncode != 0:
-                raise ValueError(f"Failed to fetch origin: {fetch_result.stderr}")
-            if "Already up to date." in fetch_result.stdout.strip():
-                logger.info("Already up to date for version %s", git_env.version_info.version)
-            else:
-                temply_version_env_cache_clear(git_env.version_info)
-                logger.info(
-                    "Successfully fetched origin for version %s", git_env.version_info.version
-                )
-        except subprocess.CalledProcessError as e:
-            raise ValueError(
-                f"Failed to refresh version {git_env.version_info.version}: {e.stderr}"
-            ) from e
+        paths = []
+        records = iter(status.stdout.split("\0"))
+        for record in records:
+            if not record:
+                continue
+            paths.append(record[3:])
+            if record[0] in "RC":
+                # 이름 변경/복사는 다음 항목이 원래 경로
+                paths.append(next(records, ""))
+        # 원격 브랜치가 없으면 비교할 대상이 없으므로 0
+        commits = int(ahead.stdout.strip()) if ahead.ok else 0
+        return [path for path in paths if path], commits
 
     @staticmethod
-    def commit_version(git_env: GitEnv, user: User, message: str, paths: List[str]) -> None:
-        """Git 저장소 커밋"""
+    async def commit_paths(git_env: GitEnv, user: User, message: str, paths: List[str]) -> bool:
+        """변경 파일을 로컬에 커밋 (커밋할 변경이 없으면 False)"""
         if git_env.version_info.is_root:
             raise ValueError("Root version cannot be committed")
+        async with _lock(git_env):
+            return await GitUtil._commit_paths(git_env, user, message, paths)
+
+    @staticmethod
+    async def _commit_paths(git_env: GitEnv, user: User, message: str, paths: List[str]) -> bool:
+        # 삭제된 파일 처리
+        deleted_files = [
+            path for path in paths if not os.path.exists(os.path.join(git_env.version_path, path))
+        ]
+        # 수정/추가된 파일 처리
+        modified_files = [
+            path for path in paths if os.path.exists(os.path.join(git_env.version_path, path))
+        ]
+        if not deleted_files and not modified_files:
+            return False
 
+        runner = _runner(git_env)
+        version_path = git_env.version_path
         try:
-            # 삭제된 파일 처리
-            deleted_files = [
-                path
-                for path in paths
-                if not os.path.exists(os.path.join(git_env.version_path, path))
-            ]
-            # 수정/추가된 파일 처리
-            modified_files = [
-                path for path in paths if os.path.exists(os.path.join(git_env.version_path, path))
-            ]
-
-            commands = []
             if deleted_files:
-                commands.append(f"git -C {git_env.version_path} rm {' '.join(deleted_files)}")
+                # 생성 후 바로 삭제되어 추적되지 않는 파일은 무시
+                await runner.run(
+                    "-C", version_path, "rm", "-q", "--ignore-unmatch", "--", *deleted_files
+                )
             if modified_files:
-                commands.append(f"git -C {git_env.version_path} add {' '.join(modified_files)}")
-
-            if commands:
-                command = (
-                    " && ".join(commands)
-                    + f" && git -C {git_env.version_path} commit -m '{message}'"
-                    + f" --author='{user.name} <{user.name}@noti-temply.com>'"
-                    + f" && git -C {git_env.version_path} pull origin {git_env.version_info.version}"
-                    + f" && git -C {git_env.version_path} push origin {git_env.version_info.version}"
+                await runner.run("-C", version_path, "add", "--", *modified_files)
+            staged = await runner.run(
+                "-C", version_path, "diff", "--cached", "--quiet", "--", *paths, check=False
+            )
+            if staged.ok:
+                return False
+            await runner.run(
+                "-C",
+                version_path,
+                "commit",
+                "-m",
+                message,
+                f"--author={user.name} <{user.name}@noti-temply.com>",
+            )
+        except GitCommandError as e:
+            raise GitCommandError(f"Failed to commit repository: {e}", e.result) from e
+        return True
+
+    @staticmethod
+    async def push_version(git_env: GitEnv) -> None:
+        """원격 브랜치를 병합한 뒤 push
+
+        Raises:
+            GitConflictError: 원격 변경과 충돌 (병합은 취소되고 로컬 커밋은 유지)
+            GitCommandError: 그 외 실패
+        """
+        async with _lock(git_env):
+            await GitUtil._push_version(git_env)
+
+    @staticmethod
+    async def _push_version(git_env: GitEnv) -> None:
+        runner = _runner(git_env)
+        version_path = git_env.version_path
+        version = git_env.version_info.version
+        try:
+            if not _is_worktree(version_path):
+                await runner.run("-C", version_path, "pull", "--no-rebase", "origin", version)
+            elif await GitUtil.fetch_version(git_env):
+                # 원격 추적 브랜치는 bare 저장소가 공유하므로 fetch는 bare 저장소 락 안에서 하고,
+                # 작업 트리에서는 fetch한 원격 브랜치를 병합만 함
+                await runner.run(
+                    "-C", version_path, "merge", "--no-edit", REMOTE_REF_PREFIX + version
                 )
-                _run_command(command)
-        except Exception as e:
-            raise ValueError(f"Failed to commit repository: {e}") from e
+        except GitCommandError as e:
+            output = f"{e.result.stdout}{e.result.stderr}" if e.result else ""
+            if "CONFLICT" in output or "Automatic merge failed" in output:
+                await runner.run("-C", version_path, "merge", "--abort", check=False)
+                raise GitConflictError(
+                    f"Merge conflict with origin/{version}: {e}", e.result
+                ) from e
+            raise GitCommandError(f"Failed to pull repository: {e}", e.result) from e
+        try:
+            await runner.run("-C", version_path, "push", "origin", version)
+        except GitCommandError as e:
+            raise GitCommandError(f"Failed to push repository: {e}", e.result) from e
+
+    @staticmethod
+    async def commit_version(git_env: GitEnv, user: User, message: str, paths: List[str]) -> None:
+        """Git 저장소 커밋 후 push (커밋부터 push까지 하나의 락 안에서 실행)"""
+        if git_env.version_info.is_root:
+            raise ValueError("Root version cannot be committed")
+        async with _lock(git_env):
+            if await GitUtil._commit_paths(git_env, user, message, paths):
+                await GitUtil._push_version(git_env)
@@ -0,0 +1,127 @@
+"""목록 조회 유틸
+
+목록 API의 필드 선택(`fields=`)과 커서 페이지네이션을 처리합니다.
+파서 인덱스의 레코드에서 필요한 필드만 바로 딕셔너리로 만들며, pydantic 모델을 생성하지 않습니다.
+본문(content)은 선택된 경우에만 읽습니다.
+"""
+
+import base64
+import binascii
+import json
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi.responses import JSONResponse
+
+from temply_app.core.exceptions import InvalidPageRequestError
+
+T = TypeVar("T")
+
+SortKey = Tuple[str, ...]
+
+# 필드 묶음 별칭 (예: fields=name,meta)
+META_FIELDS: Tuple[str, ...] = (
+    "description",
+    "created_at",
+    "created_by",
+    "updated_at",
+    "updated_by",
+)
+FIELD_GROUPS = {"meta": META_FIELDS}
+
+# 다음 페이지 커서를 전달하는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str]) -> Tuple[str, ...]:
+    """`fields` 파라미터(쉼표 구분)를 필드 목록으로 변환합니다.
+
+    값이 없으면 허용된 전체 필드를 반환합니다.
+    """
+    if not fields:
+        return tuple(allowed)
+
+    selected: List[str] = []
+    for name in fields.split(","):
+        name = name.strip()
+        if not name:
+            continue
+        for field_name in FIELD_GROUPS.get(name, (name,)):
+            if field_name not in allowed:
+                raise InvalidPageRequestError(f"Unknown field: {field_name}")
+            if field_name not in selected:
+                selected.append(field_name)
+    if not selected:
+        raise InvalidPageRequestError("No fields selected")
+    return tuple(selected)
+
+
+def encode_cursor(key: SortKey) -> str:
+    """정렬 키를 커서 문자열로 변환"""
+    raw = json.dumps(list(key), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """커서 문자열을 정렬 키로 변환"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidPageRequestError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(key, list) or not all(isinstance(item, str) for item in key):
+        raise InvalidPageRequestError(f"Invalid cursor: {cursor}")
+    return tuple(key)
+
+
+def to_jsonable(value: Any) -> Any:
+    """응답 JSON에 넣을 수 있는 값으로 변환"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def project(record: Any, fields: Sequence[str]) -> dict[str, Any]:
+    """레코드에서 선택된 필드만 딕셔너리로 변환"""
+    return {name: to_jsonable(getattr(record, name)) for name in fields}
+
+
+def paginate(
+    records: Iterable[T],
+    sort_key: Callable[[T], SortKey],
+    fields: Sequence[str],
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> tuple[List[dict[str, Any]], Optional[str]]:
+    """정렬 키 기준 커서 페이지네이션
+
+    Args:
+        records: 파서 인덱스 레코드
+        sort_key: 레코드의 정렬 키 (커서로 사용되므로 유일해야 함)
+        fields: 응답에 포함할 필드
+        cursor: 이전 페이지의 마지막 정렬 키 커서
+        limit: 페이지 크기 (없으면 전체)
+
+    Returns:
+        tuple[List[dict[str, Any]], Optional[str]]: (페이지 항목, 다음 페이지 커서)
+    """
+    ordered = sorted(records, key=sort_key)
+    if cursor:
+        ordered = ordered[bisect_right(ordered, decode_cursor(cursor), key=sort_key) :]
+
+    next_cursor = None
+    if limit is not None and len(ordered) > limit:
+        ordered = ordered[:limit]
+        next_cursor = encode_cursor(sort_key(ordered[-1]))
+    return [project(record, fields) for record in ordered], next_cursor
+
+
+def page_response(items: List[dict[str, Any]], next_cursor: Optional[str]) -> JSONResponse:
+    """목록 응답 생성 (다음 페이지 커서는 헤더로 전달)"""
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return JSONResponse(content=items, headers=headers)
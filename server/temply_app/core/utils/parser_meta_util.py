@@ -4,29 +4,23 @@ This module provides functionality to parse Jinja2 meta comments.
 """
 
 import re
+from pathlib import Path
 
 from temply_app.core.temply.parser.meta_model import JST, BaseMetaData
 
+# 메타데이터 블록 패턴 (모듈 로드 시 한 번만 컴파일)
+META_PATTERN = re.compile(r"^\s*{#-\s*([\s\S]*?)\s*-#}\s*")
+META_START = "{#-"
+META_END = "-#}"
 
-def parse(content: str) -> tuple[BaseMetaData, str]:
-    """파일의 시작 부분에 있는 메타데이터 블록을 파싱하고 제거합니다.
-
-    Args:
-        content (str): 파싱할 전체 내용
+# 헤더 읽기 단위 (문자 수)
+HEADER_CHUNK_SIZE = 1024
 
-    Returns:
-        tuple[BaseMetaData, str]: (파싱된 메타데이터, 메타데이터 블록이 제거된 나머지 내용)
-    """
-    block = content
-    # 메타데이터 블록 찾기
-    pattern = r"^\s*{#-\s*([\s\S]*?)\s*-#}\s*"
-    match = re.search(pattern, block)
-    if not match:
-        return BaseMetaData(), block
 
-    # 메타데이터 파싱
+def _build_meta(meta_block: str) -> BaseMetaData:
+    """메타데이터 블록 내용(`{#-`, `-#}` 제외)을 BaseMetaData로 변환"""
     meta_dict = {}
-    for line in match.group(1).split("\n"):
+    for line in meta_block.split("\n"):
         line = line.strip()
         if not line or ":" not in line:
             continue
@@ -38,27 +32,72 @@ def parse(content: str) -> tuple[BaseMetaData, str]:
         # 빈 값은 None으로 처리
         meta_dict[key] = None if not value else value
 
-    # BaseMetaData 객체 생성
-    if match:
-        # 메타데이터 블록 이후의 내용만 사용
-        block = block[match.end() :].lstrip()
-
     description = meta_dict.get("description", None)
     if description:
         description = description.replace("\\n", "\n")
 
-    return (
-        BaseMetaData(
-            description=description,
-            created_at=BaseMetaData.parse_datetime(meta_dict.get("created_at")),
-            created_by=meta_dict.get("created_by"),
-            updated_at=BaseMetaData.parse_datetime(meta_dict.get("updated_at")),
-            updated_by=meta_dict.get("updated_by"),
-        ),
-        block,
+    return BaseMetaData(
+        description=description,
+        created_at=BaseMetaData.parse_datetime(meta_dict.get("created_at")),
+        created_by=meta_dict.get("created_by"),
+        updated_at=BaseMetaData.parse_datetime(meta_dict.get("updated_at")),
+        updated_by=meta_dict.get("updated_by"),
     )
 
 
+def parse(content: str) -> tuple[BaseMetaData, str]:
+    """파일의 시작 부분에 있는 메타데이터 블록을 파싱하고 제거합니다.
+
+    Args:
+        content (str): 파싱할 전체 내용
+
+    Returns:
+        tuple[BaseMetaData, str]: (파싱된 메타데이터, 메타데이터 블록이 제거된 나머지 내용)
+    """
+    match = META_PATTERN.match(content)
+    if not match:
+        return BaseMetaData(), content
+
+    # 메타데이터 블록 이후의 내용만 사용
+    return _build_meta(match.group(1)), content[match.end() :].lstrip()
+
+
+def read_meta(path: Path, encoding: str, chunk_size: int = HEADER_CHUNK_SIZE) -> BaseMetaData:
+    """파일 앞부분의 메타데이터 블록만 읽어서 파싱합니다.
+
+    본문은 읽지 않고 `-#}` 종료 표시가 나올 때까지만 읽습니다.
+    메타데이터 블록이 없으면 빈 BaseMetaData를 반환합니다.
+
+    Args:
+        path (Path): 파일 경로
+        encoding (str): 파일 인코딩
+        chunk_size (int): 한 번에 읽을 문자 수
+
+    Returns:
+        BaseMetaData: 파싱된 메타데이터
+    """
+    head = ""
+    with open(path, "r", encoding=encoding) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            # 종료 표시가 청크 경계에 걸칠 수 있으므로 이전 끝부분부터 검색
+            search_from = max(len(head) - len(META_END) + 1, 0)
+            head += chunk
+
+            stripped = head.lstrip()
+            if len(stripped) >= len(META_START) and not stripped.startswith(META_START):
+                return BaseMetaData()
+            if head.find(META_END, search_from) >= 0:
+                break
+
+    match = META_PATTERN.match(head)
+    if not match:
+        return BaseMetaData()
+    return _build_meta(match.group(1))
+
+
 def format_meta_block(meta: BaseMetaData) -> str:
     """Make meta in Jinja format."""
     lines = ["{#-"]
@@ -0,0 +1,73 @@
+"""
+버전 리비전 조회
+
+git 명령을 실행하지 않고 .git 파일을 직접 읽어 HEAD 커밋 SHA를 조회합니다.
+일반 저장소, worktree(.git 파일 + commondir), packed-refs, detached HEAD를 지원합니다.
+"""
+
+import os
+from typing import Optional
+
+SHA_LENGTH = 40
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def resolve_git_dir(work_tree: str) -> Optional[str]:
+    """작업 디렉토리의 git 디렉토리 (worktree이면 .git 파일이 가리키는 디렉토리)"""
+    dot_git = os.path.join(work_tree, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    content = _read(dot_git)
+    if content is None or not content.startswith("gitdir:"):
+        return None
+    git_dir = content[len("gitdir:") :].strip()
+    return git_dir if os.path.isabs(git_dir) else os.path.normpath(os.path.join(work_tree, git_dir))
+
+
+def _common_dir(git_dir: str) -> str:
+    common = _read(os.path.join(git_dir, "commondir"))
+    if common is None:
+        return git_dir
+    return common if os.path.isabs(common) else os.path.normpath(os.path.join(git_dir, common))
+
+
+def _read_packed_ref(common_dir: str, ref: str) -> Optional[str]:
+    packed = _read(os.path.join(common_dir, "packed-refs"))
+    if packed is None:
+        return None
+    for line in packed.splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def read_head_sha(work_tree: str) -> Optional[str]:
+    """HEAD 커밋 SHA 조회 (git 저장소가 아니거나 읽을 수 없으면 None)"""
+    git_dir = resolve_git_dir(work_tree)
+    if git_dir is None:
+        return None
+    head = _read(os.path.join(git_dir, "HEAD"))
+    if head is None:
+        return None
+    if not head.startswith("ref:"):
+        # detached HEAD
+        return head if len(head) == SHA_LENGTH else None
+
+    ref = head[len("ref:") :].strip()
+    # worktree별 ref(HEAD 등)는 git_dir, 브랜치 ref는 공통 디렉토리에 있음
+    common_dir = _common_dir(git_dir)
+    for base in (git_dir, common_dir):
+        sha = _read(os.path.join(base, ref))
+        if sha:
+            return sha
+    return _read_packed_ref(common_dir, ref)
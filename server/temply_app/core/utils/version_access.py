@@ -0,0 +1,82 @@
+"""
+버전 접근 기록
+
+버전 환경을 조회할 때마다 마지막 접근 시간을 기록합니다.
+같은 EFS를 공유하는 다른 프로세스와 재시작 후에도 알 수 있도록 `{efs}/.access/{버전}` 파일의
+수정 시간으로 남기며, 파일 갱신은 버전별로 일정 간격에 한 번만 합니다.
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from temply_app.core.config import Config
+
+
+class VersionAccessTracker:
+    """버전별 마지막 접근 시간 기록"""
+
+    def __init__(self, access_dir_name: str, touch_interval: float) -> None:
+        self.access_dir_name = access_dir_name
+        self.touch_interval = touch_interval
+        self._accessed_at: Dict[Tuple[str, str], float] = {}
+        self._touched_at: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    def _marker_path(self, root_path: str, version: str) -> str:
+        return os.path.join(root_path, self.access_dir_name, version)
+
+    def touch(self, root_path: str, version: str) -> None:
+        """접근 기록 (접근 기록 파일은 touch_interval 간격으로만 갱신)"""
+        now = time.time()
+        key = (root_path, version)
+        with self._lock:
+            self._accessed_at[key] = now
+            if now - self._touched_at.get(key, 0.0) < self.touch_interval:
+                return
+            self._touched_at[key] = now
+        path = self._marker_path(root_path, version)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "a", encoding="utf-8"):
+                pass
+            os.utime(path, (now, now))
+        except OSError:
+            # 접근 기록 실패가 조회를 막지 않도록 무시 (메모리 기록은 유지)
+            pass
+
+    def last_access(self, root_path: str, version: str) -> Optional[float]:
+        """마지막 접근 시간 (현재 프로세스 기록과 접근 기록 파일 중 최신, 기록이 없으면 None)"""
+        with self._lock:
+            accessed_at = self._accessed_at.get((root_path, version))
+        try:
+            marker_time: Optional[float] = os.stat(self._marker_path(root_path, version)).st_mtime
+        except OSError:
+            marker_time = None
+        times = [t for t in (accessed_at, marker_time) if t is not None]
+        return max(times) if times else None
+
+    def forget(self, root_path: str, version: str) -> None:
+        """접근 기록 삭제 (버전 디렉토리 제거 후 호출)"""
+        key = (root_path, version)
+        with self._lock:
+            self._accessed_at.pop(key, None)
+            self._touched_at.pop(key, None)
+        try:
+            os.remove(self._marker_path(root_path, version))
+        except OSError:
+            pass
+
+
+_version_access_tracker: Optional[VersionAccessTracker] = None
+
+
+def get_version_access_tracker(config: Config) -> VersionAccessTracker:
+    """Get Version Access Tracker"""
+    global _version_access_tracker  # pylint: disable=global-statement
+    if _version_access_tracker is None:
+        _version_access_tracker = VersionAccessTracker(
+            config.version_access_dir_name, config.version_access_touch_interval_seconds
+        )
+    return _version_access_tracker
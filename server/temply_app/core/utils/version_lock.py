@@ -0,0 +1,116 @@
+"""
+버전별 git 작업 락
+
+커밋/push, pull(fast-forward), 버전 생성/삭제처럼 작업 트리와 브랜치를 바꾸는 git 작업을
+버전별로 직렬화합니다. 프로세스 안에서는 asyncio.Lock으로, 같은 EFS를 공유하는 다른
+프로세스(uvicorn 워커 등)와는 `{efs}/.locks/version-{버전}.lock` 파일의 flock으로 배타 실행합니다.
+파일 읽기와 렌더링은 이 락을 사용하지 않으므로 git 작업 중에도 막히지 않습니다.
+"""
+
+import asyncio
+import fcntl
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from temply_app.core.config import Config
+from temply_app.core.exceptions import GitLockTimeoutError
+
+# 다른 프로세스가 파일 락을 가지고 있을 때 다시 시도하는 간격 (초)
+FILE_LOCK_POLL_INTERVAL = 0.05
+
+_LoopLocks = Dict[str, asyncio.Lock]
+
+
+class VersionLock:
+    """버전별 git 작업 락"""
+
+    def __init__(self, lock_dir_name: str, timeout: float) -> None:
+        self.lock_dir_name = lock_dir_name
+        self.timeout = timeout
+        # asyncio.Lock은 이벤트 루프에 묶이므로 루프별로 생성
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopLocks]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def lock_path(self, root_path: str, name: str) -> str:
+        """락 파일 경로
+
+        bare 저장소처럼 "."으로 시작하는 이름은 `repo-`, 버전(브랜치) 이름은 `version-` 접두사를
+        붙여 `bare` 브랜치와 `.bare` 저장소가 같은 락 파일을 사용하지 않게 합니다.
+        """
+        if name.startswith("."):
+            return os.path.join(root_path, self.lock_dir_name, f"repo-{name[1:]}.lock")
+        return os.path.join(root_path, self.lock_dir_name, f"version-{name}.lock")
+
+    def _get_lock(self, path: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        locks = self._locks.get(loop)
+        if locks is None:
+            locks = self._locks[loop] = {}
+        lock = locks.get(path)
+        if lock is None:
+            lock = locks[path] = asyncio.Lock()
+        return lock
+
+    async def _acquire_file(self, path: str, deadline: float) -> int:
+        """파일 락 획득 (다른 프로세스가 가지고 있으면 대기)"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return fd
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise GitLockTimeoutError(
+                            f"Timed out waiting for {path} held by another process"
+                        ) from None
+                    await asyncio.sleep(FILE_LOCK_POLL_INTERVAL)
+        except BaseException:
+            os.close(fd)
+            raise
+
+    @staticmethod
+    def _release_file(fd: int) -> None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    @asynccontextmanager
+    async def hold(self, root_path: str, name: str) -> AsyncIterator[None]:
+        """버전 git 작업 락 (프로세스 내부 + 프로세스 간)
+
+        Raises:
+            GitLockTimeoutError: 시간 제한 안에 락을 얻지 못함
+        """
+        path = self.lock_path(root_path, name)
+        deadline = time.monotonic() + self.timeout
+        lock = self._get_lock(path)
+        try:
+            await asyncio.wait_for(lock.acquire(), self.timeout)
+        except asyncio.TimeoutError as e:
+            raise GitLockTimeoutError(f"Timed out waiting for {path}") from e
+        try:
+            fd = await self._acquire_file(path, deadline)
+            try:
+                yield
+            finally:
+                self._release_file(fd)
+        finally:
+            lock.release()
+
+
+_version_lock: Optional[VersionLock] = None
+
+
+def get_version_lock(config: Config) -> VersionLock:
+    """Get Version Lock"""
+    global _version_lock  # pylint: disable=global-statement
+    if _version_lock is None:
+        _version_lock = VersionLock(config.git_lock_dir_name, config.git_lock_timeout_seconds)
+    return _version_lock
@@ -0,0 +1,34 @@
+"""Webhook 유틸
+
+GitHub 형식 push webhook의 서명(`X-Hub-Signature-256`) 검증과 브랜치 이름 추출을 담당합니다.
+"""
+
+import hashlib
+import hmac
+from typing import Any, Dict, Optional
+
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+EVENT_HEADER = "X-GitHub-Event"
+SIGNATURE_PREFIX = "sha256="
+BRANCH_REF_PREFIX = "refs/heads/"
+
+
+def make_signature(secret: str, body: bytes) -> str:
+    """요청 본문의 HMAC-SHA256 서명 (`sha256=<hex>`)"""
+    digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return SIGNATURE_PREFIX + digest
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """서명 검증 (시간 차이로 값이 드러나지 않도록 상수 시간 비교)"""
+    if not signature or not signature.startswith(SIGNATURE_PREFIX):
+        return False
+    return hmac.compare_digest(make_signature(secret, body), signature)
+
+
+def get_push_branch(payload: Dict[str, Any]) -> Optional[str]:
+    """push 이벤트의 브랜치 이름 (태그 등 브랜치가 아닌 ref이면 None)"""
+    ref = payload.get("ref")
+    if not isinstance(ref, str) or not ref.startswith(BRANCH_REF_PREFIX):
+        return None
+    return ref[len(BRANCH_REF_PREFIX) :] or None
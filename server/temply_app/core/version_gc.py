@@ -0,0 +1,138 @@
+"""
+버전 디렉토리 디스크 정리
+
+PR 버전이 늘어도 EFS 사용량과 디렉토리 목록 조회 시간이 커지지 않도록,
+오래 접근하지 않은 버전(TTL)과 디스크 예산을 넘는 버전(LRU)의 worktree를 디스크에서 정리합니다.
+브랜치는 유지하므로 정리된 버전은 다음 접근 시 원격 브랜치에서 다시 체크아웃합니다.
+메인 버전, 커밋 큐에 대기 중인 변경이 있는 버전, 커밋/push되지 않은 변경이 있는 버전은 정리하지 않습니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from temply_app.core.commit_queue import CommitQueueState, get_commit_queue
+from temply_app.core.config import Config
+from temply_app.core.git_env import GitEnv
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.core.utils.version_access import get_version_access_tracker
+from temply_app.models.common_model import VersionInfo
+
+logger = logging.getLogger(__name__)
+
+
+def _dir_size(path: str, seen: Set[Tuple[int, int]]) -> int:
+    """디렉토리 디스크 사용량 (하드링크로 공유하는 파일은 처음 본 디렉토리에만 계산)"""
+    total = 0
+    for dir_path, _, file_names in os.walk(path):
+        for file_name in file_names:
+            try:
+                stat = os.lstat(os.path.join(dir_path, file_name))
+            except OSError:
+                continue
+            inode = (stat.st_dev, stat.st_ino)
+            if inode in seen:
+                continue
+            seen.add(inode)
+            total += stat.st_blocks * 512
+    return total
+
+
+class VersionGC:
+    """버전 디렉토리 디스크 정리"""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.root_path = os.path.abspath(config.noti_temply_dir)
+        self.ttl = config.version_gc_ttl_seconds
+        self.max_bytes = config.version_gc_max_bytes
+        self.min_idle = config.version_gc_min_idle_seconds
+
+    @property
+    def enabled(self) -> bool:
+        """디스크 정리 사용 여부"""
+        return self.config.is_version_gc_enabled()
+
+    def _last_access(self, version: str) -> float:
+        """마지막 접근 시간 (기록이 없으면 디렉토리 수정 시간)"""
+        accessed_at = get_version_access_tracker(self.config).last_access(self.root_path, version)
+        if accessed_at is not None:
+            return accessed_at
+        try:
+            return os.stat(os.path.join(self.root_path, version)).st_mtime
+        except OSError:
+            return 0.0
+
+    def _list_versions(self) -> List[Tuple[str, float, int]]:
+        """(버전, 마지막 접근 시간, 디스크 사용량) 목록 (최근 접근 순, 메인 버전 제외)"""
+        main_name = self.config.noti_temply_main_version_name
+        names = [
+            name
+            for name in os.listdir(self.root_path)
+            if not name.startswith(".")
+            and name != main_name
+            and os.path.isdir(os.path.join(self.root_path, name))
+        ]
+        accessed = sorted(((self._last_access(name), name) for name in names), reverse=True)
+        # 공유 파일은 메인 버전, 최근 접근한 버전 순으로 먼저 계산하여 오래된 버전의 사용량은
+        # 정리했을 때 실제로 줄어드는 크기가 되도록 함
+        seen: Set[Tuple[int, int]] = set()
+        _dir_size(os.path.join(self.root_path, main_name), seen)
+        return [
+            (name, accessed_at, _dir_size(os.path.join(self.root_path, name), seen))
+            for accessed_at, name in accessed
+        ]
+
+    def _has_pending_commits(self, version: str) -> bool:
+        status = get_commit_queue(self.config).get_status(version)
+        return status["state"] != CommitQueueState.IDLE or bool(status.get("unpushed"))
+
+    async def collect(self) -> Dict[str, Any]:
+        """디스크 정리 실행 (버전별 정리는 git 작업 락 안에서 실행)"""
+        if not self.enabled:
+            return {"evicted": [], "kept": 0, "total_bytes": 0, "freed_bytes": 0}
+        versions = await asyncio.to_thread(self._list_versions)
+        total = sum(size for _, _, size in versions)
+        now = time.time()
+        evicted: List[str] = []
+        freed = 0
+        # 오래 접근하지 않은 버전부터 정리
+        for version, accessed_at, size in reversed(versions):
+            idle = now - accessed_at
+            expired = 0 < self.ttl <= idle
+            over_budget = 0 < self.max_bytes < total - freed and idle >= self.min_idle
+            if not expired and not over_budget:
+                continue
+            if self._has_pending_commits(version):
+                continue
+            git_env = GitEnv(self.config, VersionInfo(self.config, version))
+            try:
+                if not await GitUtil.evict_version(git_env):
+                    continue
+            except ValueError as e:
+                logger.warning("Failed to evict version %s: %s", version, e)
+                continue
+            get_version_access_tracker(self.config).forget(self.root_path, version)
+            evicted.append(version)
+            freed += size
+        if evicted:
+            logger.info("Evicted %d versions (%d bytes): %s", len(evicted), freed, evicted)
+        return {
+            "evicted": evicted,
+            "kept": len(versions) - len(evicted),
+            "total_bytes": total - freed,
+            "freed_bytes": freed,
+        }
+
+
+_version_gc: Optional[VersionGC] = None
+
+
+def get_version_gc(config: Config) -> VersionGC:
+    """Get Version GC"""
+    global _version_gc  # pylint: disable=global-statement
+    if _version_gc is None:
+        _version_gc = VersionGC(config)
+    return _version_gc
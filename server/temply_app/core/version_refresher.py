@@ -0,0 +1,269 @@
+"""
+버전 목록 백그라운드 갱신
+
+GET /versions 요청마다 git fetch/clone/pull을 실행하지 않도록,
+백그라운드 작업이 주기적으로 버전 목록과 버전별 HEAD SHA를 갱신하고 조회 API는 캐시에서 응답합니다.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from temply_app.core.config import Config
+from temply_app.core.git_env import GitEnv
+from temply_app.core.temply.parser.meta_model import JST
+from temply_app.core.utils.cache_util import (
+    sync_cached_temply_version_env,
+    temply_version_env_cache_clear,
+)
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.core.version_gc import get_version_gc
+from temply_app.models.common_model import ReturnVersionInfo, VersionInfo
+
+logger = logging.getLogger(__name__)
+
+
+class VersionRefresher:
+    """버전 목록 캐시와 백그라운드 갱신 작업"""
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.interval = config.version_refresh_interval_seconds
+        self._versions: Dict[str, ReturnVersionInfo] = {}
+        self._refreshed_at: Optional[datetime] = None
+        self._last_error: Optional[str] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._version_tasks: Dict[str, asyncio.Task] = {}
+        self._stale_versions: Set[str] = set()
+
+    @property
+    def is_loaded(self) -> bool:
+        """버전 목록을 한 번이라도 조회했는지 여부"""
+        return self._refreshed_at is not None
+
+    def get_versions(self) -> List[ReturnVersionInfo]:
+        """캐시된 버전 목록"""
+        return list(self._versions.values())
+
+    def get_version(self, version: str) -> Optional[ReturnVersionInfo]:
+        """캐시된 버전 정보"""
+        return self._versions.get(version)
+
+    async def lookup(self, version: str, refresh: bool = False) -> Optional[ReturnVersionInfo]:
+        """버전 하나 조회 (다른 버전은 조회/갱신하지 않음)
+
+        캐시에 있으면 캐시에서 응답하고, 없거나 refresh=True이면 해당 버전의
+        디렉토리(로컬) 또는 브랜치(git)만 확인합니다.
+        git 사용 시 refresh=True이면 원격 브랜치를 fetch하고 버전 디렉토리가 있으면 fast-forward합니다.
+        """
+        if not refresh:
+            cached = self._versions.get(version)
+            if cached is not None:
+                return cached
+        if version.startswith("."):
+            return None
+
+        version_info = VersionInfo(self.config, version)
+        if self.config.is_git_used():
+            return_version_info = await self._lookup_git_version(version_info, refresh)
+        else:
+            return_version_info = self._lookup_local_version(version_info)
+        if return_version_info is None:
+            self.remove_version(version)
+        else:
+            self.set_version(return_version_info)
+        return return_version_info
+
+    async def refresh_version(self, version: str) -> Optional[ReturnVersionInfo]:
+        """버전 하나만 갱신하고 캐시된 버전 환경에 변경분 반영 (push webhook에서 호출)
+
+        같은 버전의 갱신이 진행 중이면 새로 실행하지 않고, 진행 중인 갱신이 끝난 뒤
+        한 번 더 실행하여 그 사이의 push를 반영합니다.
+        """
+        task = self._version_tasks.get(version)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._refresh_version(version))
+            self._version_tasks[version] = task
+        else:
+            self._stale_versions.add(version)
+        return await asyncio.shield(task)
+
+    async def _refresh_version(self, version: str) -> Optional[ReturnVersionInfo]:
+        version_info = VersionInfo(self.config, version)
+        while True:
+            self._stale_versions.discard(version)
+            return_version_info = await self.lookup(version, refresh=True)
+            if return_version_info is None:
+                temply_version_env_cache_clear(version_info)
+            elif await sync_cached_temply_version_env(version_info):
+                logger.info("Applied changes of version %s", version)
+            if version not in self._stale_versions:
+                return return_version_info
+
+    async def _lookup_git_version(
+        self, version_info: VersionInfo, refresh: bool
+    ) -> Optional[ReturnVersionInfo]:
+        git_env = GitEnv(self.config, version_info)
+        if refresh:
+            if not await GitUtil.fetch_version(git_env):
+                return None
+            if os.path.exists(git_env.version_path):
+                await GitUtil.refresh_version(git_env)
+        else:
+            await GitUtil.ensure_repository(git_env)
+        if os.path.exists(git_env.version_path):
+            head_sha = await GitUtil.get_head_sha(git_env)
+        else:
+            head_sha = await GitUtil.get_remote_sha(git_env)
+            if head_sha is None:
+                return None
+        return ReturnVersionInfo(
+            version=version_info.version, is_root=version_info.is_root, head_sha=head_sha
+        )
+
+    def _lookup_local_version(self, version_info: VersionInfo) -> Optional[ReturnVersionInfo]:
+        if not os.path.isdir(os.path.join(self.config.noti_temply_dir, version_info.version)):
+            return None
+        return ReturnVersionInfo(
+            version=version_info.version, is_root=version_info.is_root, head_sha=None
+        )
+
+    def set_version(self, version_info: ReturnVersionInfo) -> None:
+        """버전 추가/갱신 (버전 생성 후 호출)"""
+        self._versions[version_info.version] = version_info
+
+    def remove_version(self, version: str) -> None:
+        """버전 제거 (버전 삭제 후 호출)"""
+        self._versions.pop(version, None)
+
+    async def refresh(self) -> List[ReturnVersionInfo]:
+        """버전 목록 갱신
+
+        이미 갱신 중이면 새로 실행하지 않고 진행 중인 갱신 결과를 기다립니다.
+        """
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._refresh())
+            self._refresh_task = task
+        return await asyncio.shield(task)
+
+    async def _refresh(self) -> List[ReturnVersionInfo]:
+        try:
+            if self.config.is_git_used():
+                versions = await self._load_git_versions()
+            else:
+                versions = self._load_local_versions()
+        except Exception as e:
+            self._last_error = str(e)
+            raise
+        self._versions = {v.version: v for v in versions}
+        self._refreshed_at = datetime.now(JST)
+        self._last_error = None
+        logger.info("Refreshed %d versions", len(versions))
+        return versions
+
+    async def _load_git_versions(self) -> List[ReturnVersionInfo]:
+        """원격 브랜치 기준 버전 목록 조회 (없는 버전은 복제, 있는 버전은 pull)
+
+        디스크 정리를 사용하면 없는 버전은 복제하지 않고 원격 브랜치의 커밋 SHA만 조회합니다.
+        (처음 접근할 때 체크아웃)
+        """
+        root_git_env = GitEnv(self.config, VersionInfo.root_version(self.config))
+        versions = []
+        for version_info in await GitUtil.get_versions(root_git_env):
+            git_env = GitEnv(self.config, version_info)
+            head_sha = None
+            try:
+                if not version_info.is_root and not os.path.exists(git_env.version_path):
+                    if self.config.is_version_gc_enabled():
+                        head_sha = await GitUtil.get_remote_sha(git_env)
+                        versions.append(
+                            ReturnVersionInfo(
+                                version=version_info.version, is_root=False, head_sha=head_sha
+                            )
+                        )
+                        continue
+                    await GitUtil.create_version(git_env)
+                await GitUtil.refresh_version(git_env)
+                head_sha = await GitUtil.get_head_sha(git_env)
+            except ValueError as e:
+                # 한 버전의 실패가 전체 목록 갱신을 막지 않도록 기록만 함
+                logger.warning("Failed to refresh version %s: %s", version_info.version, e)
+            versions.append(
+                ReturnVersionInfo(
+                    version=version_info.version,
+                    is_root=version_info.is_root,
+                    head_sha=head_sha,
+                )
+            )
+        return versions
+
+    def _load_local_versions(self) -> List[ReturnVersionInfo]:
+        """로컬 디렉토리 기준 버전 목록 조회"""
+        versions = []
+        for v in sorted(os.listdir(self.config.noti_temply_dir)):
+            # Only include directories that don't start with a dot
+            item_path = os.path.join(self.config.noti_temply_dir, v)
+            if os.path.isdir(item_path) and not v.startswith("."):
+                versions.append(
+                    ReturnVersionInfo(
+                        version=v,
+                        is_root=v == self.config.noti_temply_main_version_name,
+                        head_sha=None,
+                    )
+                )
+        return versions
+
+    def start(self) -> None:
+        """백그라운드 갱신 시작 (주기가 0 이하이면 시작하지 않음)"""
+        if self.interval <= 0:
+            return
+        task = self._loop_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+        self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 갱신 중지"""
+        task, self._loop_task = self._loop_task, None
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+                # 갱신 후 오래 접근하지 않은 버전 디렉토리 정리
+                await get_version_gc(self.config).collect()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Failed to refresh versions: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def get_status(self) -> Dict[str, Any]:
+        """갱신 상태 반환"""
+        return {
+            "versions": len(self._versions),
+            "refreshed_at": self._refreshed_at,
+            "last_error": self._last_error,
+            "interval": self.interval,
+            "running": self._loop_task is not None and not self._loop_task.done(),
+        }
+
+
+_version_refresher: Optional[VersionRefresher] = None
+
+
+def get_version_refresher(config: Config) -> VersionRefresher:
+    """Get Version Refresher"""
+    global _version_refresher  # pylint: disable=global-statement
+    if _version_refresher is None:
+        _version_refresher = VersionRefresher(config)
+    return _version_refresher
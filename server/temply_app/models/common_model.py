@@ -4,7 +4,7 @@
 
 import re
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -76,6 +76,38 @@ class ReturnVersionInfo(BaseModel):
 
     version: str = Field(..., description="버전")
     is_root: bool = Field(..., description="메인 버전 여부")
+    head_sha: Optional[str] = Field(None, description="HEAD 커밋 SHA (git 사용 시)")
+
+
+class CommitQueueStatus(BaseModel):
+    """커밋 큐 상태 모델"""
+
+    version: str = Field(..., description="버전")
+    state: str = Field(..., description="상태 (idle, pending, pushing, conflict, failed)")
+    pending_changes: int = Field(0, description="커밋 대기 중인 변경 수")
+    pending_paths: List[str] = Field(default_factory=list, description="커밋 대기 중인 파일 경로")
+    unpushed: bool = Field(False, description="push되지 않은 로컬 커밋 존재 여부")
+    commits: int = Field(0, description="생성한 커밋 수")
+    pushes: int = Field(0, description="push 횟수")
+    last_pushed_at: Optional[datetime] = Field(None, description="마지막 push 시간")
+    last_error: Optional[str] = Field(None, description="마지막 오류")
+
+
+class VersionGCResult(BaseModel):
+    """버전 디렉토리 디스크 정리 결과 모델"""
+
+    evicted: List[str] = Field(default_factory=list, description="디스크에서 정리한 버전")
+    kept: int = Field(0, description="유지한 버전 수 (메인 버전 제외)")
+    total_bytes: int = Field(0, description="정리 후 버전 디렉토리 디스크 사용량 (메인 버전 제외)")
+    freed_bytes: int = Field(0, description="정리한 디스크 사용량")
+
+
+class WebhookResult(BaseModel):
+    """webhook 처리 결과 모델"""
+
+    event: str = Field(..., description="이벤트 이름 (X-GitHub-Event)")
+    action: str = Field(..., description="처리 결과 (pong, queued, ignored)")
+    version: Optional[str] = Field(None, description="갱신할 버전 (push된 브랜치)")
 
 
 class CreateVersionRequest(BaseModel):
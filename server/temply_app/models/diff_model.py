@@ -0,0 +1,75 @@
+"""버전 비교 모델"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ChangeSet(BaseModel):
+    """추가/삭제/변경 항목 모델"""
+
+    added: List[str] = Field([], description="추가된 항목")
+    removed: List[str] = Field([], description="삭제된 항목")
+    changed: List[str] = Field([], description="변경된 항목")
+
+
+class ImpactedComponent(BaseModel):
+    """의존성 변경의 영향을 받는 템플릿 컴포넌트 모델"""
+
+    template: str = Field(..., description="템플릿 카테고리")
+    component: str = Field(..., description="템플릿 컴포넌트")
+    layouts: List[str] = Field([], description="변경된 레이아웃 (원인)")
+    partials: List[str] = Field([], description="변경되었거나 영향을 받은 파셜 (원인)")
+
+
+class VersionDiff(BaseModel):
+    """버전 비교 결과 모델"""
+
+    base: str = Field(..., description="기준 버전")
+    version: str = Field(..., description="비교 버전")
+    base_digest: str = Field(..., description="기준 버전 해시 트리 루트")
+    version_digest: str = Field(..., description="비교 버전 해시 트리 루트")
+    identical: bool = Field(..., description="변경 없음 여부")
+    layouts: ChangeSet = Field(..., description="레이아웃 변경")
+    partials: ChangeSet = Field(..., description="파셜 변경")
+    components: ChangeSet = Field(..., description="템플릿 컴포넌트 변경 (템플릿/컴포넌트)")
+    impacted_partials: List[str] = Field([], description="변경된 파셜에 (간접적으로) 의존하는 파셜")
+    impacted_components: List[ImpactedComponent] = Field(
+        [], description="레이아웃/파셜 변경의 영향을 받는 컴포넌트 (직접 변경된 컴포넌트 제외)"
+    )
+
+
+class RenderDiffRequest(BaseModel):
+    """렌더링 비교 요청 모델"""
+
+    payloads: Dict[str, Dict[str, Any]] = Field(
+        {}, description="템플릿별 렌더링 데이터 (없는 템플릿은 스키마로 생성한 샘플 데이터 사용)"
+    )
+
+
+class RenderChange(BaseModel):
+    """컴포넌트 렌더링 비교 결과 모델"""
+
+    template: str = Field(..., description="템플릿 카테고리")
+    component: str = Field(..., description="템플릿 컴포넌트")
+    status: str = Field(..., description="상태 (error, added, removed, changed)")
+    score: float = Field(..., description="변경 정도 (0: 동일, 1: 전부 변경)")
+    diff: Optional[str] = Field(None, description="렌더링 결과 unified diff")
+    error: Optional[str] = Field(None, description="렌더링 오류")
+
+
+class RenderDiffReport(BaseModel):
+    """렌더링 비교 보고서 모델"""
+
+    base: str = Field(..., description="기준 버전")
+    version: str = Field(..., description="비교 버전")
+    total: int = Field(..., description="비교한 컴포넌트 수")
+    unchanged: int = Field(..., description="결과가 같은 컴포넌트 수")
+    changed: int = Field(..., description="결과가 다른 컴포넌트 수")
+    added: int = Field(..., description="비교 버전에만 있는 컴포넌트 수")
+    removed: int = Field(..., description="기준 버전에만 있는 컴포넌트 수")
+    errors: int = Field(..., description="렌더링 오류 컴포넌트 수")
+    duration: float = Field(..., description="소요 시간 (초)")
+    results: List[RenderChange] = Field(
+        [], description="결과가 달라진 컴포넌트 (오류 > 추가/삭제 > 변경 정도 순, 동일 결과 제외)"
+    )
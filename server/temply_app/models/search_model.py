@@ -0,0 +1,20 @@
+"""검색 모델"""
+
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+
+class SearchResult(BaseModel):
+    """검색 결과 모델"""
+
+    kind: str = Field(..., description="문서 종류 (layout, partial, component)")
+    name: str = Field(..., description="레이아웃/파셜 이름 또는 템플릿/컴포넌트 경로")
+    template: Optional[str] = Field(None, description="템플릿 카테고리 (컴포넌트인 경우)")
+    component: Optional[str] = Field(None, description="템플릿 컴포넌트 (컴포넌트인 경우)")
+    score: float = Field(..., description="검색 점수")
+    field: Optional[str] = Field(None, description="스니펫을 추출한 필드 (content, description)")
+    snippet: Optional[str] = Field(None, description="검색어 주변 스니펫")
+    highlights: List[Tuple[int, int]] = Field(
+        [], description="스니펫 내 검색어 위치 목록 ([start, end))"
+    )
@@ -0,0 +1,159 @@
+"""
+버전 비교 리포지토리
+"""
+
+import time
+from dataclasses import asdict
+from typing import Any, Dict, Tuple
+
+from temply_app.core.config import Config
+from temply_app.core.render_regression import (
+    RenderStatus,
+    build_tasks,
+    render_target,
+    run_render_regression,
+    summarize,
+)
+from temply_app.core.temply.parser.meta_model import (
+    LayoutMetaData,
+    PartialMetaData,
+    TemplateComponentMetaData,
+)
+from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.temply.version_tree import (
+    LAYOUTS,
+    PARTIALS,
+    TEMPLATES,
+    HashNode,
+    diff_version_trees,
+    find_dependent_partials,
+    find_impacted_components,
+    get_version_tree,
+)
+from temply_app.core.utils.cache_util import (
+    get_layout_parser,
+    get_partial_parser,
+    get_template_parser,
+)
+from temply_app.models.common_model import VersionInfo
+from temply_app.models.diff_model import (
+    ChangeSet,
+    ImpactedComponent,
+    RenderChange,
+    RenderDiffReport,
+    VersionDiff,
+)
+
+_Snapshot = Tuple[
+    HashNode,
+    Dict[str, LayoutMetaData],
+    Dict[str, PartialMetaData],
+    Dict[str, TemplateComponentMetaData],
+]
+
+
+class DiffRepository:
+    """버전 비교 리포지토리"""
+
+    def __init__(
+        self,
+        config: Config,
+        base_version_info: VersionInfo,
+        base_env: TemplyEnv,
+        version_info: VersionInfo,
+        temply_env: TemplyEnv,
+    ):
+        """초기화"""
+        self.config = config
+        self.base_version_info = base_version_info
+        self.base_env = base_env
+        self.version_info = version_info
+        self.temply_env = temply_env
+
+    async def _snapshot(self, temply_env: TemplyEnv) -> _Snapshot:
+        """버전의 해시 트리와 인덱스 조회"""
+        layout_parser = get_layout_parser(temply_env)
+        partial_parser = get_partial_parser(temply_env)
+        template_parser = get_template_parser(temply_env)
+        # 파서 초기화 완료 대기
+        await layout_parser.get_layouts()
+        await partial_parser.get_partials()
+        await template_parser.get_components()
+
+        async with temply_env.rw_lock.read():
+            layouts = dict(layout_parser.nodes)
+            partials = dict(partial_parser.nodes)
+            components = dict(template_parser.nodes)
+            tree = get_version_tree(temply_env, layouts, partials, components)
+        return tree, layouts, partials, components
+
+    async def diff(self) -> VersionDiff:
+        """기준 버전 대비 변경 항목과 의존성으로 영향을 받는 컴포넌트 조회"""
+        base_tree, *_ = await self._snapshot(self.base_env)
+        tree, _, partials, components = await self._snapshot(self.temply_env)
+        changes = diff_version_trees(base_tree, tree)
+
+        changed_layouts = changes[LAYOUTS].names()
+        changed_partials = changes[PARTIALS].names()
+        changed_components = changes[TEMPLATES].names()
+        impacted_partials = find_dependent_partials(partials, changed_partials)
+        impacted = find_impacted_components(
+            components, changed_layouts, changed_partials | impacted_partials
+        )
+        return VersionDiff(
+            base=self.base_version_info.version,
+            version=self.version_info.version,
+            base_digest=base_tree.digest,
+            version_digest=tree.digest,
+            identical=base_tree.digest == tree.digest,
+            layouts=ChangeSet(**asdict(changes[LAYOUTS])),
+            partials=ChangeSet(**asdict(changes[PARTIALS])),
+            components=ChangeSet(**asdict(changes[TEMPLATES])),
+            impacted_partials=sorted(impacted_partials),
+            impacted_components=[
+                ImpactedComponent(
+                    template=components[path].template,
+                    component=components[path].component,
+                    layouts=via_layouts,
+                    partials=via_partials,
+                )
+                for path, (via_layouts, via_partials) in sorted(impacted.items())
+                if path not in changed_components
+            ],
+        )
+
+    async def render_diff(self, payloads: Dict[str, Dict[str, Any]]) -> RenderDiffReport:
+        """기준 버전 대비 전체 컴포넌트의 렌더링 결과 비교"""
+        started = time.monotonic()
+        tasks, _ = build_tasks(self.base_env, self.temply_env, payloads)
+        # 작업 프로세스는 같은 디렉토리로 환경을 만들어 렌더링 (파일 트리가 같으면 재사용)
+        outcomes = await run_render_regression(
+            self.config,
+            render_target(self.base_version_info.version, self.base_env),
+            render_target(self.version_info.version, self.temply_env),
+            tasks,
+        )
+        counts = summarize(outcomes)
+        return RenderDiffReport(
+            base=self.base_version_info.version,
+            version=self.version_info.version,
+            total=len(outcomes),
+            unchanged=counts[RenderStatus.UNCHANGED],
+            changed=counts[RenderStatus.CHANGED],
+            added=counts[RenderStatus.ADDED],
+            removed=counts[RenderStatus.REMOVED],
+            errors=counts[RenderStatus.ERROR],
+            duration=round(time.monotonic() - started, 3),
+            results=[
+                RenderChange(
+                    template=outcome.template,
+                    component=outcome.component,
+                    status=outcome.status.value,
+                    score=outcome.score,
+                    diff=outcome.diff,
+                    error=outcome.error,
+                )
+                for outcome in outcomes
+                if outcome.status != RenderStatus.UNCHANGED
+            ],
+        )
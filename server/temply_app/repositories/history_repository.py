@@ -0,0 +1,91 @@
+"""
+이력 리포지토리
+
+버전 브랜치의 과거 커밋(커밋 SHA 또는 시각)을 체크아웃 없이 git 객체에서 조회합니다.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Optional
+
+from jinja2 import TemplateNotFound
+
+from temply_app.core.config import Config
+from temply_app.core.exceptions import GitRevisionNotFoundError, TemplateNotFoundError
+from temply_app.core.temply.git_object_store import get_git_object_store
+from temply_app.core.temply.git_temply_env import GitTemplyEnv
+from temply_app.core.temply.parser.meta_model import JST
+from temply_app.core.utils.cache_util import get_git_temply_env
+from temply_app.core.utils.git_util import REMOTE_REF_PREFIX
+from temply_app.models.common_model import VersionInfo
+
+COMMIT_PATTERN = re.compile(r"^[0-9a-f]{4,40}$")
+FULL_SHA_LENGTH = 40
+
+
+class HistoryRepository:
+    """이력 리포지토리"""
+
+    def __init__(self, config: Config, version_info: VersionInfo):
+        """초기화"""
+        self.config = config
+        self.version_info = version_info
+
+    async def get_temply_env(
+        self, commit: Optional[str] = None, at: Optional[datetime] = None
+    ) -> GitTemplyEnv:
+        """커밋 SHA 또는 시각(해당 시각 이전 버전 브랜치의 마지막 커밋)의 Temply 환경 조회
+
+        Raises:
+            ValueError: git을 사용하지 않거나 commit/at 중 하나만 지정하지 않은 경우
+            GitRevisionNotFoundError: 커밋을 찾을 수 없거나 버전 브랜치에 포함되지 않은 경우
+        """
+        if not self.config.is_git_used():
+            raise ValueError("History is only available when git is used")
+        if (commit is None) == (at is None):
+            raise ValueError("Specify either commit or at")
+
+        store = get_git_object_store(self.config)
+        ref = REMOTE_REF_PREFIX + self.version_info.version
+        if commit is not None:
+            commit = commit.lower()
+            if not COMMIT_PATTERN.match(commit):
+                raise ValueError(f"Invalid commit: {commit}")
+            if len(commit) < FULL_SHA_LENGTH:
+                commit, _ = await store.resolve(commit)
+            # 다른 버전 브랜치의 커밋을 이 버전의 이력으로 조회하지 않도록 확인
+            if not await store.is_ancestor(commit, ref):
+                raise GitRevisionNotFoundError(
+                    f"Commit {commit} not found in version {self.version_info.version}"
+                )
+        else:
+            assert at is not None
+            if at.tzinfo is None:
+                at = at.replace(tzinfo=JST)
+            commit = await store.resolve_before(ref, at)
+        return await get_git_temply_env(self.config, commit)
+
+    async def get_template_schema(self, temply_env: GitTemplyEnv, template: str) -> dict[str, Any]:
+        """템플릿 스키마 생성"""
+        try:
+            return temply_env.get_template_schema(template)
+        except ValueError as e:
+            raise TemplateNotFoundError(f"Template {template} not found") from e
+
+    async def render_component(
+        self, temply_env: GitTemplyEnv, template: str, component: str, data: dict[str, Any]
+    ) -> str:
+        """템플릿 컴포넌트 렌더링"""
+        try:
+            return temply_env.render_component(template, component, data)
+        except TemplateNotFound as e:
+            raise TemplateNotFoundError(f"Template {template}/{component} not found") from e
+
+    async def render_template(
+        self, temply_env: GitTemplyEnv, template: str, data: dict[str, Any]
+    ) -> dict[str, str]:
+        """템플릿의 모든 컴포넌트 렌더링"""
+        try:
+            return temply_env.render_template(template, data)
+        except ValueError as e:
+            raise TemplateNotFoundError(f"Template {template} not found") from e
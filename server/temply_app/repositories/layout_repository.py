@@ -2,15 +2,16 @@
 레이아웃 리포지토리
 """
 
-from typing import List
+from typing import Any, List, Optional
 
+from temply_app.core.commit_queue import get_commit_queue
 from temply_app.core.exceptions import LayoutNotFoundError
 from temply_app.core.git_env import GitEnv
 from temply_app.core.temply.parser.layout_parser import LayoutParser
 from temply_app.core.temply.parser.template_parser import TemplateParser
 from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.utils import etag_util, page_util
 from temply_app.core.utils.cache_util import get_layout_parser, get_template_parser
-from temply_app.core.utils.git_util import GitUtil
 from temply_app.models.common_model import User, VersionInfo
 from temply_app.models.layout_model import Layout, LayoutCreate, LayoutUpdate
 
@@ -42,7 +43,7 @@ class LayoutRepository:
             user, layout_create.name, layout_create.content, layout_create.description
         )
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Create layout {layout_create.name}",
@@ -57,6 +58,10 @@ class LayoutRepository:
             raise LayoutNotFoundError(f"Layout {layout_name} not found")
         return Layout.model_validate(layout)
 
+    async def get_etag(self, layout_name: str) -> str:
+        """레이아웃 ETag 조회 (모델 변환 없이 인덱스 레코드에서 생성)"""
+        return etag_util.record_etag(await self.layout_parser.get_layout(layout_name))
+
     async def update(
         self, user: User, layout_name: str, layout_update: LayoutUpdate
     ) -> tuple[Layout, List[str]]:
@@ -74,7 +79,7 @@ class LayoutRepository:
             if updated_file:
                 updated_template_files.append(updated_file)
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Update layout {layout_name}",
@@ -92,7 +97,7 @@ class LayoutRepository:
         await self.layout_parser.delete(user, layout_name)
 
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Delete layout {layout_name}",
@@ -103,3 +108,14 @@ class LayoutRepository:
         """레이아웃 목록 조회"""
         layouts = await self.layout_parser.get_layouts()
         return [Layout.model_validate(layout) for layout in layouts]
+
+    async def list_page(
+        self,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[List[dict[str, Any]], Optional[str]]:
+        """레이아웃 목록 조회 (필드 선택, 커서 페이지네이션)"""
+        selected = page_util.parse_fields(fields, tuple(Layout.model_fields))
+        layouts = await self.layout_parser.get_layouts()
+        return page_util.paginate(layouts, lambda layout: (layout.name,), selected, cursor, limit)
@@ -1,13 +1,14 @@
 """Partial Repository"""
 
-from typing import List
+from typing import Any, List, Optional
 
+from temply_app.core.commit_queue import get_commit_queue
 from temply_app.core.git_env import GitEnv
 from temply_app.core.temply.parser.partial_parser import PartialParser
 from temply_app.core.temply.parser.template_parser import TemplateParser
 from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.utils import etag_util, page_util
 from temply_app.core.utils.cache_util import get_partial_parser, get_template_parser
-from temply_app.core.utils.git_util import GitUtil
 from temply_app.models.common_model import User, VersionInfo
 from temply_app.models.partial_model import Partial, PartialCreate, PartialUpdate
 
@@ -38,7 +39,7 @@ class PartialRepository:
             partial_create.dependencies,
         )
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Create partial {partial.name}",
@@ -51,6 +52,10 @@ class PartialRepository:
         partial = await self.partial_parser.get_partial(partial_name)
         return Partial.model_validate(partial)
 
+    async def get_etag(self, partial_name: str) -> str:
+        """Get Partial ETag (모델 변환 없이 인덱스 레코드에서 생성)"""
+        return etag_util.record_etag(await self.partial_parser.get_partial(partial_name))
+
     async def list(self) -> List[Partial]:
         """List Partials"""
         partials = await self.partial_parser.get_partials()
@@ -61,6 +66,22 @@ class PartialRepository:
         partials = await self.partial_parser.get_partials()
         return [Partial.model_validate(partial) for partial in partials if not partial.dependencies]
 
+    async def list_page(
+        self,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        is_root: bool = False,
+    ) -> tuple[List[dict[str, Any]], Optional[str]]:
+        """List Partials (필드 선택, 커서 페이지네이션)"""
+        selected = page_util.parse_fields(fields, tuple(Partial.model_fields))
+        partials = await self.partial_parser.get_partials()
+        if is_root:
+            partials = [partial for partial in partials if not partial.dependencies]
+        return page_util.paginate(
+            partials, lambda partial: (partial.name,), selected, cursor, limit
+        )
+
     async def get_children(self, partial_name: str) -> List[Partial]:
         """Get Children"""
         # 먼저 파셜이 존재하는지 확인
@@ -92,7 +113,7 @@ class PartialRepository:
         #         f"{template.name}/{self.temply_env.build_template_path(template.name)}"
         #     )
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Update partial {partial_name}",
@@ -104,7 +125,7 @@ class PartialRepository:
         """Delete Partial"""
         await self.partial_parser.delete(user, partial_name)
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Delete partial {partial_name}",
@@ -0,0 +1,83 @@
+"""
+검색 리포지토리
+"""
+
+from typing import List, Optional, Set, Tuple
+
+from temply_app.core.search_index import SearchHit, SearchKind, make_snippet
+from temply_app.core.temply.parser.layout_parser import LayoutParser
+from temply_app.core.temply.parser.meta_model import ContentMetaData
+from temply_app.core.temply.parser.partial_parser import PartialParser
+from temply_app.core.temply.parser.template_parser import TemplateParser
+from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.utils.cache_util import (
+    get_layout_parser,
+    get_partial_parser,
+    get_template_parser,
+)
+from temply_app.models.common_model import VersionInfo
+from temply_app.models.search_model import SearchResult
+
+
+class SearchRepository:
+    """검색 리포지토리"""
+
+    def __init__(self, version_info: VersionInfo, temply_env: TemplyEnv):
+        """초기화"""
+        self.version_info = version_info
+        self.temply_env = temply_env
+        self.layout_parser: LayoutParser = get_layout_parser(self.temply_env)
+        self.partial_parser: PartialParser = get_partial_parser(self.temply_env)
+        self.template_parser: TemplateParser = get_template_parser(self.temply_env)
+
+    async def search(
+        self, query: str, kinds: Optional[Set[SearchKind]] = None, limit: int = 20
+    ) -> List[SearchResult]:
+        """검색"""
+        # 파서 초기화(검색 인덱스 구축) 완료 대기
+        await self.layout_parser.get_layouts()
+        await self.partial_parser.get_partials()
+        await self.template_parser.get_components()
+
+        async with self.temply_env.rw_lock.read():
+            hits = self.temply_env.search_index.search(query, kinds, limit)
+            results = []
+            for hit in hits:
+                record = self._get_record(hit)
+                if record is not None:
+                    results.append(self._to_result(hit, record, query))
+            return results
+
+    def _get_record(self, hit: SearchHit) -> Optional[ContentMetaData]:
+        """검색 결과에 해당하는 인덱스 레코드 조회"""
+        if hit.kind == SearchKind.LAYOUT:
+            return self.layout_parser.nodes.get(hit.key)
+        if hit.kind == SearchKind.PARTIAL:
+            return self.partial_parser.nodes.get(hit.key)
+        return self.template_parser.nodes.get(hit.key)
+
+    def _to_result(self, hit: SearchHit, record: ContentMetaData, query: str) -> SearchResult:
+        """검색 결과 모델 생성 (본문은 결과 문서에 대해서만 읽음)"""
+        template, component = None, None
+        if hit.kind == SearchKind.COMPONENT:
+            template, component = hit.key.split("/", 1)
+
+        field: Optional[str] = None
+        snippet: Optional[str] = None
+        highlights: List[Tuple[int, int]] = []
+        for name in ("content", "description"):
+            found = make_snippet(getattr(record, name), query)
+            if found is not None:
+                field = name
+                snippet, highlights = found
+                break
+        return SearchResult(
+            kind=hit.kind.value,
+            name=hit.key,
+            template=template,
+            component=component,
+            score=round(hit.score, 4),
+            field=field,
+            snippet=snippet,
+            highlights=highlights,
+        )
@@ -2,13 +2,14 @@
 템플릿 리포지토리
 """
 
-from typing import Any, List
+from typing import Any, List, Optional
 
+from temply_app.core.commit_queue import get_commit_queue
 from temply_app.core.git_env import GitEnv
 from temply_app.core.temply.parser.template_parser import TemplateParser
 from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.utils import etag_util, page_util
 from temply_app.core.utils.cache_util import get_template_parser
-from temply_app.core.utils.git_util import GitUtil
 from temply_app.models.common_model import User, VersionInfo
 from temply_app.models.template_model import (
     TemplateComponent,
@@ -47,7 +48,7 @@ class TemplateRepository:
         )
 
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Create template component : {component.template}/{component.component}",
@@ -62,6 +63,11 @@ class TemplateRepository:
         component = await self.template_parser.get_component(template_name, component_name)
         return TemplateComponent.model_validate(component)
 
+    async def get_component_etag(self, template_name: str, component_name: str) -> str:
+        """Get Component ETag (모델 변환 없이 인덱스 레코드에서 생성)"""
+        component = await self.template_parser.get_component(template_name, component_name)
+        return etag_util.record_etag(component)
+
     async def get_components(self) -> List[TemplateComponent]:
         """List Components"""
         components = await self.template_parser.get_components()
@@ -76,6 +82,24 @@ class TemplateRepository:
             if component.layout == layout_name
         ]
 
+    async def get_components_page_by_layout(
+        self,
+        layout_name: str,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[List[dict[str, Any]], Optional[str]]:
+        """List Components by Layout (필드 선택, 커서 페이지네이션)"""
+        selected = page_util.parse_fields(fields, tuple(TemplateComponent.model_fields))
+        components = await self.template_parser.get_components_using_layout(layout_name)
+        return page_util.paginate(
+            components,
+            lambda component: (component.template, component.component),
+            selected,
+            cursor,
+            limit,
+        )
+
     async def update_component(
         self,
         user: User,
@@ -94,7 +118,7 @@ class TemplateRepository:
             component_update.partials,
         )
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Update template component : {template_name}/{component_name}",
@@ -106,7 +130,7 @@ class TemplateRepository:
         """템플릿 삭제"""
         await self.template_parser.delete_component(user, template_name, component_name)
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Delete template component : {template_name}/{component_name}",
@@ -140,6 +164,20 @@ class TemplateRepository:
         components = await self.template_parser.get_components_by_template(template_name)
         return [TemplateComponent.model_validate(component) for component in components]
 
+    async def get_components_page_by_template(
+        self,
+        template_name: str,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[List[dict[str, Any]], Optional[str]]:
+        """Get Components by Template (필드 선택, 커서 페이지네이션)"""
+        selected = page_util.parse_fields(fields, tuple(TemplateComponent.model_fields))
+        components = await self.template_parser.get_components_by_template(template_name)
+        return page_util.paginate(
+            components, lambda component: (component.component,), selected, cursor, limit
+        )
+
     async def get_schema_by_template(self, template_name: str) -> dict[str, Any]:
         """Get Schema by Template"""
         return await self.template_parser.get_schema_by_template(template_name)
@@ -153,7 +191,7 @@ class TemplateRepository:
         components = await self.template_parser.get_components_by_template(template_name)
         await self.template_parser.delete_components_by_template(user, template_name)
         if self.git_env:
-            GitUtil.commit_version(
+            get_commit_queue(self.git_env.config).enqueue(
                 self.git_env,
                 user,
                 f"Delete template : {template_name}",
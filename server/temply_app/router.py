@@ -3,12 +3,15 @@
 from fastapi import APIRouter, FastAPI
 
 from temply_app.api import (
+    history_api,
     layout_api,
     partial_api,
+    search_api,
     system_api,
     template_api,
     template_name_api,
     version_api,
+    webhook_api,
 )
 
 
@@ -30,6 +33,11 @@ def set_router(app: FastAPI) -> None:
         prefix="/versions/{version}/template-names",
         tags=["template-names"],
     )
+    router.include_router(search_api.router, prefix="/versions/{version}/search", tags=["search"])
+    router.include_router(
+        history_api.router, prefix="/versions/{version}/history", tags=["history"]
+    )
     router.include_router(system_api.router, prefix="/system", tags=["system"])
+    router.include_router(webhook_api.router, prefix="/webhooks", tags=["webhooks"])
 
     app.include_router(router, prefix="/api/v1")
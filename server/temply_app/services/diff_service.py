@@ -0,0 +1,24 @@
+"""
+버전 비교 서비스
+"""
+
+from typing import Any, Dict
+
+from temply_app.models.diff_model import RenderDiffReport, VersionDiff
+from temply_app.repositories.diff_repository import DiffRepository
+
+
+class DiffService:
+    """버전 비교 서비스"""
+
+    def __init__(self, repository: DiffRepository):
+        """서비스 초기화"""
+        self.repository = repository
+
+    async def diff(self) -> VersionDiff:
+        """기준 버전 대비 변경 항목 조회"""
+        return await self.repository.diff()
+
+    async def render_diff(self, payloads: Dict[str, Dict[str, Any]]) -> RenderDiffReport:
+        """기준 버전 대비 렌더링 결과 비교"""
+        return await self.repository.render_diff(payloads)
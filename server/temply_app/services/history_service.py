@@ -0,0 +1,39 @@
+"""
+이력 서비스
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from temply_app.core.temply.git_temply_env import GitTemplyEnv
+from temply_app.repositories.history_repository import HistoryRepository
+
+
+class HistoryService:
+    """과거 커밋 스키마 조회/렌더링 서비스"""
+
+    def __init__(self, repository: HistoryRepository):
+        """서비스 초기화"""
+        self.repository = repository
+
+    async def get_temply_env(
+        self, commit: Optional[str] = None, at: Optional[datetime] = None
+    ) -> GitTemplyEnv:
+        """커밋 SHA 또는 시각의 Temply 환경 조회"""
+        return await self.repository.get_temply_env(commit, at)
+
+    async def get_template_schema(self, temply_env: GitTemplyEnv, template: str) -> dict[str, Any]:
+        """템플릿 스키마 생성"""
+        return await self.repository.get_template_schema(temply_env, template)
+
+    async def render_component(
+        self, temply_env: GitTemplyEnv, template: str, component: str, data: dict[str, Any]
+    ) -> str:
+        """템플릿 컴포넌트 렌더링"""
+        return await self.repository.render_component(temply_env, template, component, data)
+
+    async def render_template(
+        self, temply_env: GitTemplyEnv, template: str, data: dict[str, Any]
+    ) -> dict[str, str]:
+        """템플릿의 모든 컴포넌트 렌더링"""
+        return await self.repository.render_template(temply_env, template, data)
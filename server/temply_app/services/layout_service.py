@@ -2,7 +2,7 @@
 레이아웃 서비스
 """
 
-from typing import List
+from typing import Any, List, Optional
 
 from temply_app.models.common_model import User
 from temply_app.models.layout_model import Layout, LayoutCreate, LayoutUpdate
@@ -24,10 +24,23 @@ class LayoutService:
         """레이아웃 조회"""
         return await self.repository.get(layout_name)
 
+    async def get_etag(self, layout_name: str) -> str:
+        """레이아웃 ETag 조회"""
+        return await self.repository.get_etag(layout_name)
+
     async def list(self) -> List[Layout]:
         """레이아웃 목록 조회"""
         return await self.repository.list()
 
+    async def list_page(
+        self,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[List[dict[str, Any]], Optional[str]]:
+        """레이아웃 목록 조회 (필드 선택, 커서 페이지네이션)"""
+        return await self.repository.list_page(fields, cursor, limit)
+
     async def update(
         self, user: User, layout_name: str, layout_update: LayoutUpdate
     ) -> tuple[Layout, List[str]]:
@@ -1,6 +1,6 @@
 """Partial Service"""
 
-from typing import List
+from typing import Any, List, Optional
 
 from temply_app.models.common_model import User
 from temply_app.models.partial_model import Partial, PartialCreate, PartialUpdate
@@ -34,10 +34,24 @@ class PartialService:
         """Get Partial"""
         return await self.repository.get(partial_name)
 
+    async def get_etag(self, partial_name: str) -> str:
+        """Get Partial ETag"""
+        return await self.repository.get_etag(partial_name)
+
     async def list(self) -> List[Partial]:
         """List Partials"""
         return await self.repository.list()
 
+    async def list_page(
+        self,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        is_root: bool = False,
+    ) -> tuple[List[dict[str, Any]], Optional[str]]:
+        """List Partials (필드 선택, 커서 페이지네이션)"""
+        return await self.repository.list_page(fields, cursor, limit, is_root)
+
     async def update(self, user: User, partial_name: str, partial_update: PartialUpdate) -> Partial:
         """Update Partial"""
         return await self.repository.update(user, partial_name, partial_update)
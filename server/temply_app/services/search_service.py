@@ -0,0 +1,23 @@
+"""
+검색 서비스
+"""
+
+from typing import List, Optional, Set
+
+from temply_app.core.search_index import SearchKind
+from temply_app.models.search_model import SearchResult
+from temply_app.repositories.search_repository import SearchRepository
+
+
+class SearchService:
+    """레이아웃/파셜/템플릿 전문 검색 서비스"""
+
+    def __init__(self, repository: SearchRepository):
+        """서비스 초기화"""
+        self.repository = repository
+
+    async def search(
+        self, query: str, kinds: Optional[Set[SearchKind]] = None, limit: int = 20
+    ) -> List[SearchResult]:
+        """검색"""
+        return await self.repository.search(query, kinds, limit)
@@ -1,6 +1,6 @@
 """Template Service"""
 
-from typing import Any, List
+from typing import Any, List, Optional
 
 from temply_app.models.common_model import User
 from temply_app.models.template_model import (
@@ -28,10 +28,26 @@ class TemplateService:
         """Get Template"""
         return await self.template_repository.get_component(template, component)
 
+    async def get_component_etag(self, template: str, component: str) -> str:
+        """Get Template ETag"""
+        return await self.template_repository.get_component_etag(template, component)
+
     async def get_components_by_layout(self, layout_name: str) -> List[TemplateComponent]:
         """List Templates by Layout"""
         return await self.template_repository.get_components_by_layout(layout_name)
 
+    async def get_components_page_by_layout(
+        self,
+        layout_name: str,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[List[dict[str, Any]], Optional[str]]:
+        """List Templates by Layout (필드 선택, 커서 페이지네이션)"""
+        return await self.template_repository.get_components_page_by_layout(
+            layout_name, fields, cursor, limit
+        )
+
     async def get_components(self) -> List[TemplateComponent]:
         """List Components"""
         return await self.template_repository.get_components()
@@ -74,6 +90,18 @@ class TemplateService:
         """Get Components by Template"""
         return await self.template_repository.get_components_by_template(template)
 
+    async def get_components_page_by_template(
+        self,
+        template: str,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> tuple[List[dict[str, Any]], Optional[str]]:
+        """Get Components by Template (필드 선택, 커서 페이지네이션)"""
+        return await self.template_repository.get_components_page_by_template(
+            template, fields, cursor, limit
+        )
+
     async def get_schema_by_template(self, template: str) -> dict[str, Any]:
         """Get Schema by Template"""
         return await self.template_repository.get_schema_by_template(template)
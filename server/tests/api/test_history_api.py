@@ -0,0 +1,95 @@
+"""이력 API 테스트"""
+
+import os
+import subprocess
+
+import pytest
+from fastapi.testclient import TestClient
+
+from temply_app.apps import create_app
+from temply_app.core.dependency import get_config
+from temply_app.core.git_env import GitEnv
+from temply_app.core.temply import git_object_store
+from temply_app.core.utils import cache_util
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.models.common_model import VersionInfo
+
+
+def _git(*args: str, date: str | None = None) -> str:
+    env = {**os.environ, "GIT_COMMITTER_DATE": date} if date else None
+    return subprocess.run(
+        ["git", *args], check=True, capture_output=True, text=True, env=env
+    ).stdout.strip()
+
+
+def _commit(work, content: str, date: str) -> str:
+    path = work / "templates" / "welcome" / "TEXT_EMAIL"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("{#-\n-#}\n" + content, encoding="utf-8")
+    _git("-C", str(work), "add", "-A")
+    _git("-C", str(work), "commit", "-m", content, date=date)
+    _git("-C", str(work), "push", "origin", "HEAD:main")
+    return _git("-C", str(work), "rev-parse", "HEAD")
+
+
+@pytest.mark.asyncio
+async def test_history_render_and_schema(tmp_path, origin_repo, git_config, monkeypatch):
+    """커밋 SHA 또는 시각으로 과거 커밋의 스키마 조회와 렌더링"""
+    work = tmp_path / "work"
+    _git("clone", str(origin_repo), str(work))
+    first = _commit(work, "v1 {{ user.name }}", "2024-01-01T00:00:00+09:00")
+    second = _commit(work, "v2 {{ user.name }} {{ count }}", "2024-02-01T00:00:00+09:00")
+    _git("-C", str(work), "commit", "--allow-empty", "-m", "other")
+    _git("-C", str(work), "push", "origin", "HEAD:other")
+    other = _git("-C", str(work), "rev-parse", "HEAD")
+    await GitUtil.get_versions(GitEnv(git_config, VersionInfo.root_version(git_config)))
+
+    monkeypatch.setattr(git_object_store, "_git_object_store", None)
+    monkeypatch.setattr(cache_util, "_git_temply_env_cache", None)
+    app = create_app(git_config)
+    app.dependency_overrides[get_config] = lambda: git_config
+    # lifespan(버전 목록 갱신, 커밋 큐)은 사용하지 않으므로 컨텍스트 없이 생성
+    client = TestClient(app)
+    url = "/api/v1/versions/main/history/templates/welcome"
+    data = {"user": {"name": "kim"}, "count": 3}
+
+    response = client.post(
+        f"{url}/components/TEXT_EMAIL/render", params={"at": "2024-01-15T00:00:00"}, json=data
+    )
+    assert response.status_code == 200
+    assert response.json() == "v1 kim"
+    assert response.headers["X-Temply-Commit"] == first
+
+    response = client.post(f"{url}/render", params={"at": "2024-03-01T00:00:00"}, json=data)
+    assert response.json() == {"TEXT_EMAIL": "v2 kim 3"}
+    assert response.headers["X-Temply-Commit"] == second
+
+    response = client.get(f"{url}/schema", params={"commit": first[:8]})
+    assert response.headers["X-Temply-Commit"] == first
+    assert set(response.json()["properties"]) == {"user"}
+    etag = response.headers["ETag"]
+    response = client.get(
+        f"{url}/schema", params={"commit": first}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    response = client.get(f"{url}/schema", params={"commit": second})
+    assert set(response.json()["properties"]) == {"user", "count"}
+
+    assert client.get(f"{url}/schema", params={"at": "2000-01-01T00:00:00"}).status_code == 404
+    assert client.get(f"{url}/schema", params={"commit": "0" * 40}).status_code == 404
+    # 다른 버전 브랜치의 커밋은 이 버전의 이력으로 조회하지 않음
+    assert client.get(f"{url}/schema", params={"commit": other}).status_code == 404
+    other_url = "/api/v1/versions/other/history/templates/welcome/schema"
+    assert client.get(other_url, params={"commit": other}).status_code == 200
+    assert client.get(f"{url}/schema").status_code == 400
+    assert client.get(f"{url}/schema", params={"commit": "not-a-sha"}).status_code == 400
+    response = client.post(
+        "/api/v1/versions/main/history/templates/missing/render",
+        params={"commit": second},
+        json=data,
+    )
+    assert response.status_code == 404
+
+    # 같은 커밋의 환경은 커밋 SHA로 캐시되어 재사용
+    assert cache_util._get_git_temply_env_cache(git_config).size() == 3  # pylint: disable=W0212
+    git_object_store.get_git_object_store(git_config).close()
@@ -4,6 +4,10 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from temply_app.core.config import Config
+from temply_app.core.utils import cache_util
+from temply_app.models.common_model import VersionInfo
+
 
 @pytest.mark.asyncio
 async def test_get_layouts_empty(client: TestClient):
@@ -49,3 +53,90 @@ async def test_invalid_layout_data(client: TestClient):
     response = client.post("/api/v1/versions/r123/layouts", json=invalid_layout)
     assert response.status_code == 400
     assert "detail" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_get_layouts_fields_and_cursor(client: TestClient):
+    """필드 선택과 커서 페이지네이션 테스트"""
+    for name in ["LayoutC", "LayoutA", "LayoutB"]:
+        response = client.post(
+            "/api/v1/versions/r3001/layouts",
+            json={"name": name, "description": f"{name} desc", "content": f"<p>{name}</p>"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    first = client.get("/api/v1/versions/r3001/layouts?fields=name,meta&limit=2")
+    assert first.status_code == 200
+    assert [item["name"] for item in first.json()] == ["LayoutA", "LayoutB"]
+    assert "content" not in first.json()[0]
+    assert first.json()[0]["description"] == "LayoutA desc"
+
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get(f"/api/v1/versions/r3001/layouts?fields=name&limit=2&cursor={cursor}")
+    assert second.json() == [{"name": "LayoutC"}]
+    assert "X-Next-Cursor" not in second.headers
+
+    # 파라미터가 없으면 기존 응답 형식 유지
+    full = client.get("/api/v1/versions/r3001/layouts")
+    assert {item["content"] for item in full.json()} == {
+        "<p>LayoutA</p>",
+        "<p>LayoutB</p>",
+        "<p>LayoutC</p>",
+    }
+
+    invalid = client.get("/api/v1/versions/r3001/layouts?fields=unknown")
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_layout_conditional_get(client: TestClient):
+    """ETag / If-None-Match 조건부 조회 테스트"""
+    base = "/api/v1/versions/r3002/layouts"
+    layout = {"name": "EtagLayout", "description": "desc", "content": "<p>v1</p>"}
+    assert client.post(base, json=layout).status_code == status.HTTP_200_OK
+
+    first = client.get(f"{base}/EtagLayout")
+    etag = first.headers["ETag"]
+    assert etag.startswith('"')
+
+    cached = client.get(f"{base}/EtagLayout", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    list_etag = client.get(base).headers["ETag"]
+    assert client.get(base, headers={"If-None-Match": list_etag}).status_code == 304
+    # 필드 선택이 다르면 다른 응답이므로 ETag가 일치하지 않음
+    fields_response = client.get(f"{base}?fields=name", headers={"If-None-Match": list_etag})
+    assert fields_response.status_code == 200
+
+    client.put(f"{base}/EtagLayout", json={"description": "desc", "content": "<p>v2</p>"})
+
+    updated = client.get(f"{base}/EtagLayout", headers={"If-None-Match": etag})
+    assert updated.status_code == 200
+    assert updated.json()["content"] == "<p>v2</p>"
+    assert updated.headers["ETag"] != etag
+    assert client.get(base, headers={"If-None-Match": list_etag}).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_layout_list_etag_from_content(client: TestClient):
+    """목록 ETag는 파일 내용 기준 (실패한 쓰기나 환경 재생성으로 바뀌지 않음)"""
+    base = "/api/v1/versions/r3003/layouts"
+    layout = {"name": "EtagLayout", "description": "desc", "content": "<p>v1</p>"}
+    assert client.post(base, json=layout).status_code == status.HTTP_200_OK
+    list_etag = client.get(base).headers["ETag"]
+    templates_etag = client.get(f"{base}/EtagLayout/templates").headers["ETag"]
+
+    # 이미 있는 레이아웃 생성(검증 실패)은 인덱스를 바꾸지 않음
+    assert client.post(base, json=layout).status_code != status.HTTP_200_OK
+    assert client.get(base, headers={"If-None-Match": list_etag}).status_code == 304
+
+    # 버전 환경을 다시 만들어도 내용이 같으면 같은 ETag
+    cache_util.temply_version_env_cache_clear(VersionInfo(Config(), "r3003"))
+    assert client.get(base, headers={"If-None-Match": list_etag}).status_code == 304
+
+    # 삭제된 레이아웃은 이전 ETag로 조회해도 404
+    assert client.delete(f"{base}/EtagLayout").status_code == status.HTTP_204_NO_CONTENT
+    response = client.get(f"{base}/EtagLayout/templates", headers={"If-None-Match": templates_etag})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,41 @@
+"""검색 API 테스트"""
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+
+@pytest.mark.asyncio
+async def test_search(client: TestClient):
+    """레이아웃/파셜 검색 테스트"""
+    base = "/api/v1/versions/r3003"
+    response = client.post(
+        f"{base}/layouts",
+        json={"name": "SearchLayout", "description": "desc", "content": "<p>Spring Sale</p>"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = client.post(
+        f"{base}/partials",
+        json={
+            "name": "SearchPartial",
+            "description": "sale footer",
+            "dependencies": [],
+            "content": "<p>footer</p>",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    results = client.get(f"{base}/search", params={"q": "sale"}).json()
+    assert {result["name"] for result in results} == {"SearchLayout", "SearchPartial"}
+
+    layout = next(result for result in results if result["kind"] == "layout")
+    assert layout["field"] == "content"
+    start, end = layout["highlights"][0]
+    assert layout["snippet"][start:end] == "Sale"
+
+    partial_only = client.get(f"{base}/search", params={"q": "sale", "kinds": "partial"})
+    assert [result["name"] for result in partial_only.json()] == ["SearchPartial"]
+    assert partial_only.json()[0]["field"] == "description"
+
+    invalid = client.get(f"{base}/search", params={"q": "sale", "kinds": "unknown"})
+    assert invalid.status_code == 400
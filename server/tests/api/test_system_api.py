@@ -0,0 +1,17 @@
+"""System API 테스트"""
+
+from fastapi.testclient import TestClient
+
+
+def test_metrics(client: TestClient):
+    """버전 환경을 조회하면 캐시 통계에 반영"""
+    assert client.get("/api/v1/versions/r1/layouts").status_code == 200
+    client.get("/api/v1/versions/r1/layouts")
+
+    caches = client.get("/api/v1/system/metrics").json()["caches"]
+    assert caches["version_env"]["size"] >= 1
+    assert caches["version_env"]["hits"] >= 1
+    assert "bytes" in caches["content"]
+
+    refresher = client.get("/api/v1/system/metrics").json()["version_refresher"]
+    assert {"versions", "refreshed_at", "last_error", "interval", "running"} <= refresher.keys()
@@ -0,0 +1,63 @@
+"""버전 API 테스트"""
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from temply_app.core.dependency import get_config
+
+
+@pytest.mark.asyncio
+async def test_versions_served_from_cache(client: TestClient):
+    """버전 목록은 캐시에서 응답하고 수동 갱신으로 새 버전을 반영"""
+    root = Path(get_config().noti_temply_dir)
+    (root / "r4001").mkdir(parents=True, exist_ok=True)
+    client.post("/api/v1/versions/refresh")
+
+    (root / "r4002").mkdir()
+    versions = {v["version"] for v in client.get("/api/v1/versions").json()}
+    assert "r4001" in versions
+    assert "r4002" not in versions
+
+    refreshed = {v["version"] for v in client.post("/api/v1/versions/refresh").json()}
+    assert "r4002" in refreshed
+    assert client.get("/api/v1/versions/r4002").json()["version"] == "r4002"
+    assert client.get("/api/v1/versions/r4999").status_code == 404
+
+    # 버전 생성/삭제는 캐시에 바로 반영
+    assert client.post("/api/v1/versions", json={"version": "r4003"}).status_code == 200
+    assert client.get("/api/v1/versions/r4003").status_code == 200
+    client.delete("/api/v1/versions/r4003")
+    assert client.get("/api/v1/versions/r4003").status_code == 404
+
+
+def test_commit_queue_status(client: TestClient):
+    """커밋 큐 상태 조회 (git 미사용 시 항상 idle)"""
+    response = client.get("/api/v1/versions/r4004/commits")
+    assert response.status_code == 200
+    assert response.json()["state"] == "idle"
+    response = client.post("/api/v1/versions/r4004/commits/flush")
+    assert response.status_code == 200
+    assert response.json()["pending_changes"] == 0
+
+
+def test_diff_version(client: TestClient):
+    """버전 비교 (기본 기준 버전은 메인 버전)"""
+    response = client.get("/api/v1/versions/r4005/diff")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["base"] == "main"
+    assert body["version"] == "r4005"
+    assert body["identical"]
+    assert client.get("/api/v1/versions/r4005/diff", params={"base": "r4005"}).json()["identical"]
+
+
+def test_render_diff_version(client: TestClient):
+    """렌더링 비교 (같은 버전끼리는 달라진 컴포넌트 없음)"""
+    response = client.post("/api/v1/versions/r4006/render-diff", params={"base": "r4006"}, json={})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["version"] == "r4006"
+    assert body["changed"] == 0
+    assert body["results"] == []
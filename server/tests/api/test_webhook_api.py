@@ -0,0 +1,78 @@
+"""Webhook API 테스트"""
+
+import json
+import subprocess
+
+import pytest
+from fastapi.testclient import TestClient
+
+from temply_app.apps import create_app
+from temply_app.core import version_refresher
+from temply_app.core.dependency import get_config
+from temply_app.core.git_env import GitEnv
+from temply_app.core.utils import cache_util
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.core.utils.webhook_util import make_signature
+from temply_app.models.common_model import VersionInfo
+
+SECRET = "s3cret"
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _post(client: TestClient, payload: dict, event: str = "push", secret: str = SECRET):
+    body = json.dumps(payload).encode("utf-8")
+    return client.post(
+        "/api/v1/webhooks/github",
+        content=body,
+        headers={
+            "X-GitHub-Event": event,
+            "X-Hub-Signature-256": make_signature(secret, body),
+            "Content-Type": "application/json",
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_push_webhook_refreshes_branch(tmp_path, git_config, origin_repo, monkeypatch):
+    """push된 브랜치만 fetch하고 캐시된 파서에 변경분 반영"""
+    config = git_config.model_copy(
+        update={"github_webhook_secret": SECRET, "version_env_validate_interval_seconds": 3600}
+    )
+    monkeypatch.setattr(version_refresher, "_version_refresher", None)
+    monkeypatch.setattr(cache_util, "_temply_version_env_cache_util", None)
+    await GitUtil.get_versions(GitEnv(config, VersionInfo.root_version(config)))
+    await GitUtil.create_version(GitEnv(config, VersionInfo(config, "r1")))
+
+    app = create_app(config)
+    app.dependency_overrides[get_config] = lambda: config
+    # lifespan(버전 목록 갱신, 커밋 큐)은 사용하지 않으므로 컨텍스트 없이 생성
+    client = TestClient(app)
+    assert client.get("/api/v1/versions/r1/layouts").json() == []
+
+    work = tmp_path / "work"
+    _git("clone", "-q", "--branch", "r1", str(origin_repo), str(work))
+    (work / "layouts").mkdir()
+    (work / "layouts" / "layout_a").write_text("{#-\n-#}\n<div></div>", encoding="utf-8")
+    _git("-C", str(work), "add", "-A")
+    _git("-C", str(work), "commit", "-q", "-m", "Add layout_a")
+    _git("-C", str(work), "push", "-q", "origin", "HEAD:r1")
+    head = _git("-C", str(work), "rev-parse", "HEAD")
+
+    # 확인 간격이 지나지 않아도 webhook으로 바로 반영
+    response = _post(client, {"ref": "refs/heads/r1", "after": head})
+    assert response.status_code == 202
+    assert response.json() == {"event": "push", "action": "queued", "version": "r1"}
+    assert [layout["name"] for layout in client.get("/api/v1/versions/r1/layouts").json()] == [
+        "layout_a"
+    ]
+    assert client.get("/api/v1/versions/r1").json()["head_sha"] == head
+
+    assert _post(client, {"ref": "refs/tags/v1"}).json()["action"] == "ignored"
+    assert _post(client, {"zen": "hi"}, event="ping").json()["action"] == "pong"
+    assert _post(client, {"ref": "refs/heads/r1"}, secret="wrong").status_code == 401
+
+    config.github_webhook_secret = ""
+    assert _post(client, {"ref": "refs/heads/r1"}).status_code == 403
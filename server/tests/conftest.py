@@ -1,6 +1,7 @@
 """테스트 설정"""
 
 import os
+import subprocess
 from pathlib import Path
 from typing import Generator
 
@@ -55,3 +56,36 @@ def client(tmp_path) -> Generator[TestClient, None, None]:
 
     with TestClient(create_app(Config())) as test_client:
         yield test_client
+
+
+@pytest.fixture(name="git_identity")
+def fixture_git_identity(monkeypatch):
+    """커밋 작성자 환경 변수 설정"""
+    for key in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        monkeypatch.setenv(key, "test")
+    for key in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        monkeypatch.setenv(key, "test@noti-temply.com")
+
+
+@pytest.fixture(name="origin_repo")
+def fixture_origin_repo(tmp_path, git_identity):  # pylint: disable=unused-argument
+    """main 브랜치에 커밋이 하나 있는 로컬 원격 저장소"""
+    origin = tmp_path / "origin.git"
+    work = tmp_path / "seed"
+    subprocess.run(["git", "init", "--bare", "-b", "main", str(origin)], check=True)
+    subprocess.run(["git", "clone", str(origin), str(work)], check=True, capture_output=True)
+    (work / "README").write_text("seed", encoding="utf-8")
+    subprocess.run(["git", "-C", str(work), "add", "README"], check=True)
+    subprocess.run(["git", "-C", str(work), "commit", "-m", "seed"], check=True)
+    subprocess.run(
+        ["git", "-C", str(work), "push", "origin", "HEAD:main"], check=True, capture_output=True
+    )
+    return origin
+
+
+@pytest.fixture(name="git_config")
+def fixture_git_config(tmp_path, origin_repo):
+    """로컬 원격 저장소를 사용하는 설정"""
+    efs = tmp_path / "efs"
+    efs.mkdir()
+    return Config(env="local", noti_temply_dir=str(efs), noti_temply_repo_url=str(origin_repo))
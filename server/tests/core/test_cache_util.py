@@ -0,0 +1,103 @@
+"""버전 환경 캐시 테스트"""
+
+import asyncio
+
+import pytest
+
+from temply_app.core.config import Config
+from temply_app.core.utils import cache_util
+from temply_app.core.utils.cache_util import (
+    get_layout_parser,
+    get_template_parser,
+    get_temply_version_env_stats,
+    get_validated_temply_version_env,
+    load_temply_version_env,
+    sync_cached_temply_version_env,
+    temply_version_env_cache_clear,
+)
+from temply_app.models.common_model import VersionInfo
+
+
+@pytest.mark.asyncio
+async def test_version_entry_owns_parsers(tmp_path, user, monkeypatch):
+    """파서는 버전 환경이 소유하므로 환경을 제거하면 함께 제거되고 다시 사용되지 않음"""
+    monkeypatch.setattr(cache_util, "_temply_version_env_cache_util", None)
+    config = Config(
+        env="local", noti_temply_dir=str(tmp_path), version_env_validate_interval_seconds=3600
+    )
+    version_info = VersionInfo(config, "r1")
+    temply_env = (await load_temply_version_env(config, version_info)).get_temply_env()
+    layout_parser = get_layout_parser(temply_env)
+    assert get_layout_parser(temply_env) is layout_parser
+    await layout_parser.create(user, "layout_a", "<div></div>")
+
+    stats = get_temply_version_env_stats()
+    assert [(s["version"], s["parsers"]) for s in stats] == [("r1", {"layout_parser": 1})]
+
+    # 디스크에서 바뀐 파일은 캐시된 환경의 모든 파서에 한 번에 반영
+    template_parser = get_template_parser(temply_env)
+    await template_parser.get_components()
+    component = tmp_path / "r1" / "templates" / "welcome" / "TEXT_EMAIL"
+    component.parent.mkdir(parents=True)
+    component.write_text("{#-\n-#}\nhi", encoding="utf-8")
+    assert await sync_cached_temply_version_env(version_info)
+    assert [c.component for c in await template_parser.get_components()] == ["TEXT_EMAIL"]
+
+    temply_version_env_cache_clear(version_info)
+    assert get_temply_version_env_stats() == []
+    rebuilt = (await load_temply_version_env(config, version_info)).get_temply_env()
+    assert rebuilt is not temply_env
+    assert not rebuilt.derived
+    assert get_layout_parser(rebuilt) is not layout_parser
+    assert [layout.name for layout in await get_layout_parser(rebuilt).get_layouts()] == [
+        "layout_a"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_version_load(tmp_path, monkeypatch):
+    """캐시되지 않은 버전을 동시에 조회하면 환경과 파서를 한 번만 생성"""
+    monkeypatch.setattr(cache_util, "_temply_version_env_cache_util", None)
+    config = Config(env="local", noti_temply_dir=str(tmp_path))
+    version_info = VersionInfo(config, "r1")
+    built = []
+    version_env_class = cache_util.TemplyVersionEnv
+
+    def build(*args):
+        built.append(args)
+        return version_env_class(*args)
+
+    monkeypatch.setattr(cache_util, "TemplyVersionEnv", build)
+    envs = await asyncio.gather(*(load_temply_version_env(config, version_info) for _ in range(5)))
+    assert len(built) == 1
+    assert all(env is envs[0] for env in envs)
+
+    temply_env = envs[0].get_temply_env()
+    parsers = await asyncio.gather(
+        *(asyncio.to_thread(get_layout_parser, temply_env) for _ in range(5))
+    )
+    assert all(parser is parsers[0] for parser in parsers)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_revision_checks(tmp_path, monkeypatch):
+    """같은 버전의 리비전 확인은 동시에 요청되어도 스레드에서 한 번만 실행"""
+    monkeypatch.setattr(cache_util, "_temply_version_env_cache_util", None)
+    config = Config(
+        env="local", noti_temply_dir=str(tmp_path), version_env_validate_interval_seconds=0
+    )
+    version_info = VersionInfo(config, "r1")
+    temply_version_env = await load_temply_version_env(config, version_info)
+    checks = []
+    check_revision = temply_version_env._check_revision  # pylint: disable=protected-access
+
+    def counted():
+        checks.append(1)
+        return check_revision()
+
+    monkeypatch.setattr(temply_version_env, "_check_revision", counted)
+    envs = await asyncio.gather(
+        *(get_validated_temply_version_env(config, version_info) for _ in range(5))
+    )
+    assert all(env is temply_version_env for env in envs)
+    assert len(checks) == 1
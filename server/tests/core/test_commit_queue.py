@@ -0,0 +1,191 @@
+"""커밋 큐 테스트"""
+
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from temply_app.core.commit_queue import (
+    CommitQueue,
+    CommitQueueState,
+    PendingChange,
+    _group_by_user,
+)
+from temply_app.core.exceptions import GitCommandError
+from temply_app.core.git_env import GitEnv
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.models.common_model import User, VersionInfo
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _write(git_env: GitEnv, path: str, content: str) -> None:
+    file_path = Path(git_env.version_path) / path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(content, encoding="utf-8")
+
+
+@pytest_asyncio.fixture(name="version_env")
+async def fixture_version_env(git_config):
+    """worktree로 생성한 r1 버전"""
+    await GitUtil.get_versions(GitEnv(git_config, VersionInfo.root_version(git_config)))
+    git_env = GitEnv(git_config, VersionInfo(git_config, "r1"))
+    await GitUtil.create_version(git_env)
+    return git_env
+
+
+def test_group_by_user():
+    """연속된 같은 사용자의 변경은 하나로 묶고 경로는 중복 제거"""
+    alice, bob = User(name="alice"), User(name="bob")
+    groups = _group_by_user(
+        [
+            PendingChange(alice, "Update layout a", ["layouts/a"]),
+            PendingChange(alice, "Update layout a", ["layouts/a"]),
+            PendingChange(bob, "Create partial p", ["partials/p"]),
+        ]
+    )
+    assert [group.user.name for group in groups] == ["alice", "bob"]
+    assert groups[0].paths == ["layouts/a"]
+    assert groups[0].message.startswith("Update layout a (+1 more)")
+    assert groups[1].message == "Create partial p"
+
+
+@pytest.mark.asyncio
+async def test_commit_queue_coalesces_edits(git_config, origin_repo, version_env):
+    """연속된 변경은 debounce 후 한 번에 push"""
+    queue = CommitQueue(git_config.model_copy(update={"git_commit_debounce_seconds": 0.2}))
+    user = User(name="alice")
+    for i in range(5):
+        _write(version_env, "layouts/layout_a", f"<div>{i}</div>")
+        queue.enqueue(version_env, user, f"Update layout layout_a {i}", ["layouts/layout_a"])
+    _write(version_env, "partials/partial_a", "partial")
+    queue.enqueue(version_env, User(name="bob"), "Create partial partial_a", ["partials/partial_a"])
+
+    # 응답은 즉시, 커밋은 아직
+    status = queue.get_status("r1")
+    assert status["state"] == CommitQueueState.PENDING
+    assert status["pending_changes"] == 6
+
+    await asyncio.sleep(0.1)
+    assert queue.get_status("r1")["commits"] == 0
+    await queue.flush("r1")
+
+    status = queue.get_status("r1")
+    assert status["state"] == CommitQueueState.IDLE
+    assert status["commits"] == 2
+    assert status["pushes"] == 1
+    assert not status["unpushed"]
+    authors = _git("--git-dir", str(origin_repo), "log", "--format=%an", "main..r1").split()
+    assert authors == ["bob", "alice"]
+    content = _git("--git-dir", str(origin_repo), "show", "r1:layouts/layout_a")
+    assert content == "<div>4</div>"
+
+
+@pytest.mark.asyncio
+async def test_commit_queue_skips_create_then_delete(git_config, version_env):
+    """생성 후 바로 삭제된 파일은 커밋하지 않음"""
+    queue = CommitQueue(git_config.model_copy(update={"git_commit_debounce_seconds": 0}))
+    _write(version_env, "layouts/tmp", "tmp")
+    queue.enqueue(version_env, User(name="alice"), "Create layout tmp", ["layouts/tmp"])
+    (Path(version_env.version_path) / "layouts" / "tmp").unlink()
+    queue.enqueue(version_env, User(name="alice"), "Delete layout tmp", ["layouts/tmp"])
+    status = await queue.flush("r1")
+    assert status["state"] == CommitQueueState.IDLE
+    assert status["commits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_commit_queue_retries_push(git_config, version_env, monkeypatch):
+    """push 실패는 재시도"""
+    queue = CommitQueue(
+        git_config.model_copy(
+            update={"git_commit_debounce_seconds": 0, "git_push_retry_backoff_seconds": 0.01}
+        )
+    )
+    push_version = GitUtil.push_version
+    attempts = []
+
+    async def flaky_push(git_env):
+        attempts.append(git_env)
+        if len(attempts) < 3:
+            raise GitCommandError("network error")
+        await push_version(git_env)
+
+    monkeypatch.setattr(GitUtil, "push_version", flaky_push)
+    _write(version_env, "layouts/layout_a", "a")
+    queue.enqueue(version_env, User(name="alice"), "Create layout a", ["layouts/layout_a"])
+    status = await queue.flush("r1")
+    assert len(attempts) == 3
+    assert status["state"] == CommitQueueState.IDLE
+    assert status["pushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_commit_queue_reports_conflict(tmp_path, git_config, origin_repo, version_env):
+    """원격 변경과 충돌하면 conflict 상태로 보고하고 로컬 커밋은 유지"""
+    other = tmp_path / "other"
+    _git("clone", "--branch", "r1", str(origin_repo), str(other))
+    (other / "layouts").mkdir()
+    (other / "layouts" / "layout_a").write_text("remote", encoding="utf-8")
+    _git("-C", str(other), "add", "layouts/layout_a")
+    _git("-C", str(other), "commit", "-m", "remote change")
+    _git("-C", str(other), "push", "origin", "r1")
+
+    queue = CommitQueue(git_config.model_copy(update={"git_commit_debounce_seconds": 0}))
+    _write(version_env, "layouts/layout_a", "local")
+    queue.enqueue(version_env, User(name="alice"), "Create layout a", ["layouts/layout_a"])
+    status = await queue.flush("r1")
+
+    assert status["state"] == CommitQueueState.CONFLICT
+    assert status["unpushed"]
+    assert "conflict" in status["last_error"].lower()
+    # 병합은 취소되어 작업 디렉토리는 로컬 내용을 유지
+    assert (Path(version_env.version_path) / "layouts" / "layout_a").read_text() == "local"
+
+
+@pytest.mark.asyncio
+async def test_commit_queue_recovers_worktree_changes(git_config, origin_repo, version_env):
+    """재시작 후 worktree의 미커밋 변경과 미push 커밋을 다시 등록"""
+    _write(version_env, "layouts/layout_a", "committed")
+    _git("-C", version_env.version_path, "add", "layouts/layout_a")
+    _git("-C", version_env.version_path, "commit", "-m", "Create layout a")
+    _write(version_env, "partials/partial_a", "saved")
+
+    queue = CommitQueue(git_config.model_copy(update={"git_commit_debounce_seconds": 0}))
+    assert await queue.recover() == ["r1"]
+    assert queue.get_status("r1")["pending_paths"] == ["partials/partial_a"]
+    status = await queue.flush("r1")
+
+    assert status["state"] == CommitQueueState.IDLE
+    assert status["pushes"] == 1
+    assert _git("--git-dir", str(origin_repo), "show", "r1:partials/partial_a") == "saved"
+    assert _git("--git-dir", str(origin_repo), "show", "r1:layouts/layout_a") == "committed"
+    # 동기화된 worktree는 다시 등록하지 않음
+    assert await queue.recover() == []
+
+
+@pytest.mark.asyncio
+async def test_commit_queue_recover_retries_failed(git_config, version_env, monkeypatch):
+    """재시도 후에도 실패한 큐는 복구 주기에 다시 시도"""
+    queue = CommitQueue(
+        git_config.model_copy(update={"git_commit_debounce_seconds": 0, "git_push_max_retries": 0})
+    )
+    push_version = GitUtil.push_version
+
+    async def failing_push(git_env):
+        raise GitCommandError("network error")
+
+    monkeypatch.setattr(GitUtil, "push_version", failing_push)
+    _write(version_env, "layouts/layout_a", "a")
+    queue.enqueue(version_env, User(name="alice"), "Create layout a", ["layouts/layout_a"])
+    assert (await queue.flush("r1"))["state"] == CommitQueueState.FAILED
+
+    monkeypatch.setattr(GitUtil, "push_version", push_version)
+    assert await queue.recover() == ["r1"]
+    status = await queue.flush("r1")
+    assert status["state"] == CommitQueueState.IDLE
+    assert status["pushes"] == 1
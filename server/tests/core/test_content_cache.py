@@ -0,0 +1,72 @@
+"""본문 캐시 테스트"""
+
+import sys
+
+import pytest
+
+from temply_app.core.content_cache import ContentCache, compute_content_hash, locate_content
+from temply_app.core.temply.parser.layout_parser import LayoutParser
+from temply_app.core.temply.parser.meta_model import BaseMetaData
+from temply_app.core.temply.parser.template_parser import TemplateParser
+
+
+def test_content_cache_byte_budget():
+    """바이트 크기 제한을 넘으면 오래된 항목부터 제거"""
+    body = "x" * 1000
+    cache = ContentCache(max_bytes=sys.getsizeof(body) * 2)
+    cache.set("a", body)
+    cache.set("b", body)
+    assert cache.get("a") == body
+    cache.set("c", body)
+
+    # a는 최근에 조회했으므로 b가 제거되어야 함
+    assert cache.get("b") is None
+    assert cache.get("a") == body
+    assert cache.get("c") == body
+    assert cache.get_stats()["bytes"] <= cache.max_bytes
+
+
+def test_content_cache_skips_oversized():
+    """캐시보다 큰 본문은 저장하지 않음"""
+    cache = ContentCache(max_bytes=10)
+    cache.set("a", "x" * 100)
+    assert cache.get("a") is None
+
+
+def test_locate_content():
+    """원본 소스에서 본문 위치 조회"""
+    source = "{#-\ndescription: d\n-#}\nhello\nworld\n"
+    start, end = locate_content(source, "hello\nworld")
+    assert source[start:end] == "hello\nworld"
+    assert locate_content(source, "") == (0, 0)
+    assert locate_content(source, "missing") == (-1, -1)
+
+
+@pytest.mark.asyncio
+async def test_parser_index_has_no_content(temp_env, user):
+    """인덱스는 본문을 보관하지 않고 필요할 때 읽어야 함"""
+    parser = LayoutParser(temp_env)
+    await parser.create(user, "layout_a", "<div>A</div>", "desc")
+    layout = await parser.get_layout("layout_a")
+
+    assert not hasattr(layout, "__dict__")
+    assert layout.content_hash == compute_content_hash("<div>A</div>")
+    assert layout.content == "<div>A</div>"
+    assert temp_env.content_cache.get(layout.content_hash) == "<div>A</div>"
+
+
+@pytest.mark.asyncio
+async def test_parser_content_external_change(temp_env, user):
+    """인덱스 생성 이후 파일이 외부에서 변경되면 다시 분리해서 읽어야 함"""
+    parser = TemplateParser(temp_env)
+    component = await parser.create_component(
+        user, "test_template", "HTML_EMAIL", "unique original body 1234", "desc"
+    )
+    temp_env.content_cache.clear()
+
+    path = temp_env.templates_dir / "test_template" / "HTML_EMAIL"
+    path.write_text(
+        temp_env.format_meta_block(BaseMetaData(description="desc")) + "\nchanged body\n",
+        encoding=temp_env.file_encoding,
+    )
+    assert component.content == "changed body"
@@ -0,0 +1,87 @@
+"""파일 유틸리티 테스트"""
+
+import os
+
+import pytest
+
+from temply_app.core.config import Config
+from temply_app.core.temply.parser.layout_parser import LayoutParser
+from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.utils import file_util
+from temply_app.core.utils.file_util import SnapshotMode, snapshot_tree, write_text_atomic
+
+
+def _build_main(root):
+    main = root / "main"
+    for name in ("layouts", "partials", "templates/welcome"):
+        (main / name).mkdir(parents=True)
+    (main / "layouts" / "layout_a").write_text("{#-\n-#}\n<div>A</div>", encoding="utf-8")
+    (main / "partials" / "partial_a").write_text("{#-\n-#}\npartial", encoding="utf-8")
+    (main / "templates" / "welcome" / "HTML_EMAIL").write_text("{#-\n-#}\nhi", encoding="utf-8")
+    return main
+
+
+def test_write_text_atomic(tmp_path):
+    """교체 방식 쓰기는 임시 파일을 남기지 않고 새 inode로 교체"""
+    path = tmp_path / "file"
+    path.write_text("old", encoding="utf-8")
+    inode = path.stat().st_ino
+    write_text_atomic(path, "new", "utf-8")
+    assert path.read_text(encoding="utf-8") == "new"
+    assert path.stat().st_ino != inode
+    assert os.listdir(tmp_path) == ["file"]
+
+
+def test_write_text_atomic_keeps_mode(tmp_path):
+    """교체 후에도 기존 파일 권한을 유지하고, 새 파일은 umask 기준 권한으로 생성"""
+    path = tmp_path / "file"
+    path.write_text("old", encoding="utf-8")
+    path.chmod(0o644)
+    write_text_atomic(path, "new", "utf-8")
+    assert path.stat().st_mode & 0o777 == 0o644
+
+    new_path = tmp_path / "new_file"
+    write_text_atomic(new_path, "new", "utf-8")
+    assert new_path.stat().st_mode & 0o777 == 0o666 & ~file_util._UMASK  # pylint: disable=W0212
+
+
+def test_snapshot_tree_shares_files(tmp_path):
+    """하드링크 스냅샷은 파일을 복사하지 않고 inode를 공유"""
+    main = _build_main(tmp_path)
+    stats = snapshot_tree(main, tmp_path / "r1")
+    assert stats.files == 3
+    assert stats.linked == 3
+    assert stats.copied == 0
+    source = main / "layouts" / "layout_a"
+    target = tmp_path / "r1" / "layouts" / "layout_a"
+    assert source.stat().st_ino == target.stat().st_ino
+    assert (tmp_path / "r1" / "templates" / "welcome" / "HTML_EMAIL").exists()
+
+    with pytest.raises(FileExistsError):
+        snapshot_tree(main, tmp_path / "r1")
+
+
+def test_snapshot_tree_copy_mode(tmp_path):
+    """복사 방식은 별도 파일 생성"""
+    main = _build_main(tmp_path)
+    stats = snapshot_tree(main, tmp_path / "r1", SnapshotMode.COPY)
+    assert stats.copied == 3
+    source = main / "layouts" / "layout_a"
+    assert source.stat().st_ino != (tmp_path / "r1" / "layouts" / "layout_a").stat().st_ino
+
+
+@pytest.mark.asyncio
+async def test_parser_write_copies_up(tmp_path, user):
+    """스냅샷 버전에서 수정한 파일만 분리되고 메인 버전은 변경되지 않음"""
+    main = _build_main(tmp_path)
+    snapshot_tree(main, tmp_path / "r1")
+    config = Config(env="local", noti_temply_dir=str(tmp_path))
+    parser = LayoutParser(TemplyEnv(config, "r1"))
+
+    await parser.update(user, "layout_a", "<div>B</div>")
+
+    assert "<div>A</div>" in (main / "layouts" / "layout_a").read_text(encoding="utf-8")
+    assert "<div>B</div>" in (tmp_path / "r1" / "layouts" / "layout_a").read_text(encoding="utf-8")
+    # 수정하지 않은 파일은 계속 공유
+    assert (main / "partials" / "partial_a").stat().st_nlink == 2
+    assert (main / "layouts" / "layout_a").stat().st_nlink == 1
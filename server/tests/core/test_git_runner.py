@@ -0,0 +1,145 @@
+"""비동기 git 실행기 테스트"""
+
+import asyncio
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from temply_app.core.exceptions import GitCommandError, GitTimeoutError
+from temply_app.core.git_env import GitEnv
+from temply_app.core.utils.git_runner import GitRunner
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.models.common_model import User, VersionInfo
+
+
+@pytest.mark.asyncio
+async def test_git_runner_success():
+    """성공한 명령은 결과를 반환"""
+    result = await GitRunner(timeout=10, max_concurrency=2).run("--version")
+    assert result.ok
+    assert result.stdout.startswith("git version")
+
+
+@pytest.mark.asyncio
+async def test_git_runner_failure(tmp_path):
+    """실패한 명령은 GitCommandError 발생 (check=False면 결과 반환)"""
+    runner = GitRunner(timeout=10, max_concurrency=2)
+    with pytest.raises(GitCommandError) as exc_info:
+        await runner.run("rev-parse", "HEAD", cwd=str(tmp_path))
+    assert exc_info.value.result is not None
+    assert exc_info.value.result.returncode != 0
+
+    result = await runner.run("rev-parse", "HEAD", cwd=str(tmp_path), check=False)
+    assert not result.ok
+
+
+@pytest.mark.asyncio
+async def test_git_runner_timeout():
+    """시간 제한을 넘으면 프로세스를 종료하고 GitTimeoutError 발생"""
+    runner = GitRunner(timeout=10, max_concurrency=2)
+    started = time.monotonic()
+    with pytest.raises(GitTimeoutError):
+        await runner.run("-c", "alias.slp=!sleep 5", "slp", timeout=0.2)
+    assert time.monotonic() - started < 4
+
+
+@pytest.mark.asyncio
+async def test_git_runner_does_not_block_loop():
+    """git 실행 중에도 이벤트 루프는 다른 작업을 처리"""
+    runner = GitRunner(timeout=10, max_concurrency=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    await runner.run("-c", "alias.slp=!sleep 0.3", "slp")
+    task.cancel()
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_git_runner_concurrency_limit():
+    """동시 실행 수 제한"""
+    runner = GitRunner(timeout=10, max_concurrency=2)
+    started = time.monotonic()
+    await asyncio.gather(*(runner.run("-c", "alias.slp=!sleep 0.3", "slp") for _ in range(4)))
+    # 2개씩 두 번 실행되어야 함
+    assert time.monotonic() - started >= 0.55
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.mark.asyncio
+async def test_git_util_version_lifecycle(git_config, origin_repo):
+    """로컬 원격 저장소를 대상으로 버전 생성/커밋/조회/삭제"""
+    efs = Path(git_config.noti_temply_dir)
+    root_env = GitEnv(git_config, VersionInfo.root_version(git_config))
+    versions = [version.version for version in await GitUtil.get_versions(root_env)]
+    assert versions == ["main"]
+    assert (efs / "main" / "README").exists()
+
+    git_env = GitEnv(git_config, VersionInfo(git_config, "r1"))
+    await GitUtil.create_version(git_env)
+    assert await GitUtil.get_head_sha(git_env)
+
+    # 버전은 bare 저장소의 객체를 공유하는 worktree여야 함
+    assert (efs / "r1" / ".git").is_file()
+    common_dir = _git(
+        "-C", str(efs / "r1"), "rev-parse", "--path-format=absolute", "--git-common-dir"
+    )
+    assert Path(common_dir) == Path(git_env.bare_path)
+
+    (efs / "r1" / "layouts").mkdir()
+    (efs / "r1" / "layouts" / "layout_a").write_text("<div>A</div>", encoding="utf-8")
+    await GitUtil.commit_version(
+        git_env, User(name="tester"), "Create layout", ["layouts/layout_a"]
+    )
+    log = _git("--git-dir", str(origin_repo), "log", "-1", "--format=%an %s", "r1")
+    assert log == "tester Create layout"
+
+    versions = [version.version for version in await GitUtil.get_versions(root_env)]
+    assert sorted(versions) == ["main", "r1"]
+
+    await GitUtil.delete_version(git_env)
+    assert not (efs / "r1").exists()
+    versions = [version.version for version in await GitUtil.get_versions(root_env)]
+    assert versions == ["main"]
+    assert "r1" not in _git("--git-dir", git_env.bare_path, "worktree", "list")
+
+
+@pytest.mark.asyncio
+async def test_git_util_refresh_from_shared_fetch(tmp_path, git_config, origin_repo):
+    """원격 브랜치는 한 번의 fetch 후 worktree fast-forward로 반영"""
+    efs = Path(git_config.noti_temply_dir)
+    root_env = GitEnv(git_config, VersionInfo.root_version(git_config))
+    await GitUtil.get_versions(root_env)
+
+    # 다른 곳에서 원격에 새 브랜치 push
+    other = tmp_path / "other"
+    _git("clone", str(origin_repo), str(other))
+    _git("-C", str(other), "checkout", "-b", "r2")
+    _git("-C", str(other), "push", "origin", "r2")
+
+    versions = [version.version for version in await GitUtil.get_versions(root_env)]
+    assert sorted(versions) == ["main", "r2"]
+    git_env = GitEnv(git_config, VersionInfo(git_config, "r2"))
+    await GitUtil.create_version(git_env)
+    assert await GitUtil.get_head_sha(git_env) == _git("-C", str(other), "rev-parse", "HEAD")
+
+    (other / "NEW").write_text("new", encoding="utf-8")
+    _git("-C", str(other), "add", "NEW")
+    _git("-C", str(other), "commit", "-m", "new")
+    _git("-C", str(other), "push", "origin", "r2")
+
+    await GitUtil.get_versions(root_env)
+    await GitUtil.refresh_version(git_env)
+    assert (efs / "r2" / "NEW").exists()
+    assert await GitUtil.get_head_sha(git_env) == _git("-C", str(other), "rev-parse", "HEAD")
@@ -0,0 +1,126 @@
+"""git 커밋 Temply 환경 테스트"""
+
+import subprocess
+
+import pytest
+
+from temply_app.core.config import Config
+from temply_app.core.exceptions import GitRevisionNotFoundError, ReadOnlyEnvError
+from temply_app.core.temply.git_object_store import GitObjectStore
+from temply_app.core.temply.git_temply_env import GitTemplyEnv
+from temply_app.core.temply.parser.layout_parser import LayoutParser
+from temply_app.core.temply.parser.partial_parser import PartialParser
+from temply_app.core.temply.parser.template_parser import TemplateParser
+from temply_app.core.utils.git_runner import GitRunner
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _commit(work, files: dict[str, str], message: str) -> str:
+    for path, content in files.items():
+        (work / path).parent.mkdir(parents=True, exist_ok=True)
+        (work / path).write_text(content, encoding="utf-8")
+    _git("-C", str(work), "add", "-A")
+    _git("-C", str(work), "commit", "-m", message)
+    _git("-C", str(work), "push", "origin", "HEAD:main")
+    return _git("-C", str(work), "rev-parse", "HEAD")
+
+
+@pytest.fixture(name="commits")
+def fixture_commits(tmp_path, origin_repo):
+    """템플릿을 추가한 커밋과 컴포넌트 하나만 수정한 커밋"""
+    work = tmp_path / "work"
+    _git("clone", str(origin_repo), str(work))
+    first = _commit(
+        work,
+        {
+            "layouts/layout_a": "{#-\ndescription: a\n-#}\n"
+            "<div>{% block content %}{% endblock %}</div>",
+            "partials/partial_a": "{#-\ndescription: p\n-#}\n"
+            "{% macro render(locals) %}<b>{{ user.name }}</b>{% endmacro %}",
+            "templates/welcome/HTML_EMAIL": "{#-\ndescription: t\n-#}\n"
+            "{% extends 'layouts/layout_a' %}{% block content %}hi {{ user.name }}{% endblock %}",
+            "templates/welcome/TEXT_EMAIL": "{#-\n-#}\nv1 {{ count }}",
+            "templates/welcome/schema.json": '{"type": "object"}',
+        },
+        "add welcome",
+    )
+    second = _commit(work, {"templates/welcome/TEXT_EMAIL": "{#-\n-#}\nv2 {{ count }}"}, "v2")
+    return first, second
+
+
+@pytest.fixture(name="store")
+def fixture_store(origin_repo):
+    store = GitObjectStore(str(origin_repo), GitRunner(timeout=30, max_concurrency=2))
+    yield store
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_git_temply_env_reads_commit(tmp_path, commits, store, user):
+    """체크아웃 없이 커밋의 템플릿을 파싱/렌더링하고 쓰기는 거부"""
+    first, second = commits
+    config = Config(env="local", noti_temply_dir=str(tmp_path))
+    env = GitTemplyEnv(config, store, await store.read_tree(first))
+
+    assert env.tree.commit == first
+    assert env.get_template_names() == ["welcome"]
+    assert env.load_schema_source("welcome") == {"type": "object"}
+    rendered = env.render_template("welcome", {"user": {"name": "kim"}, "count": 1})
+    assert rendered == {"HTML_EMAIL": "<div>hi kim</div>", "TEXT_EMAIL": "v1 1"}
+    assert "user" in env.get_template_schema("welcome")["properties"]
+
+    layout_parser = LayoutParser(env)
+    partial_parser = PartialParser(env)
+    template_parser = TemplateParser(env)
+    assert (await layout_parser.get_layout("layout_a")).description == "a"
+    assert [partial.name for partial in await partial_parser.get_partials()] == ["partial_a"]
+    component = await template_parser.get_component("welcome", "HTML_EMAIL")
+    assert component.layout == "layout_a"
+    assert component.description == "t"
+
+    with pytest.raises(ReadOnlyEnvError):
+        await layout_parser.create(user, "layout_b", "<div></div>")
+    with pytest.raises(ReadOnlyEnvError):
+        await template_parser.sync_schema("welcome")
+
+    # 이전 커밋은 그대로 조회 가능
+    old_env = GitTemplyEnv(config, store, await store.read_tree(f"{second}~1"))
+    assert old_env.render_component("welcome", "TEXT_EMAIL", {"count": 2}) == "v1 2"
+
+    with pytest.raises(GitRevisionNotFoundError):
+        await store.read_tree("no-such-branch")
+
+
+@pytest.mark.asyncio
+async def test_git_temply_env_shares_objects(tmp_path, commits, store):
+    """트리는 트리 객체 ID, 동일한 blob의 파싱/컴파일 결과는 커밋 간에 공유"""
+    first, second = commits
+    config = Config(env="local", noti_temply_dir=str(tmp_path))
+    tree = await store.read_tree(first)
+    assert await store.read_tree(first) is tree
+
+    # 본문은 미리 읽어 두므로 렌더링 중에는 blob을 읽지 않음 (두 번째 커밋은 바뀐 blob만 읽음)
+    second_tree = await store.read_tree(second)
+    assert await store.preload(tree) == len(tree.blobs)
+    assert await store.preload(second_tree) == 1
+    misses = store.get_stats()["blobs"]["misses"]
+
+    env_first = GitTemplyEnv(config, store, tree)
+    env_second = GitTemplyEnv(config, store, second_tree)
+    env_first.render_template("welcome", {"user": {"name": "a"}, "count": 1})
+    assert store.get_stats()["blobs"]["misses"] == misses
+    compiled = store.bytecode_cache.size()
+    assert compiled == 3  # HTML_EMAIL, TEXT_EMAIL, layout_a
+
+    result = env_second.render_template("welcome", {"user": {"name": "a"}, "count": 1})
+    assert result["TEXT_EMAIL"] == "v2 1"
+    # 변경된 TEXT_EMAIL만 새로 컴파일
+    assert store.bytecode_cache.size() == compiled + 1
+
+    env_first.get_template_schema("welcome")
+    parsed = store.get_stats()["parsed"]["size"]
+    env_second.get_template_schema("welcome")
+    assert store.get_stats()["parsed"]["size"] == parsed + 1
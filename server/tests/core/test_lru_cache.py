@@ -0,0 +1,66 @@
+"""LRU 캐시 테스트"""
+
+import asyncio
+import time
+
+import pytest
+
+from temply_app.core.lru_cache import LRUCache
+
+
+def test_lru_cache_cost_and_ttl(monkeypatch):
+    """비용 합계를 넘으면 오래 사용하지 않은 항목부터 제거하고, 만료된 항목은 조회하지 않음"""
+    cache: LRUCache[str] = LRUCache(0, max_cost=10)
+    cache.set("a", "A", 4)
+    cache.set("b", "B", 4)
+    assert cache.get("a") == "A"
+    cache.set("c", "C", 4)
+    assert cache.get("b") is None
+    assert cache.keys() == ["a", "c"]
+    stats = cache.get_stats()
+    assert (stats["size"], stats["cost"], stats["evictions"]) == (2, 8, 1)
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    # 예산보다 큰 항목도 다른 항목을 모두 제거하고 저장 (조회할 때마다 다시 만들지 않도록)
+    cache.set("d", "D", 11)
+    assert cache.get("d") == "D"
+    assert cache.keys() == ["d"]
+    assert cache.get_stats()["oversized"] == 1
+    cache.set("e", "E", 4)
+    assert cache.keys() == ["e"]
+
+    now = time.monotonic()
+    ttl_cache: LRUCache[str] = LRUCache(10, ttl=60)
+    ttl_cache.set("a", "A")
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert ttl_cache.values() == []
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get_stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_cache_single_flight_load():
+    """같은 키를 동시에 로드하면 로더는 한 번만 실행"""
+    cache: LRUCache[str] = LRUCache(10)
+    calls = []
+
+    async def loader() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert cache.get_stats()["coalesced"] == 4
+
+    async def failing() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    outcomes = await asyncio.gather(
+        *(cache.get_or_load("f", failing) for _ in range(2)), return_exceptions=True
+    )
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    # 실패한 로드는 캐시하지 않으므로 다음 호출에서 다시 로드
+    assert await cache.get_or_load("f", loader) == "value"
@@ -0,0 +1,73 @@
+"""버전 파일 매니페스트 테스트"""
+
+import os
+
+import pytest
+
+from temply_app.core.temply import manifest as manifest_module
+from temply_app.core.temply.manifest import ManifestKind
+from temply_app.core.temply.parser.layout_parser import LayoutParser
+from temply_app.core.temply.parser.partial_parser import PartialParser
+from temply_app.core.temply.parser.template_parser import TemplateParser
+
+
+def _write(path, content: str = "content") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_scan_manifest(temp_env):
+    """파일 종류, 크기, 수정 시간 수집"""
+    _write(temp_env.layouts_dir / "layout_a", "layout")
+    _write(temp_env.partials_dir / "partial_a")
+    _write(temp_env.templates_dir / "welcome" / "HTML_EMAIL", "html")
+    _write(temp_env.templates_dir / "welcome" / "schema.json", "{}")
+    _write(temp_env.templates_dir / "welcome" / ".DS_Store")
+    _write(temp_env.templates_dir / ".hidden" / "HTML_EMAIL")
+    (temp_env.templates_dir / "empty").mkdir()
+
+    manifest = temp_env.get_manifest()
+
+    layout = manifest.layouts["layout_a"]
+    assert layout.kind == ManifestKind.LAYOUT
+    assert layout.path == "layouts/layout_a"
+    assert layout.size == len("layout")
+    assert layout.mtime_ns == os.stat(temp_env.layouts_dir / "layout_a").st_mtime_ns
+
+    assert set(manifest.components) == {"welcome", "empty"}
+    assert list(manifest.components["welcome"]) == ["HTML_EMAIL"]
+    assert manifest.components["welcome"]["HTML_EMAIL"].path == "templates/welcome/HTML_EMAIL"
+    assert manifest.schemas["welcome"].kind == ManifestKind.SCHEMA
+    assert len(manifest.entries()) == 4
+
+    assert temp_env.get_component_names("empty") == []
+    with pytest.raises(ValueError):
+        temp_env.get_component_names("missing")
+
+
+@pytest.mark.asyncio
+async def test_manifest_shared_by_parsers(temp_env, user, monkeypatch):
+    """세 파서가 디렉토리를 한 번만 순회하고, 파일 변경 시 다시 순회해야 함"""
+    for i in range(3):
+        _write(temp_env.layouts_dir / f"layout_{i}")
+        _write(temp_env.partials_dir / f"partial_{i}")
+        _write(temp_env.templates_dir / f"template_{i}" / "HTML_EMAIL")
+
+    scans = []
+    original_scan = manifest_module.scan_manifest
+
+    def counting_scan(*args, **kwargs):
+        scans.append(args)
+        return original_scan(*args, **kwargs)
+
+    monkeypatch.setattr("temply_app.core.temply.temply_env.scan_manifest", counting_scan)
+
+    LayoutParser(temp_env)
+    PartialParser(temp_env)
+    template_parser = TemplateParser(temp_env)
+    temp_env.render_template("template_0", {})
+    assert len(scans) == 1
+
+    await template_parser.create_component(user, "template_0", "TEXT_EMAIL", "text", "desc")
+    assert "TEXT_EMAIL" in temp_env.get_component_names("template_0")
+    assert len(scans) >= 2
@@ -0,0 +1,103 @@
+"""메타데이터 메모리 사용량 벤치마크
+
+노드 수(PARTIAL_COUNT, TEMPLATE_COUNT)를 늘려 더 큰 저장소에서 측정할 수 있습니다.
+pytest -s 로 실행하면 노드당 메모리 사용량이 출력됩니다.
+"""
+
+import gc
+import tracemalloc
+
+from temply_app.core.search_index import SearchIndex
+from temply_app.core.temply.parser.meta_model import BaseMetaData
+from temply_app.core.temply.parser.partial_parser import PartialParser
+from temply_app.core.temply.parser.template_parser import TemplateParser
+
+PARTIAL_COUNT = 200
+TEMPLATE_COUNT = 40
+COMPONENT_NAMES = ["HTML_EMAIL", "TEXT_EMAIL", "TEXT_EMAIL_SUBJECT"]
+USERS = ["alice", "bob", "carol"]
+
+# 노드당 허용 메모리 (본문 제외, 메타데이터/인접 정보만)
+MAX_BYTES_PER_NODE = 1500
+
+
+def _build_synthetic_repo(env) -> None:
+    """대규모 합성 저장소 생성"""
+    body = "<p>{{ locals.title }}</p>\n" * 5
+    for i in range(PARTIAL_COUNT):
+        meta = BaseMetaData(
+            description=f"partial {i}",
+            created_at=BaseMetaData.get_current_datetime(),
+            created_by=USERS[i % len(USERS)],
+            updated_at=BaseMetaData.get_current_datetime(),
+            updated_by=USERS[(i + 1) % len(USERS)],
+        )
+        dependencies = {f"partial_{j}" for j in (i // 2, i // 3) if j < i}
+        lines = [env.format_meta_block(meta)]
+        lines.extend(env.format_partial_imports(dependencies))
+        lines.append(env.format_partial_content(body))
+        (env.partials_dir / f"partial_{i}").write_text("\n".join(lines), encoding="utf-8")
+
+    (env.layouts_dir / "layout_main").write_text(
+        env.format_meta_block(BaseMetaData()) + "\n{% block content %}{% endblock %}",
+        encoding="utf-8",
+    )
+    for i in range(TEMPLATE_COUNT):
+        template_dir = env.templates_dir / f"template_{i}"
+        template_dir.mkdir()
+        for component in COMPONENT_NAMES:
+            meta = BaseMetaData(
+                description=f"template {i} {component}",
+                created_by=USERS[i % len(USERS)],
+                updated_by=USERS[i % len(USERS)],
+            )
+            lines = [env.format_meta_block(meta), env.format_layout_block("layout_main")]
+            lines.extend(env.format_partial_imports({f"partial_{i}", f"partial_{i + 1}"}))
+            lines.append(env.format_layout_content(body))
+            (template_dir / component).write_text("\n".join(lines), encoding="utf-8")
+
+
+def _measure(env, factory) -> tuple[object, int]:
+    """팩토리로 생성한 파서가 유지하는 메모리 측정 (검색 인덱스 제외)"""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    parser = factory()
+    env.search_index = SearchIndex()
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return parser, after - before
+
+
+def test_meta_model_memory_per_node(temp_env):
+    """대규모 합성 저장소에서 노드당 메모리 사용량"""
+    _build_synthetic_repo(temp_env)
+    # 최초 파싱 시의 일회성 할당(지연 import 등)은 측정에서 제외
+    temp_env.parse(temp_env.load_partial_source("partial_10")[0])
+    BaseMetaData.parse_datetime("2024-07-01 00:00:00")
+
+    partial_parser, partial_bytes = _measure(temp_env, lambda: PartialParser(temp_env))
+    template_parser, template_bytes = _measure(temp_env, lambda: TemplateParser(temp_env))
+
+    partial_count = len(partial_parser.nodes)
+    component_count = len(template_parser.nodes)
+    assert partial_count == PARTIAL_COUNT
+    assert component_count == TEMPLATE_COUNT * len(COMPONENT_NAMES)
+
+    partial_per_node = partial_bytes / partial_count
+    component_per_node = template_bytes / component_count
+    assert partial_per_node < MAX_BYTES_PER_NODE, f"partials: {partial_per_node:.0f} bytes/node"
+    assert (
+        component_per_node < MAX_BYTES_PER_NODE
+    ), f"components: {component_per_node:.0f} bytes/node"
+
+    # 의존성 그래프는 정수 ID로 연결되어야 함
+    node = partial_parser.nodes["partial_10"]
+    assert all(isinstance(node_id, int) for node_id in node.parent_ids)
+    assert {parent.name for parent in node.parents} == {"partial_5", "partial_3"}
+    assert "partial_20" in {child.name for child in node.children}
+
+    # 반복되는 식별자 문자열은 인터닝되어야 함
+    users = {id(n.created_by) for n in partial_parser.nodes.values()}
+    assert len(users) == len(USERS)
@@ -5,6 +5,7 @@ from datetime import datetime
 import pytest
 
 from temply_app.core.temply.parser.meta_model import JST, BaseMetaData
+from temply_app.core.temply.parser.template_parser import TemplateParser
 from temply_app.core.utils import parser_meta_util
 from temply_app.models.common_model import Meta
 
@@ -253,3 +254,57 @@ invalid_key: value
     assert meta.updated_at is None
     assert meta.updated_by is None
     assert block == "템플릿 내용"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+def test_read_meta_header_only(tmp_path, chunk_size):
+    """파일 헤더의 메타데이터 블록만 읽어서 파싱"""
+    path = tmp_path / "component"
+    path.write_text(
+        "{#-\ndescription: 테스트 설명\\n두번째 줄\ncreated_at: 2024-03-21 12:00:00\n"
+        "created_by: user1\nupdated_at: 2024-03-22\nupdated_by: user2\n-#}\n"
+        + "본문 -#} {{ value }}\n" * 1000,
+        encoding="utf-8",
+    )
+
+    meta = parser_meta_util.read_meta(path, "utf-8", chunk_size=chunk_size)
+
+    assert meta.description == "테스트 설명\n두번째 줄"
+    assert meta.created_at == datetime(2024, 3, 21, 12, 0, 0, tzinfo=JST)
+    assert meta.created_by == "user1"
+    assert meta.updated_at == datetime(2024, 3, 22, tzinfo=JST)
+    assert meta.updated_by == "user2"
+    assert meta == parser_meta_util.parse(path.read_text(encoding="utf-8"))[0]
+
+
+def test_read_meta_without_meta_block(tmp_path):
+    """메타데이터 블록이 없으면 본문을 끝까지 읽지 않고 빈 메타데이터 반환"""
+    path = tmp_path / "component"
+    path.write_text("  본문 {#- 주석 -#}\n" + "x" * 100000, encoding="utf-8")
+
+    meta = parser_meta_util.read_meta(path, "utf-8", chunk_size=8)
+
+    assert meta == BaseMetaData()
+
+
+@pytest.mark.asyncio
+async def test_parser_refresh_metadata(temp_env, user):
+    """헤더만 읽어서 파서 인덱스의 메타데이터 갱신"""
+    parser = TemplateParser(temp_env)
+    component = await parser.create_component(
+        user, "test_template", "HTML_EMAIL", "<p>본문</p>", "원래 설명"
+    )
+    content_hash = component.content_hash
+
+    path = temp_env.templates_dir / "test_template" / "HTML_EMAIL"
+    source = path.read_text(encoding=temp_env.file_encoding)
+    path.write_text(
+        source.replace("description: 원래 설명", "description: 변경된 설명"),
+        encoding=temp_env.file_encoding,
+    )
+
+    assert await parser.refresh_metadata() == 1
+    component = await parser.get_component("test_template", "HTML_EMAIL")
+    assert component.description == "변경된 설명"
+    assert component.content_hash == content_hash
+    assert await parser.refresh_metadata() == 0
@@ -0,0 +1,68 @@
+"""목록 조회 유틸 테스트"""
+
+from datetime import datetime
+
+import pytest
+
+from temply_app.core.exceptions import InvalidPageRequestError
+from temply_app.core.temply.parser.meta_model import JST, PartialMetaData
+from temply_app.core.utils import page_util
+from temply_app.models.partial_model import Partial
+
+ALLOWED = tuple(Partial.model_fields)
+
+
+def _partial(name: str) -> PartialMetaData:
+    return PartialMetaData(
+        name=name,
+        content_hash="",
+        content_start=0,
+        content_end=0,
+        dependencies={"b", "a"},
+        description=f"{name} desc",
+        created_at=datetime(2024, 7, 1, tzinfo=JST),
+    )
+
+
+def test_parse_fields():
+    """필드 선택 파싱 (별칭, 중복 제거)"""
+    assert page_util.parse_fields(None, ALLOWED) == ALLOWED
+    assert page_util.parse_fields("name,meta,name", ALLOWED) == (
+        "name",
+        *page_util.META_FIELDS,
+    )
+    with pytest.raises(InvalidPageRequestError):
+        page_util.parse_fields("name,unknown", ALLOWED)
+    with pytest.raises(InvalidPageRequestError):
+        page_util.parse_fields(",", ALLOWED)
+
+
+def test_cursor_roundtrip():
+    """커서 인코딩/디코딩"""
+    key = ("템플릿", "HTML_EMAIL")
+    assert page_util.decode_cursor(page_util.encode_cursor(key)) == key
+    with pytest.raises(InvalidPageRequestError):
+        page_util.decode_cursor("not-a-cursor")
+
+
+def test_paginate_projection():
+    """정렬 키 기준 페이지네이션과 필드 선택"""
+    records = [_partial(name) for name in ("c", "a", "e", "b", "d")]
+    fields = ("name", "created_at", "dependencies")
+
+    names = []
+    cursor = None
+    while True:
+        items, cursor = page_util.paginate(
+            records, lambda p: (p.name,), fields, cursor=cursor, limit=2
+        )
+        names.extend(item["name"] for item in items)
+        if cursor is None:
+            break
+
+    assert names == ["a", "b", "c", "d", "e"]
+    assert items[-1] == {
+        "name": "e",
+        "created_at": "2024-07-01T00:00:00+09:00",
+        "dependencies": ["a", "b"],
+    }
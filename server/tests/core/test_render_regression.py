@@ -0,0 +1,111 @@
+"""버전 간 렌더링 비교 테스트"""
+
+import pytest
+
+from temply_app.core import render_regression
+from temply_app.core.config import Config
+from temply_app.core.render_regression import (
+    RenderStatus,
+    RenderTarget,
+    build_tasks,
+    run_render_regression,
+    shutdown_render_pool,
+)
+from temply_app.core.temply.bytecode_cache import SourceBytecodeCache
+from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.utils.cache_util import get_template_parser
+from temply_app.core.utils.file_util import SnapshotMode, snapshot_tree
+from temply_app.models.common_model import VersionInfo
+from temply_app.repositories.diff_repository import DiffRepository
+
+
+@pytest.mark.asyncio
+async def test_render_regression(tmp_path, user):
+    """두 버전을 같은 데이터로 렌더링하여 오류 > 추가/삭제 > 변경 정도 순으로 정렬"""
+    config = Config(
+        env="local",
+        noti_temply_dir=str(tmp_path),
+        render_regression_max_workers=2,
+        render_regression_chunk_size=2,
+    )
+    main = TemplyEnv(config, "main")
+    parser = get_template_parser(main)
+    await parser.create_component(user, "welcome", "TEXT_EMAIL", "hello {{ user.name }}")
+    await parser.create_component(user, "welcome", "HTML_EMAIL", "a\nb\nc\nd")
+    await parser.create_component(user, "notice", "TEXT_EMAIL", "notice")
+    await parser.create_component(user, "gone", "TEXT_EMAIL", "gone")
+    snapshot_tree(tmp_path / "main", tmp_path / "r1", SnapshotMode.COPY)
+
+    r1 = TemplyEnv(config, "r1")
+    parser = get_template_parser(r1)
+    await parser.update_component(user, "welcome", "HTML_EMAIL", "a\nb\nc\nchanged")
+    await parser.update_component(user, "notice", "TEXT_EMAIL", "{{ 1 / 0 }}")
+    await parser.delete_component(user, "gone", "TEXT_EMAIL")
+    await parser.create_component(user, "fresh", "TEXT_EMAIL", "fresh")
+
+    try:
+        payloads = {"welcome": {"user": {"name": "kim"}}}
+        tasks, used = build_tasks(main, r1, payloads)
+        assert used["welcome"] == payloads["welcome"]
+        assert {(task.template, task.component) for task in tasks} == {
+            ("welcome", "TEXT_EMAIL"),
+            ("welcome", "HTML_EMAIL"),
+            ("notice", "TEXT_EMAIL"),
+            ("gone", "TEXT_EMAIL"),
+            ("fresh", "TEXT_EMAIL"),
+        }
+
+        outcomes = await run_render_regression(
+            config, RenderTarget("main"), RenderTarget("r1"), tasks
+        )
+        assert [(o.template, o.status) for o in outcomes] == [
+            ("notice", RenderStatus.ERROR),
+            ("fresh", RenderStatus.ADDED),
+            ("gone", RenderStatus.REMOVED),
+            ("welcome", RenderStatus.CHANGED),
+            ("welcome", RenderStatus.UNCHANGED),
+        ]
+        changed = outcomes[3]
+        assert changed.component == "HTML_EMAIL"
+        assert 0 < changed.score < 1
+        assert "+changed" in changed.diff
+
+        report = await DiffRepository(
+            config, VersionInfo(config, "main"), main, VersionInfo(config, "r1"), r1
+        ).render_diff(payloads)
+        assert (report.total, report.unchanged, report.errors) == (5, 1, 1)
+        assert [change.status for change in report.results] == [
+            "error",
+            "added",
+            "removed",
+            "changed",
+        ]
+    finally:
+        shutdown_render_pool()
+
+
+def test_source_bytecode_cache_shared_across_versions(tmp_path):
+    """바이트 단위로 같은 템플릿은 버전 디렉토리가 달라도 컴파일 결과 공유"""
+    config = Config(env="local", noti_temply_dir=str(tmp_path))
+    for version in ("main", "r1"):
+        path = tmp_path / version / "templates" / "welcome" / "TEXT_EMAIL"
+        path.parent.mkdir(parents=True)
+        path.write_text("{#-\n-#}\nhello {{ name }}", encoding="utf-8")
+
+    cache = SourceBytecodeCache(16)
+    envs = [TemplyEnv(config, version) for version in ("main", "r1")]
+    for temply_env in envs:
+        temply_env.env.bytecode_cache = cache
+    outputs = {env.render_component("welcome", "TEXT_EMAIL", {"name": "kim"}) for env in envs}
+
+    assert outputs == {"hello kim"}
+    assert cache.size() == 1
+
+
+def test_worker_env_reused_per_revision(tmp_path):
+    """작업 프로세스는 버전과 리비전이 같으면 환경을 다시 만들지 않음"""
+    config = Config(env="local", noti_temply_dir=str(tmp_path))
+    get_worker_env = render_regression._get_worker_env  # pylint: disable=protected-access
+    first = get_worker_env(config, RenderTarget("main", "a"))
+    assert get_worker_env(config, RenderTarget("main", "a")) is first
+    assert get_worker_env(config, RenderTarget("main", "b")) is not first
@@ -0,0 +1,101 @@
+"""버전 리비전 확인 테스트"""
+
+import os
+import subprocess
+
+import pytest
+
+from temply_app.core.config import Config
+from temply_app.core.utils.cache_util import (
+    get_layout_parser,
+    get_partial_parser,
+    get_template_parser,
+    get_validated_temply_version_env,
+    temply_version_env_cache_clear,
+)
+from temply_app.core.utils.revision_util import read_head_sha
+from temply_app.models.common_model import VersionInfo
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _write(path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    # 같은 크기의 빠른 연속 수정도 감지되도록 수정 시간을 분명히 변경
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_read_head_sha(tmp_path, origin_repo):
+    """일반 저장소, packed-refs, worktree, detached HEAD에서 HEAD SHA 조회"""
+    clone = tmp_path / "clone"
+    _git("clone", str(origin_repo), str(clone))
+    expected = _git("-C", str(clone), "rev-parse", "HEAD")
+    assert read_head_sha(str(clone)) == expected
+
+    _git("-C", str(clone), "pack-refs", "--all")
+    assert not (clone / ".git" / "refs" / "heads" / "main").exists()
+    assert read_head_sha(str(clone)) == expected
+
+    worktree = tmp_path / "wt"
+    _git("-C", str(clone), "worktree", "add", "-b", "r1", str(worktree))
+    assert read_head_sha(str(worktree)) == expected
+
+    _git("-C", str(clone), "checkout", "--detach")
+    assert read_head_sha(str(clone)) == expected
+
+    assert read_head_sha(str(tmp_path)) is None
+
+
+@pytest.mark.asyncio
+async def test_version_env_incremental_sync(tmp_path, user):
+    """로컬 모드에서 외부 파일 변경은 변경된 항목만 다시 파싱"""
+    root = tmp_path / "r3901"
+    _write(root / "layouts" / "layout_a", "{#-\ndescription: a\n-#}\n<div>A</div>")
+    _write(root / "layouts" / "layout_b", "{#-\ndescription: b\n-#}\n<div>B</div>")
+    _write(
+        root / "partials" / "partial_a",
+        "{#-\ndescription: p\n-#}\n{% macro render(locals) %}p{% endmacro %}",
+    )
+    _write(root / "templates" / "welcome" / "HTML_EMAIL", "{#-\ndescription: t\n-#}\nhello")
+    config = Config(
+        env="local", noti_temply_dir=str(tmp_path), version_env_validate_interval_seconds=0
+    )
+    version_info = VersionInfo(config, "r3901")
+    try:
+        version_env = await get_validated_temply_version_env(config, version_info)
+        temply_env = version_env.get_temply_env()
+        layout_parser = get_layout_parser(temply_env)
+        partial_parser = get_partial_parser(temply_env)
+        template_parser = get_template_parser(temply_env)
+        layout_b = await layout_parser.get_layout("layout_b")
+        component = await template_parser.get_component("welcome", "HTML_EMAIL")
+        revision = version_env.revision
+        generation = temply_env.index_generation
+
+        # 변경이 없으면 파서는 그대로
+        assert (await get_validated_temply_version_env(config, version_info)) is version_env
+        assert temply_env.index_generation == generation
+
+        # 다른 워커가 파일을 변경
+        _write(root / "layouts" / "layout_a", "{#-\ndescription: changed\n-#}\n<div>A2</div>")
+        _write(root / "layouts" / "layout_c", "{#-\ndescription: c\n-#}\n<div>C</div>")
+        os.remove(root / "partials" / "partial_a")
+
+        await get_validated_temply_version_env(config, version_info)
+        assert version_env.revision != revision
+        assert temply_env.index_generation > generation
+
+        layout_a = await layout_parser.get_layout("layout_a")
+        assert layout_a.description == "changed"
+        assert layout_a.content == "<div>A2</div>"
+        assert (await layout_parser.get_layout("layout_c")).description == "c"
+        assert {p.name for p in await partial_parser.get_partials()} == set()
+        # 변경되지 않은 항목은 다시 파싱하지 않음
+        assert await layout_parser.get_layout("layout_b") is layout_b
+        assert await template_parser.get_component("welcome", "HTML_EMAIL") is component
+    finally:
+        temply_version_env_cache_clear(version_info)
@@ -0,0 +1,191 @@
+"""읽기/쓰기 락 테스트"""
+
+import asyncio
+import random
+
+import pytest
+
+from temply_app.core.rw_lock import AsyncRWLock
+from temply_app.core.temply.parser.layout_parser import LayoutParser
+from temply_app.core.temply.parser.partial_parser import PartialParser
+from temply_app.core.temply.parser.template_parser import TemplateParser
+from temply_app.models.common_model import User
+
+
+@pytest.mark.asyncio
+async def test_rw_lock_concurrent_reads():
+    """읽기는 동시에 수행되어야 함"""
+    lock = AsyncRWLock()
+    active = 0
+    max_active = 0
+
+    async def reader():
+        nonlocal active, max_active
+        async with lock.read():
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(reader() for _ in range(20)))
+    assert max_active == 20
+    assert lock.readers == 0
+
+
+@pytest.mark.asyncio
+async def test_rw_lock_exclusive_writes():
+    """쓰기는 다른 읽기/쓰기와 동시에 수행되지 않아야 함"""
+    lock = AsyncRWLock()
+    state = {"readers": 0, "writers": 0, "value": 0}
+    violations = []
+
+    async def reader():
+        async with lock.read():
+            state["readers"] += 1
+            if state["writers"]:
+                violations.append("read during write")
+            await asyncio.sleep(random.random() / 1000)
+            state["readers"] -= 1
+
+    async def writer():
+        async with lock.write():
+            state["writers"] += 1
+            if state["writers"] > 1 or state["readers"]:
+                violations.append("write overlap")
+            value = state["value"]
+            await asyncio.sleep(random.random() / 1000)
+            state["value"] = value + 1
+            state["writers"] -= 1
+
+    tasks = [writer() for _ in range(50)] + [reader() for _ in range(200)]
+    random.shuffle(tasks)
+    await asyncio.gather(*tasks)
+
+    assert not violations
+    assert state["value"] == 50
+    assert not lock.writing
+
+
+@pytest.mark.asyncio
+async def test_rw_lock_writer_not_starved():
+    """읽기가 계속 들어와도 대기 중인 쓰기가 먼저 수행되어야 함"""
+    lock = AsyncRWLock()
+    order = []
+
+    async def reader(name: str):
+        async with lock.read():
+            await asyncio.sleep(0.01)
+            order.append(name)
+
+    async def writer():
+        async with lock.write():
+            order.append("writer")
+
+    first = asyncio.create_task(reader("r1"))
+    await asyncio.sleep(0)
+    pending_writer = asyncio.create_task(writer())
+    await asyncio.sleep(0)
+    late = asyncio.create_task(reader("r2"))
+    await asyncio.gather(first, pending_writer, late)
+
+    assert order == ["r1", "writer", "r2"]
+
+
+@pytest.mark.asyncio
+async def test_rw_lock_cancelled_writer_releases_readers():
+    """대기 중 취소된 쓰기가 읽기를 막지 않아야 함"""
+    lock = AsyncRWLock()
+    release = asyncio.Event()
+
+    async def holder():
+        async with lock.read():
+            await release.wait()
+
+    holder_task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+
+    async def writer():
+        async with lock.write():
+            pass
+
+    writer_task = asyncio.create_task(writer())
+    await asyncio.sleep(0)
+    writer_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await writer_task
+
+    async with lock.read():
+        pass
+
+    release.set()
+    await holder_task
+
+
+@pytest.mark.asyncio
+async def test_parsers_concurrent_edits(temp_env):
+    """여러 파서에 대한 동시 편집/조회 스트레스 테스트"""
+    layout_parser = LayoutParser(temp_env)
+    partial_parser = PartialParser(temp_env)
+    template_parser = TemplateParser(temp_env)
+    await layout_parser.get_layouts()
+    await partial_parser.get_partials()
+    await template_parser.get_components()
+
+    initialize_calls = 0
+    for parser in (layout_parser, partial_parser, template_parser):
+        original = parser._initialize
+
+        async def counting_initialize(_original=original):
+            nonlocal initialize_calls
+            initialize_calls += 1
+            await _original()
+
+        parser._initialize = counting_initialize
+
+    users = [User(name=f"user{i}") for i in range(5)]
+    layout_names = [f"layout_{i}" for i in range(20)]
+    partial_names = [f"partial_{i}" for i in range(20)]
+
+    async def edit_layout(name: str):
+        user = random.choice(users)
+        await layout_parser.create(user, name, f"<div>{name}</div>", "desc")
+        for i in range(3):
+            await layout_parser.update(user, name, f"<div>{name} {i}</div>", f"desc {i}")
+
+    async def edit_partial(name: str):
+        user = random.choice(users)
+        await partial_parser.create(user, name, f"<p>{name}</p>", "desc")
+        await partial_parser.update(user, name, f"<p>{name} updated</p>", "updated")
+
+    async def read_all():
+        for _ in range(10):
+            layouts = await layout_parser.get_layouts()
+            partials = await partial_parser.get_partials()
+            for layout in layouts:
+                assert layout.name == layout_parser.nodes[layout.name].name
+            for partial in partials:
+                assert partial.name in partial_parser.nodes
+            await template_parser.get_components()
+            await asyncio.sleep(0)
+
+    tasks = (
+        [edit_layout(name) for name in layout_names]
+        + [edit_partial(name) for name in partial_names]
+        + [read_all() for _ in range(20)]
+    )
+    random.shuffle(tasks)
+    await asyncio.gather(*tasks)
+
+    layouts = {layout.name: layout for layout in await layout_parser.get_layouts()}
+    assert set(layouts) == set(layout_names)
+    for name, layout in layouts.items():
+        assert layout.content == f"<div>{name} 2</div>"
+        assert layout.description == "desc 2"
+
+    partials = {partial.name: partial for partial in await partial_parser.get_partials()}
+    assert set(partials) == set(partial_names)
+    for name, partial in partials.items():
+        assert partial.content == f"<p>{name} updated</p>"
+
+    # 편집 중 전체 재초기화가 일어나지 않아야 함
+    assert initialize_calls == 0
@@ -0,0 +1,110 @@
+"""전문 검색 인덱스 테스트"""
+
+import time
+
+import pytest
+
+from temply_app.core.search_index import SearchIndex, SearchKind, make_snippet, tokenize
+from temply_app.core.temply.parser.layout_parser import LayoutParser
+from temply_app.core.temply.parser.partial_parser import PartialParser
+from temply_app.core.temply.parser.template_parser import TemplateParser
+
+
+def test_tokenize():
+    """소문자 토큰 분리 (한글 포함)"""
+    assert tokenize("<p>Hello, 세계! {{ user.name }}</p>") == [
+        "p",
+        "hello",
+        "세계",
+        "user",
+        "name",
+        "p",
+    ]
+
+
+def test_search_ranking_and_substring():
+    """정확히 일치하는 토큰과 이름 필드가 더 높은 점수를 가져야 함"""
+    index = SearchIndex()
+    index.add(SearchKind.LAYOUT, "welcome", {"name": "welcome", "content": "<p>hello</p>"})
+    index.add(SearchKind.PARTIAL, "footer", {"name": "footer", "content": "welcome back"})
+    index.add(SearchKind.PARTIAL, "header", {"name": "header", "content": "welcomepage link"})
+    index.add(SearchKind.PARTIAL, "other", {"name": "other", "content": "nothing"})
+
+    hits = index.search("welcome")
+    assert [hit.key for hit in hits] == ["welcome", "footer", "header"]
+
+    # 부분 문자열 검색 (n-gram)
+    assert [hit.key for hit in index.search("lcomep")] == ["header"]
+    # 모든 검색어를 포함해야 함
+    assert [hit.key for hit in index.search("welcome back")] == ["footer"]
+    # 종류 필터
+    assert [hit.key for hit in index.search("welcome", {SearchKind.LAYOUT})] == ["welcome"]
+    assert index.search("없는검색어") == []
+
+
+def test_search_incremental_update():
+    """문서 교체/필드 갱신/삭제 시 인덱스가 정리되어야 함"""
+    index = SearchIndex()
+    index.add(SearchKind.LAYOUT, "a", {"name": "a", "content": "apple banana"})
+    index.add(SearchKind.LAYOUT, "a", {"name": "a", "content": "cherry"})
+    assert index.search("apple") == []
+    assert [hit.key for hit in index.search("cherry")] == ["a"]
+
+    index.update_field(SearchKind.LAYOUT, "a", "description", "설명 문구")
+    assert [hit.key for hit in index.search("설명")] == ["a"]
+    assert [hit.key for hit in index.search("cherry")] == ["a"]
+
+    index.remove(SearchKind.LAYOUT, "a")
+    assert index.get_stats() == {"documents": 0, "tokens": 0, "grams": 0}
+
+
+def test_make_snippet():
+    """검색어 주변 스니펫과 강조 위치"""
+    text = "x" * 200 + " Hello World hello " + "y" * 200
+    snippet, highlights = make_snippet(text, "hello", width=60)
+    assert len(snippet) == 60
+    assert [snippet[start:end] for start, end in highlights] == ["Hello", "hello"]
+    assert make_snippet(text, "missing") is None
+
+    # 소문자로 바꾸면 길이가 달라지는 문자가 앞에 있어도 강조 위치가 맞아야 함
+    snippet, highlights = make_snippet("İİ say Hello", "hello")
+    assert [snippet[start:end] for start, end in highlights] == ["Hello"]
+
+
+def test_search_performance():
+    """수천 개 문서에서 검색이 밀리초 단위로 응답해야 함"""
+    index = SearchIndex()
+    words = [f"word{i}" for i in range(2000)]
+    for i in range(3000):
+        content = " ".join(words[(i * 7 + j) % len(words)] for j in range(200))
+        index.add(SearchKind.COMPONENT, f"template_{i}/HTML_EMAIL", {"content": content})
+
+    started = time.perf_counter()
+    for query in ("word1234", "ord19", "word5 word7"):
+        assert index.search(query)
+    elapsed = (time.perf_counter() - started) / 3
+    assert elapsed < 0.1
+
+
+@pytest.mark.asyncio
+async def test_parser_write_paths_update_index(temp_env, user):
+    """파서 쓰기 경로에서 검색 인덱스가 갱신되어야 함"""
+    layout_parser = LayoutParser(temp_env)
+    partial_parser = PartialParser(temp_env)
+    template_parser = TemplateParser(temp_env)
+    index = temp_env.search_index
+
+    await layout_parser.create(user, "layout_a", "<div>banner</div>", "메인 레이아웃")
+    await partial_parser.create(user, "partial_a", "<p>coupon</p>", "쿠폰")
+    await template_parser.create_component(
+        user, "promo", "HTML_EMAIL", "<p>coupon banner</p>", "프로모션"
+    )
+    assert {hit.key for hit in index.search("coupon")} == {"partial_a", "promo/HTML_EMAIL"}
+
+    await layout_parser.update(user, "layout_a", "<div>hero</div>", "메인 레이아웃")
+    assert {hit.key for hit in index.search("banner")} == {"promo/HTML_EMAIL"}
+
+    await partial_parser.delete(user, "partial_a")
+    await template_parser.delete_component(user, "promo", "HTML_EMAIL")
+    assert index.search("coupon") == []
+    assert [hit.key for hit in index.search("메인")] == ["layout_a"]
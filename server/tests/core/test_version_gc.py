@@ -0,0 +1,96 @@
+"""버전 디렉토리 디스크 정리 테스트"""
+
+import os
+import subprocess
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from temply_app.core import dependency
+from temply_app.core.git_env import GitEnv
+from temply_app.core.utils import version_access
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.core.utils.version_access import get_version_access_tracker
+from temply_app.core.version_gc import VersionGC
+from temply_app.models.common_model import VersionInfo
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+async def _create_versions(config, *versions: str) -> dict:
+    await GitUtil.get_versions(GitEnv(config, VersionInfo.root_version(config)))
+    git_envs = {}
+    for version in versions:
+        git_env = GitEnv(config, VersionInfo(config, version))
+        await GitUtil.create_version(git_env)
+        git_envs[version] = git_env
+    return git_envs
+
+
+def _set_last_access(config, version: str, accessed_at: float) -> None:
+    root_path = os.path.abspath(config.noti_temply_dir)
+    tracker = get_version_access_tracker(config)
+    tracker.forget(root_path, version)
+    tracker.touch(root_path, version)
+    marker = os.path.join(root_path, config.version_access_dir_name, version)
+    os.utime(marker, (accessed_at, accessed_at))
+    tracker._accessed_at.pop((root_path, version))  # pylint: disable=protected-access
+
+
+@pytest.mark.asyncio
+async def test_version_gc_ttl_and_restore(git_config, origin_repo, monkeypatch):
+    """오래 접근하지 않은 버전만 정리하고 다음 접근 시 다시 체크아웃"""
+    monkeypatch.setattr(version_access, "_version_access_tracker", None)
+    config = git_config.model_copy(update={"version_gc_ttl_seconds": 100})
+    git_envs = await _create_versions(config, "r1", "r2", "r3")
+    head = _git("-C", git_envs["r1"].version_path, "rev-parse", "HEAD")
+
+    now = time.time()
+    _set_last_access(config, "r1", now - 1000)
+    _set_last_access(config, "r2", now)
+    _set_last_access(config, "r3", now - 1000)
+    # 커밋되지 않은 변경이 있는 버전은 정리하지 않음
+    with open(os.path.join(git_envs["r3"].version_path, "draft"), "w", encoding="utf-8") as f:
+        f.write("draft")
+
+    result = await VersionGC(config).collect()
+    assert result["evicted"] == ["r1"]
+    assert result["kept"] == 2
+    assert result["freed_bytes"] > 0
+    assert not os.path.exists(git_envs["r1"].version_path)
+    assert os.path.exists(git_envs["r2"].version_path)
+    assert os.path.exists(git_envs["r3"].version_path)
+
+    get_version_env = dependency._get_version_env  # pylint: disable=protected-access
+    temply_version_env = await get_version_env(config, VersionInfo(config, "r1"))
+    assert temply_version_env.get_temply_env().templates_dir.exists()
+    assert _git("-C", git_envs["r1"].version_path, "rev-parse", "HEAD") == head
+
+    with pytest.raises(HTTPException) as e:
+        await get_version_env(config, VersionInfo(config, "r404"))
+    assert e.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_version_gc_disk_budget(git_config, origin_repo, monkeypatch):
+    """디스크 예산을 넘으면 최근에 접근하지 않은 버전부터 정리"""
+    monkeypatch.setattr(version_access, "_version_access_tracker", None)
+    config = git_config.model_copy(
+        update={"version_gc_max_bytes": 1, "version_gc_min_idle_seconds": 50}
+    )
+    await _create_versions(config, "r1", "r2", "r3")
+    now = time.time()
+    _set_last_access(config, "r1", now - 300)
+    _set_last_access(config, "r2", now - 200)
+    _set_last_access(config, "r3", now)
+
+    result = await VersionGC(config).collect()
+    # 최근 접근한 버전은 예산을 넘어도 유지
+    assert result["evicted"] == ["r1", "r2"]
+    assert result["kept"] == 1
+
+    assert not VersionGC(git_config).enabled
+    assert (await VersionGC(git_config).collect())["evicted"] == []
@@ -0,0 +1,97 @@
+"""버전별 git 작업 락 테스트"""
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from temply_app.core.exceptions import GitLockTimeoutError
+from temply_app.core.git_env import GitEnv
+from temply_app.core.utils.git_util import GitUtil
+from temply_app.core.utils.version_lock import VersionLock
+from temply_app.models.common_model import User, VersionInfo
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.mark.asyncio
+async def test_version_lock_serializes_same_version(tmp_path):
+    """같은 버전의 작업은 순서대로, 다른 버전의 작업은 동시에 실행"""
+    version_lock = VersionLock(".locks", timeout=5)
+    events = []
+
+    async def work(name: str, tag: str) -> None:
+        async with version_lock.hold(str(tmp_path), name):
+            events.append(f"{tag}:start")
+            await asyncio.sleep(0.05)
+            events.append(f"{tag}:end")
+
+    await asyncio.gather(work("r1", "a"), work("r1", "b"), work("r2", "c"))
+
+    assert events.index("a:end") < events.index("b:start")
+    assert events.index("c:start") < events.index("a:end")
+    assert (tmp_path / ".locks" / "version-r1.lock").exists()
+    assert version_lock.lock_path(str(tmp_path), ".bare").endswith("/.locks/repo-bare.lock")
+    assert version_lock.lock_path(str(tmp_path), "bare").endswith("/.locks/version-bare.lock")
+
+
+@pytest.mark.asyncio
+async def test_version_lock_across_processes(tmp_path):
+    """다른 프로세스가 파일 락을 가지고 있으면 대기하고 시간 제한을 넘으면 실패"""
+    version_lock = VersionLock(".locks", timeout=0.3)
+    lock_path = Path(version_lock.lock_path(str(tmp_path), "r1"))
+    lock_path.parent.mkdir()
+    holder = subprocess.Popen(  # pylint: disable=consider-using-with
+        [
+            sys.executable,
+            "-c",
+            "import fcntl, sys, time\n"
+            f"f = open({str(lock_path)!r}, 'w')\n"
+            "fcntl.flock(f, fcntl.LOCK_EX)\n"
+            "print('locked', flush=True)\n"
+            "time.sleep(30)\n",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert holder.stdout is not None and holder.stdout.readline().strip() == "locked"
+        with pytest.raises(GitLockTimeoutError):
+            async with version_lock.hold(str(tmp_path), "r1"):
+                pass
+    finally:
+        holder.kill()
+        holder.wait()
+
+    async with version_lock.hold(str(tmp_path), "r1"):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commits_and_refresh(tmp_path, git_config, origin_repo):
+    """같은 버전의 동시 커밋/push와 새로고침이 서로 끼어들지 않음"""
+    await GitUtil.get_versions(GitEnv(git_config, VersionInfo.root_version(git_config)))
+    git_env = GitEnv(git_config, VersionInfo(git_config, "r1"))
+    await GitUtil.create_version(git_env)
+    # 다른 프로세스에서 요청을 받은 것처럼 같은 버전 생성을 다시 요청해도 무시
+    await GitUtil.create_version(git_env)
+
+    async def save(index: int) -> None:
+        path = f"partials/partial_{index}"
+        file_path = Path(git_env.version_path) / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(str(index), encoding="utf-8")
+        await GitUtil.commit_version(git_env, User(name=f"user{index}"), f"save {index}", [path])
+
+    await asyncio.gather(*(save(index) for index in range(4)), GitUtil.refresh_version(git_env))
+
+    work = tmp_path / "work"
+    _git("clone", "-q", "--branch", "r1", str(origin_repo), str(work))
+    assert sorted(p.name for p in (work / "partials").iterdir()) == [
+        f"partial_{index}" for index in range(4)
+    ]
+    assert _git("-C", git_env.version_path, "status", "--porcelain") == ""
@@ -0,0 +1,111 @@
+"""버전 목록 백그라운드 갱신 테스트"""
+
+import asyncio
+import os
+import subprocess
+
+import pytest
+
+from temply_app.core.config import Config
+from temply_app.core.version_refresher import VersionRefresher
+from temply_app.models.common_model import ReturnVersionInfo
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture()
+def local_config(tmp_path):
+    """로컬 버전 디렉토리 설정"""
+    os.environ["env"] = "local"
+    os.environ["NOTI_TEMPLY_DIR"] = str(tmp_path)
+    for version in ("main", "r1", ".hidden"):
+        (tmp_path / version).mkdir()
+    return Config(version_refresh_interval_seconds=0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_and_cache(local_config, tmp_path):
+    """갱신 결과를 캐시에서 조회"""
+    refresher = VersionRefresher(local_config)
+    assert not refresher.is_loaded
+
+    versions = await refresher.refresh()
+    assert [v.version for v in versions] == ["main", "r1"]
+    assert refresher.get_version("main").is_root
+    assert refresher.get_version("r2") is None
+
+    # 캐시는 다음 갱신 전까지 유지
+    (tmp_path / "r2").mkdir()
+    assert refresher.get_version("r2") is None
+    await refresher.refresh()
+    assert refresher.get_version("r2") is not None
+
+    refresher.set_version(ReturnVersionInfo(version="r3", is_root=False))
+    refresher.remove_version("r1")
+    assert [v.version for v in refresher.get_versions()] == ["main", "r2", "r3"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_single_flight(local_config, monkeypatch):
+    """동시에 요청된 갱신은 한 번만 실행"""
+    refresher = VersionRefresher(local_config)
+    calls = 0
+    original = refresher._load_local_versions
+
+    def counting_load():
+        nonlocal calls
+        calls += 1
+        return original()
+
+    monkeypatch.setattr(refresher, "_load_local_versions", counting_load)
+    results = await asyncio.gather(*(refresher.refresh() for _ in range(10)))
+    assert calls == 1
+    assert all(result == results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_background_refresh(local_config, tmp_path):
+    """주기적으로 버전 목록을 갱신"""
+    refresher = VersionRefresher(
+        local_config.model_copy(update={"version_refresh_interval_seconds": 0.01})
+    )
+    refresher.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert refresher.get_status()["running"]
+        (tmp_path / "r9").mkdir()
+        for _ in range(100):
+            if refresher.get_version("r9"):
+                break
+            await asyncio.sleep(0.01)
+        assert refresher.get_version("r9") is not None
+    finally:
+        await refresher.stop()
+    assert not refresher.get_status()["running"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_single_git_version(tmp_path, git_config, origin_repo):
+    """버전 하나는 전체 목록을 갱신하지 않고 해당 브랜치만 확인"""
+    refresher = VersionRefresher(git_config)
+    assert (await refresher.lookup("main")).is_root
+    work = tmp_path / "work"
+    _git("clone", "-q", str(origin_repo), str(work))
+    _git("-C", str(work), "push", "-q", "origin", "HEAD:r7")
+    head = _git("-C", str(work), "rev-parse", "HEAD")
+
+    # fetch 전에는 원격 브랜치를 알 수 없음
+    assert await refresher.lookup("r7") is None
+    version = await refresher.lookup("r7", refresh=True)
+    assert version is not None and version.head_sha == head
+    # 버전 디렉토리는 만들지 않고 다른 버전도 조회하지 않음
+    assert not (tmp_path / "efs" / "r7").exists()
+    assert [v.version for v in refresher.get_versions()] == ["main", "r7"]
+    assert await refresher.lookup("r7") is version
+
+    _git("-C", str(work), "push", "-q", "origin", "--delete", "r7")
+    assert await refresher.lookup("r7") is version
+    assert await refresher.lookup("r7", refresh=True) is None
+    assert refresher.get_version("r7") is None
@@ -0,0 +1,68 @@
+"""버전 비교 리포지토리 테스트"""
+
+import pytest
+
+from temply_app.core.config import Config
+from temply_app.core.temply.temply_env import TemplyEnv
+from temply_app.core.temply.version_tree import get_version_tree
+from temply_app.core.utils.cache_util import (
+    get_layout_parser,
+    get_partial_parser,
+    get_template_parser,
+)
+from temply_app.core.utils.file_util import SnapshotMode, snapshot_tree
+from temply_app.models.common_model import User, VersionInfo
+from temply_app.repositories.diff_repository import DiffRepository
+
+
+async def _build_main(env: TemplyEnv, user: User) -> None:
+    await get_layout_parser(env).create(
+        user, "layout_a", "<div>{% block content %}{% endblock %}</div>"
+    )
+    partial_parser = get_partial_parser(env)
+    await partial_parser.create(user, "partial_base", "base")
+    await partial_parser.create(user, "partial_mid", "mid", dependencies={"partial_base"})
+    await partial_parser.create(user, "partial_other", "other")
+    template_parser = get_template_parser(env)
+    await template_parser.create_component(
+        user, "welcome", "HTML_EMAIL", "hi", layout="layout_a", partials=["partial_mid"]
+    )
+    await template_parser.create_component(
+        user, "other", "TEXT_EMAIL", "other", partials=["partial_other"]
+    )
+    await template_parser.create_component(user, "plain", "TEXT_EMAIL", "plain")
+
+
+@pytest.mark.asyncio
+async def test_diff_versions(tmp_path, user):
+    """변경 항목과 파셜 의존성을 따라 영향을 받는 컴포넌트 조회"""
+    config = Config(env="local", noti_temply_dir=str(tmp_path))
+    main = TemplyEnv(config, "main")
+    await _build_main(main, user)
+    snapshot_tree(tmp_path / "main", tmp_path / "r1", SnapshotMode.COPY)
+    r1 = TemplyEnv(config, "r1")
+
+    await get_partial_parser(r1).update(user, "partial_base", "base changed")
+    await get_layout_parser(r1).create(user, "layout_b", "<p></p>")
+    await get_template_parser(r1).update_component(user, "plain", "TEXT_EMAIL", "plain changed")
+    await get_template_parser(r1).create_component(user, "new", "HTML_EMAIL", "new")
+
+    main_info, r1_info = VersionInfo(config, "main"), VersionInfo(config, "r1")
+    diff = await DiffRepository(config, main_info, main, r1_info, r1).diff()
+
+    assert not diff.identical
+    assert diff.layouts.added == ["layout_b"]
+    assert diff.partials.changed == ["partial_base"]
+    assert diff.components.changed == ["plain/TEXT_EMAIL"]
+    assert diff.components.added == ["new/HTML_EMAIL"]
+    assert diff.impacted_partials == ["partial_mid"]
+    assert [(c.template, c.component, c.partials) for c in diff.impacted_components] == [
+        ("welcome", "HTML_EMAIL", ["partial_mid"])
+    ]
+
+    same = await DiffRepository(config, main_info, main, main_info, main).diff()
+    assert same.identical
+    assert not same.components.changed
+
+    # 인덱스 변경 세대가 같으면 인덱스를 다시 해시하지 않고 캐시된 트리 재사용
+    assert get_version_tree(r1, {}, {}, {}).digest == diff.version_digest